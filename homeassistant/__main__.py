@@ -79,6 +79,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Write a Chrome trace of the startup to CONFIG/startup_trace.json",
+    )
     parser.add_argument(
         "--skip-pip",
         action="store_true",
@@ -307,6 +312,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
     )
 
     exit_code = runner.run(runtime_conf)
@@ -2,6 +2,7 @@
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import time
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 import jwt
@@ -19,6 +20,10 @@ from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Validated access tokens are remembered for this many seconds at most
+ACCESS_TOKEN_CACHE_TTL = 30
+ACCESS_TOKEN_CACHE_SIZE = 1024
+
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
@@ -144,6 +149,10 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Validated access tokens with the time until they can be trusted
+        self._access_token_cache: "OrderedDict[str, Tuple[float, models.RefreshToken]]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -277,6 +286,7 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(user=user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -310,6 +320,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(user=user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -434,6 +445,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(refresh_token=refresh_token)
 
     @callback
     def async_create_access_token(
@@ -457,6 +469,14 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+        if cached is not None:
+            valid_until, cached_token = cached
+            if time.time() < valid_until and cached_token.user.is_active:
+                self._access_token_cache.move_to_end(token)
+                return cached_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -474,15 +494,35 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._access_token_cache[token] = (
+            min(time.time() + ACCESS_TOKEN_CACHE_TTL, claims["exp"]),
+            refresh_token,
+        )
+        if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+            self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self,
+        user: Optional[models.User] = None,
+        refresh_token: Optional[models.RefreshToken] = None,
+    ) -> None:
+        """Forget validated access tokens of a user or refresh token."""
+        for token, (_, cached) in list(self._access_token_cache.items()):
+            if cached is refresh_token or cached.user is user:
+                del self._access_token_cache[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
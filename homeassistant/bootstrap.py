@@ -8,23 +8,33 @@ import os
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set
 
 import voluptuous as vol
 import yarl
 
-from homeassistant import config as conf_util, config_entries, core, loader
+from homeassistant import (
+    config as conf_util,
+    config_entries,
+    core,
+    loader,
+    requirements,
+)
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_per_platform
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_get_setup_timeline,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    setup_timeline_to_chrome_trace,
 )
 from homeassistant.util.async_ import gather_with_concurrency
+from homeassistant.util.json import save_json
 from homeassistant.util.logging import async_activate_log_queue_handler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
@@ -35,6 +45,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "startup_trace.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -48,6 +59,9 @@ COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
 
+# Number of slowest imports to list in the import report
+IMPORT_REPORT_SIZE = 10
+
 DEBUGGER_INTEGRATIONS = {"debugpy", "ptvsd"}
 CORE_INTEGRATIONS = ("homeassistant", "persistent_notification")
 LOGGING_INTEGRATIONS = {
@@ -162,6 +176,13 @@ async def async_setup_hass(
             hass,
         )
 
+    if runtime_config.startup_trace:
+        await hass.async_add_executor_job(
+            save_json,
+            hass.config.path(STARTUP_TRACE_FILENAME),
+            setup_timeline_to_chrome_trace(async_get_setup_timeline(hass)),
+        )
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
@@ -422,6 +443,57 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_preimport_integration(
+    hass: core.HomeAssistant, domain: str, platform_name: Optional[str] = None
+) -> None:
+    """Import an integration or platform in the background."""
+    try:
+        integration = await loader.async_get_integration(hass, domain)
+    except loader.IntegrationNotFound:
+        return
+
+    if not integration.disabled:
+        await loader.async_preimport(hass, integration, platform_name)
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant, config: Dict[str, Any], domains: Iterable[str]
+) -> None:
+    """Import the integrations and their configured platforms in the background.
+
+    Integrations are imported in the order they are set up.
+    """
+    start = monotonic()
+    domains = list(domains)
+    platforms = [
+        (p_name, domain)
+        for domain in domains
+        for p_name, _ in config_per_platform(config, domain)
+        if isinstance(p_name, str)
+    ]
+
+    await gather_with_concurrency(
+        loader.MAX_IMPORT_CONCURRENTLY,
+        *(_async_preimport_integration(hass, domain) for domain in domains),
+        *(
+            _async_preimport_integration(hass, p_name, domain)
+            for p_name, domain in platforms
+        ),
+    )
+
+    import_times: Dict[str, float] = hass.data.get(loader.DATA_IMPORT_TIMES, {})
+    slowest = sorted(import_times.items(), key=lambda item: item[1], reverse=True)
+    _LOGGER.info(
+        "Imported %s integrations and platforms in the background in %.2fs, slowest: %s",
+        len(import_times),
+        monotonic() - start,
+        ", ".join(
+            f"{name} ({import_time:.2f}s)"
+            for name, import_time in slowest[:IMPORT_REPORT_SIZE]
+        ),
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: Dict[str, Any]
 ) -> None:
@@ -484,6 +556,30 @@ async def _async_set_up_integrations(
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
         await async_setup_multi_components(hass, debuggers, config, setup_started)
 
+    # Install the missing requirements of all integrations at once instead of
+    # one at a time when each integration is set up
+    platform_integrations = await gather_with_concurrency(
+        loader.MAX_LOAD_CONCURRENTLY,
+        *(
+            loader.async_get_integration(hass, p_name)
+            for domain in domains_to_setup
+            for p_name, _ in config_per_platform(config, domain)
+            if isinstance(p_name, str) and p_name not in integration_cache
+        ),
+        return_exceptions=True,
+    )
+    await requirements.async_process_requirements_batch(
+        hass,
+        [
+            *integration_cache.values(),
+            *(
+                itg
+                for itg in platform_integrations
+                if isinstance(itg, loader.Integration)
+            ),
+        ],
+    )
+
     # calculate what components to setup in what stage
     stage_1_domains = set()
 
@@ -509,6 +605,14 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
+    # Import everything to set up in the executor so setup does not have to
+    # import on the event loop.
+    hass.async_create_task(
+        _async_preimport_integrations(
+            hass, config, [*stage_1_domains, *sorted(stage_2_domains)]
+        )
+    )
+
     # Kick off loading the registries. They don't need to be awaited.
     asyncio.create_task(hass.helpers.device_registry.async_get_registry())
     asyncio.create_task(hass.helpers.entity_registry.async_get_registry())
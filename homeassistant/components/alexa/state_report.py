@@ -1,20 +1,179 @@
 """Alexa state report code."""
 import asyncio
+from collections import OrderedDict
 import json
 import logging
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
 import async_timeout
+import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.core import callback
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
-from .entities import ENTITY_ADAPTERS, generate_alexa_id
+from .entities import ENTITY_ADAPTERS, AlexaEntity, generate_alexa_id
 from .messages import AlexaResponse
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+DATA_CHANGE_REPORT_QUEUES = "alexa_change_report_queues"
+
+# Maximum number of ChangeReports in flight at the same time
+MAX_CONCURRENT_REPORTS = 4
+# Sustained ChangeReports per second and the burst allowed on top of it
+REPORT_RATE = 5
+REPORT_BURST = 20
+
+
+class TokenBucket:
+    """Rate limit using a token bucket."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the token bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+
+    async def async_acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ChangeReportQueue:
+    """Deliver ChangeReports with one queue slot per Alexa endpoint.
+
+    Changes of an endpoint that is still waiting to be reported are merged, so
+    only its latest state is sent.
+    """
+
+    def __init__(
+        self,
+        hass,
+        config,
+        max_concurrent: int = MAX_CONCURRENT_REPORTS,
+        rate: float = REPORT_RATE,
+        burst: int = REPORT_BURST,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.config = config
+        self.sent = 0
+        self.merged = 0
+        self.failed = 0
+        self.last_latency: Optional[float] = None
+        self.max_latency = 0.0
+        self._queue: "OrderedDict[str, Tuple[AlexaEntity, float]]" = OrderedDict()
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._bucket = TokenBucket(rate, burst)
+        self._drain_task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        """Return the number of endpoints waiting to be reported."""
+        return len(self._queue)
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Return the delivery statistics."""
+        return {
+            "depth": self.depth,
+            "sent": self.sent,
+            "merged": self.merged,
+            "failed": self.failed,
+            "last_latency": self.last_latency,
+            "max_latency": self.max_latency,
+        }
+
+    @callback
+    def async_enqueue(self, alexa_entity: AlexaEntity) -> None:
+        """Queue a ChangeReport for an Alexa entity."""
+        endpoint = alexa_entity.alexa_id()
+        queued = self._queue.get(endpoint)
+
+        if queued is None:
+            self._queue[endpoint] = (alexa_entity, monotonic())
+        else:
+            # Keep the position and age of the first unreported change
+            self._queue[endpoint] = (alexa_entity, queued[1])
+            self.merged += 1
+
+        if self._drain_task is None:
+            self._drain_task = self.hass.async_create_task(self._async_drain())
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all queued ChangeReports."""
+        self._queue.clear()
+
+    async def _async_drain(self) -> None:
+        """Send queued ChangeReports until the queue is empty."""
+        tasks = []
+        try:
+            while self._queue:
+                await self._bucket.async_acquire()
+                await self._semaphore.acquire()
+
+                if not self._queue:
+                    self._semaphore.release()
+                    break
+
+                _, (alexa_entity, queued) = self._queue.popitem(last=False)
+                tasks.append(
+                    self.hass.async_create_task(self._async_send(alexa_entity, queued))
+                )
+        finally:
+            self._drain_task = None
+
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def _async_send(self, alexa_entity: AlexaEntity, queued: float) -> None:
+        """Send a ChangeReport and record its latency."""
+        try:
+            await async_send_changereport_message(self.hass, self.config, alexa_entity)
+        except Exception as err:  # pylint: disable=broad-except
+            # Connection errors are handled while sending, this is most likely
+            # an access token that is no longer available. Every other queued
+            # report would fail the same way.
+            self.failed += 1
+            _LOGGER.error(
+                "Unable to send ChangeReport for %s, dropping %d queued reports: %s",
+                alexa_entity.entity_id,
+                self.depth,
+                err,
+            )
+            self.async_clear()
+            return
+        finally:
+            self._semaphore.release()
+
+        latency = monotonic() - queued
+        self.sent += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        _LOGGER.debug(
+            "Reported %s after %.3fs, %d waiting",
+            alexa_entity.entity_id,
+            latency,
+            self.depth,
+        )
 
 
 async def async_enable_proactive_mode(hass, smart_home_config):
@@ -25,6 +184,12 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
+    queue = smart_home_config.change_report_queue = ChangeReportQueue(
+        hass, smart_home_config
+    )
+    hass.data.setdefault(DATA_CHANGE_REPORT_QUEUES, []).append(queue)
+    websocket_api.async_register_command(hass, websocket_change_report_statistics)
+
     async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
@@ -45,9 +210,7 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
         for interface in alexa_changed_entity.interfaces():
             if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
+                queue.async_enqueue(alexa_changed_entity)
                 return
             if (
                 interface.name() == "Alexa.DoorbellEventSource"
@@ -58,10 +221,36 @@ async def async_enable_proactive_mode(hass, smart_home_config):
                 )
                 return
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_state = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def unsub():
+        """Stop reporting states."""
+        unsub_state()
+        queue.async_clear()
+        hass.data[DATA_CHANGE_REPORT_QUEUES].remove(queue)
+        smart_home_config.change_report_queue = None
+
+    return unsub
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "alexa/change_report_statistics"}
+)
+@websocket_api.require_admin
+@callback
+def websocket_change_report_statistics(hass, connection, msg):
+    """Return the ChangeReport delivery statistics of every reporting config."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"endpoint": queue.config.endpoint, **queue.statistics}
+            for queue in hass.data.get(DATA_CHANGE_REPORT_QUEUES, [])
+        ],
+    )
+
 
 async def async_send_changereport_message(
     hass, config, alexa_entity, *, invalidate_access_token=True
@@ -36,6 +36,12 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    REFERENCE_AREA,
+    REFERENCE_DEVICE,
+    REFERENCE_ENTITY,
+    async_get_reference_index,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -103,13 +109,9 @@ def automations_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referencing(
+        REFERENCE_ENTITY, entity_id
+    )
 
 
 @callback
@@ -134,13 +136,9 @@ def automations_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referencing(
+        REFERENCE_DEVICE, device_id
+    )
 
 
 @callback
@@ -159,6 +157,33 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
     return list(automation_entity.referenced_devices)
 
 
+@callback
+def automations_with_area(hass: HomeAssistant, area_id: str) -> List[str]:
+    """Return all automations that reference the area."""
+    if DOMAIN not in hass.data:
+        return []
+
+    return async_get_reference_index(hass, DOMAIN).async_referencing(
+        REFERENCE_AREA, area_id
+    )
+
+
+@callback
+def areas_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
+    """Return all areas in an automation."""
+    if DOMAIN not in hass.data:
+        return []
+
+    component = hass.data[DOMAIN]
+
+    automation_entity = component.get_entity(entity_id)
+
+    if automation_entity is None:
+        return []
+
+    return list(automation_entity.referenced_areas)
+
+
 async def async_setup(hass, config):
     """Set up the automation."""
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
@@ -269,13 +294,18 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Return True if entity is on."""
         return self._async_detach_triggers is not None or self._is_enabled
 
+    @property
+    def referenced_areas(self):
+        """Return a set of referenced areas."""
+        return self.action_script.referenced_areas
+
     @property
     def referenced_devices(self):
         """Return a set of referenced devices."""
         if self._referenced_devices is not None:
             return self._referenced_devices
 
-        referenced = self.action_script.referenced_devices
+        referenced = set(self.action_script.referenced_devices)
 
         if self._cond_func is not None:
             for conf in self._cond_func.config:
@@ -295,7 +325,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         if self._referenced_entities is not None:
             return self._referenced_entities
 
-        referenced = self.action_script.referenced_entities
+        referenced = set(self.action_script.referenced_entities)
 
         if self._cond_func is not None:
             for conf in self._cond_func.config:
@@ -317,6 +347,14 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         )
         self.action_script.update_logger(self._logger)
 
+        assert self.hass is not None
+        async_get_reference_index(self.hass, DOMAIN).async_add(
+            self.entity_id,
+            self.referenced_entities,
+            self.referenced_devices,
+            self.referenced_areas,
+        )
+
         state = await self.async_get_last_state()
         if state:
             enable_automation = state.state == STATE_ON
@@ -410,6 +448,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        async_get_reference_index(self.hass, DOMAIN).async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
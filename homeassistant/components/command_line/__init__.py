@@ -1,7 +1,15 @@
 """The command_line component."""
 
+import asyncio
 import logging
+import os
+import signal
 import subprocess
+import time
+
+from .const import MAX_CONCURRENT_COMMANDS
+
+DATA_COMMAND_SEMAPHORE = "command_line_semaphore"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,3 +53,54 @@ def check_output_or_log(command, timeout):
         _LOGGER.error("Error trying to exec command: %s", command)
 
     return None
+
+
+async def async_run_command(hass, command, timeout):
+    """Run a shell command with a timeout and return its output and runtime.
+
+    The command runs as an asyncio subprocess instead of blocking an executor
+    thread, with at most MAX_CONCURRENT_COMMANDS commands running at once. The
+    output is None if the command failed, the runtime in seconds does not
+    include waiting for another command to finish.
+    """
+    semaphore = hass.data.get(DATA_COMMAND_SEMAPHORE)
+    if semaphore is None:
+        semaphore = hass.data[DATA_COMMAND_SEMAPHORE] = asyncio.Semaphore(
+            MAX_CONCURRENT_COMMANDS
+        )
+
+    async with semaphore:
+        start = time.monotonic()
+        output = await _async_check_output_or_log(command, timeout)
+        return output, time.monotonic() - start
+
+
+async def _async_check_output_or_log(command, timeout):
+    """Run a shell command with a timeout and return the output."""
+    try:
+        process = await asyncio.create_subprocess_shell(  # nosec # shell by design
+            command, stdout=asyncio.subprocess.PIPE, start_new_session=True
+        )
+    except OSError:
+        _LOGGER.error("Error trying to exec command: %s", command)
+        return None
+
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        _LOGGER.error("Timeout for command: %s", command)
+        # Kill the processes started by the shell too, they would keep
+        # the output pipe open
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            # The process group exited in the meantime
+            pass
+        await process.wait()
+        return None
+
+    if process.returncode:
+        _LOGGER.error("Command failed: %s", command)
+        return None
+
+    return stdout.strip().decode("utf-8")
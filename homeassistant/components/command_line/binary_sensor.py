@@ -17,10 +17,10 @@ from homeassistant.const import (
     CONF_VALUE_TEMPLATE,
 )
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.reload import setup_reload_service
+from homeassistant.helpers.reload import async_setup_reload_service
 
 from .const import CONF_COMMAND_TIMEOUT, DEFAULT_TIMEOUT, DOMAIN, PLATFORMS
-from .sensor import CommandSensorData
+from .sensor import async_get_command_data
 
 DEFAULT_NAME = "Binary Command Sensor"
 DEFAULT_PAYLOAD_ON = "ON"
@@ -42,10 +42,10 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Command line Binary Sensor."""
 
-    setup_reload_service(hass, DOMAIN, PLATFORMS)
+    await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
 
     name = config.get(CONF_NAME)
     command = config.get(CONF_COMMAND)
@@ -56,9 +56,9 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     command_timeout = config.get(CONF_COMMAND_TIMEOUT)
     if value_template is not None:
         value_template.hass = hass
-    data = CommandSensorData(hass, command, command_timeout)
+    data = async_get_command_data(hass, command, command_timeout)
 
-    add_entities(
+    async_add_entities(
         [
             CommandBinarySensor(
                 hass, data, name, device_class, payload_on, payload_off, value_template
@@ -99,13 +99,17 @@ class CommandBinarySensor(BinarySensorEntity):
         """Return the class of the binary sensor."""
         return self._device_class
 
-    def update(self):
+    async def async_update(self):
         """Get the latest data and updates the state."""
-        self.data.update()
+        await self.data.async_update(
+            self.platform.scan_interval.total_seconds() / 2, self
+        )
         value = self.data.value
 
         if self._value_template is not None:
-            value = self._value_template.render_with_possible_json_value(value, False)
+            value = self._value_template.async_render_with_possible_json_value(
+                value, False
+            )
         if value == self._payload_on:
             self._state = True
         elif value == self._payload_off:
@@ -4,3 +4,5 @@ CONF_COMMAND_TIMEOUT = "command_timeout"
 DEFAULT_TIMEOUT = 15
 DOMAIN = "command_line"
 PLATFORMS = ["binary_sensor", "cover", "sensor", "switch"]
+# Shell commands of sensors running at the same time
+MAX_CONCURRENT_COMMANDS = 8
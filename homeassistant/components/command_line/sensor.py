@@ -1,11 +1,15 @@
 """Allows to configure custom shell commands to turn a value for a sensor."""
+import asyncio
 from collections.abc import Mapping
 from datetime import timedelta
 import json
 import logging
+import time
+from weakref import WeakValueDictionary
 
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     CONF_COMMAND,
@@ -14,19 +18,22 @@ from homeassistant.const import (
     CONF_VALUE_TEMPLATE,
     STATE_UNKNOWN,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.reload import setup_reload_service
+from homeassistant.helpers.reload import async_setup_reload_service
 
-from . import check_output_or_log
+from . import async_run_command
 from .const import CONF_COMMAND_TIMEOUT, DEFAULT_TIMEOUT, DOMAIN, PLATFORMS
 
 _LOGGER = logging.getLogger(__name__)
 
 CONF_JSON_ATTRIBUTES = "json_attributes"
 
+DATA_COMMAND_SENSOR_DATA = "command_line_sensor_data"
+
 DEFAULT_NAME = "Command Sensor"
 
 SCAN_INTERVAL = timedelta(seconds=60)
@@ -43,10 +50,10 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Command Sensor."""
 
-    setup_reload_service(hass, DOMAIN, PLATFORMS)
+    await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
 
     name = config.get(CONF_NAME)
     command = config.get(CONF_COMMAND)
@@ -56,13 +63,47 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     if value_template is not None:
         value_template.hass = hass
     json_attributes = config.get(CONF_JSON_ATTRIBUTES)
-    data = CommandSensorData(hass, command, command_timeout)
+    data = async_get_command_data(hass, command, command_timeout)
 
-    add_entities(
+    async_add_entities(
         [CommandSensor(hass, data, name, unit, value_template, json_attributes)], True
     )
 
 
+@callback
+def async_get_command_data(hass, command, command_timeout):
+    """Return the data of a command, shared by the sensors running it.
+
+    Sensors configured with the same command share one data object, so the
+    command runs once per scan interval however many sensors parse its output.
+    """
+    shared = hass.data.get(DATA_COMMAND_SENSOR_DATA)
+    if shared is None:
+        shared = hass.data[DATA_COMMAND_SENSOR_DATA] = WeakValueDictionary()
+        websocket_api.async_register_command(hass, websocket_command_statistics)
+
+    data = shared.get((command, command_timeout))
+    if data is None:
+        data = shared[(command, command_timeout)] = CommandSensorData(
+            hass, command, command_timeout
+        )
+    return data
+
+
+@websocket_api.websocket_command({vol.Required("type"): "command_line/statistics"})
+@websocket_api.require_admin
+@callback
+def websocket_command_statistics(hass, connection, msg):
+    """Return the runtime statistics of the commands of the sensors."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"command": data.command, **data.statistics}
+            for data in hass.data.get(DATA_COMMAND_SENSOR_DATA, {}).values()
+        ],
+    )
+
+
 class CommandSensor(Entity):
     """Representation of a sensor that is using shell commands."""
 
@@ -99,9 +140,11 @@ class CommandSensor(Entity):
         """Return the state attributes."""
         return self._attributes
 
-    def update(self):
+    async def async_update(self):
         """Get the latest data and updates the state."""
-        self.data.update()
+        await self.data.async_update(
+            self.platform.scan_interval.total_seconds() / 2, self
+        )
         value = self.data.value
 
         if self._json_attributes:
@@ -125,7 +168,7 @@ class CommandSensor(Entity):
         if value is None:
             value = STATE_UNKNOWN
         elif self._value_template is not None:
-            self._state = self._value_template.render_with_possible_json_value(
+            self._state = self._value_template.async_render_with_possible_json_value(
                 value, STATE_UNKNOWN
             )
         else:
@@ -141,40 +184,83 @@ class CommandSensorData:
         self.hass = hass
         self.command = command
         self.timeout = command_timeout
+        self.runs = 0
+        self.failures = 0
+        self.shared = 0
+        self.last_runtime = None
+        self.max_runtime = 0.0
+        self.total_runtime = 0.0
+        self._lock = asyncio.Lock()
+        self._last_update = None
+        self._last_requester = None
 
-    def update(self):
-        """Get the latest data with a shell command."""
-        command = self.command
-        cache = {}
-
-        if command in cache:
-            prog, args, args_compiled = cache[command]
-        elif " " not in command:
-            prog = command
-            args = None
-            args_compiled = None
-            cache[command] = (prog, args, args_compiled)
+        if " " not in command:
+            self._prog = command
+            self._args = None
+            self._args_compiled = None
         else:
-            prog, args = command.split(" ", 1)
-            args_compiled = template.Template(args, self.hass)
-            cache[command] = (prog, args, args_compiled)
+            self._prog, self._args = command.split(" ", 1)
+            self._args_compiled = template.Template(self._args, hass)
 
-        if args_compiled:
+    @property
+    def statistics(self):
+        """Return the runtime statistics of the command."""
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "shared": self.shared,
+            "last_runtime": self.last_runtime,
+            "max_runtime": self.max_runtime,
+            "total_runtime": self.total_runtime,
+        }
+
+    async def async_update(self, max_age=0, requester=None):
+        """Get the latest data with a shell command.
+
+        An update requested by a sensor is skipped if another sensor sharing
+        the data updated it less than max_age seconds ago.
+        """
+        async with self._lock:
+            if (
+                max_age
+                and self._last_update is not None
+                and self._last_requester is not requester
+                and time.monotonic() - self._last_update < max_age
+            ):
+                self.shared += 1
+                return
+
+            await self._async_run()
+            self._last_update = time.monotonic()
+            self._last_requester = requester
+
+    async def _async_run(self):
+        """Run the command and record its runtime."""
+        command = self.command
+
+        if self._args_compiled:
             try:
-                args_to_render = {"arguments": args}
-                rendered_args = args_compiled.render(args_to_render)
+                args_to_render = {"arguments": self._args}
+                rendered_args = self._args_compiled.async_render(args_to_render)
             except TemplateError as ex:
                 _LOGGER.exception("Error rendering command template: %s", ex)
                 return
         else:
             rendered_args = None
 
-        if rendered_args == args:
+        if rendered_args == self._args:
             # No template used. default behavior
             pass
         else:
             # Template used. Construct the string used in the shell
-            command = f"{prog} {rendered_args}"
+            command = f"{self._prog} {rendered_args}"
 
         _LOGGER.debug("Running command: %s", command)
-        self.value = check_output_or_log(command, self.timeout)
+        self.value, runtime = await async_run_command(self.hass, command, self.timeout)
+
+        self.runs += 1
+        if self.value is None:
+            self.failures += 1
+        self.last_runtime = runtime
+        self.max_runtime = max(self.max_runtime, runtime)
+        self.total_runtime += runtime
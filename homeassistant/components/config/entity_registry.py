@@ -76,6 +76,12 @@ async def websocket_get_entity(hass, connection, msg):
         vol.Optional("new_entity_id"): str,
         # We only allow setting disabled_by user via API.
         vol.Optional("disabled_by"): vol.Any("user", None),
+        vol.Optional("min_write_interval"): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),
+        vol.Optional("significant_change"): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),
     }
 )
 async def websocket_update_entity(hass, connection, msg):
@@ -93,7 +99,14 @@ async def websocket_update_entity(hass, connection, msg):
 
     changes = {}
 
-    for key in ("name", "icon", "area_id", "disabled_by"):
+    for key in (
+        "name",
+        "icon",
+        "area_id",
+        "disabled_by",
+        "min_write_interval",
+        "significant_change",
+    ):
         if key in msg:
             changes[key] = msg[key]
 
@@ -186,4 +199,6 @@ def _entry_ext_dict(entry):
     data["original_icon"] = entry.original_icon
     data["unique_id"] = entry.unique_id
     data["capabilities"] = entry.capabilities
+    data["min_write_interval"] = entry.min_write_interval
+    data["significant_change"] = entry.significant_change
     return data
@@ -1,9 +1,13 @@
 """Legacy device tracker classes."""
 import asyncio
-from datetime import timedelta
+from datetime import datetime, timedelta
 import hashlib
+import heapq
+import os
+import stat
+import tempfile
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import attr
 import voluptuous as vol
@@ -113,6 +117,8 @@ SERVICE_SEE_PAYLOAD_SCHEMA = vol.Schema(
 )
 
 YAML_DEVICES = "known_devices.yaml"
+# Seconds new devices are buffered before they are written to YAML_DEVICES
+CONFIG_WRITE_DELAY = 1
 EVENT_NEW_DEVICE = "device_tracker_new_device"
 
 
@@ -405,6 +411,11 @@ class DeviceTracker:
         )
         self.defaults = defaults
         self._is_updating = asyncio.Lock()
+        # New devices waiting to be written to the YAML configuration file
+        self._pending_config: Dict[str, Device] = {}
+        # Heap of (expiry, dev_id) of home devices that may become stale
+        self._stale_queue: List[Tuple[datetime, str]] = []
+        self._stale_scheduled: Set[str] = set()
 
         for dev in devices:
             if self.devices[dev.dev_id] is not dev:
@@ -487,6 +498,7 @@ class DeviceTracker:
                 source_type,
                 consider_home,
             )
+            self._async_schedule_stale(device)
             if device.track:
                 device.async_write_ha_state()
             return
@@ -523,6 +535,7 @@ class DeviceTracker:
             attributes,
             source_type,
         )
+        self._async_schedule_stale(device)
 
         if device.track:
             device.async_write_ha_state()
@@ -546,22 +559,56 @@ class DeviceTracker:
     async def async_update_config(self, path, dev_id, device):
         """Add device to YAML configuration file.
 
+        Devices added within CONFIG_WRITE_DELAY are written in a single write.
+
         This method is a coroutine.
         """
+        self._pending_config[dev_id] = device
+        if len(self._pending_config) > 1:
+            return
+
+        await asyncio.sleep(CONFIG_WRITE_DELAY)
+
         async with self._is_updating:
+            devices = list(self._pending_config.values())
+            self._pending_config.clear()
             await self.hass.async_add_executor_job(
-                update_config, self.hass.config.path(YAML_DEVICES), dev_id, device
+                update_config_devices, self.hass.config.path(YAML_DEVICES), devices
             )
 
+    @callback
+    def _async_schedule_stale(self, device: "Device") -> None:
+        """Queue a home device to be checked when it may become stale."""
+        if (
+            not device.track
+            or not device.last_update_home
+            or device.dev_id in self._stale_scheduled
+        ):
+            return
+        self._stale_scheduled.add(device.dev_id)
+        heapq.heappush(
+            self._stale_queue, (device.last_seen + device.consider_home, device.dev_id)
+        )
+
     @callback
     def async_update_stale(self, now: dt_util.dt.datetime):
         """Update stale devices.
 
+        Only devices whose expiry has passed are checked. Devices seen again
+        since they were queued are queued again with their new expiry.
+
         This method must be run in the event loop.
         """
-        for device in self.devices.values():
-            if (device.track and device.last_update_home) and device.stale(now):
+        while self._stale_queue and self._stale_queue[0][0] < now:
+            _, dev_id = heapq.heappop(self._stale_queue)
+            self._stale_scheduled.discard(dev_id)
+            device = self.devices.get(dev_id)
+            if device is None or not (device.track and device.last_update_home):
+                continue
+            if device.stale(now):
                 self.hass.async_create_task(device.async_update_ha_state(True))
+            else:
+                self._async_schedule_stale(device)
 
     async def async_setup_tracked_device(self):
         """Set up all not exists tracked devices.
@@ -573,6 +620,7 @@ class DeviceTracker:
             """Init a single device_tracker entity."""
             await dev.async_added_to_hass()
             dev.async_write_ha_state()
+            self._async_schedule_stale(dev)
 
         tasks = []
         for device in self.devices.values():
@@ -858,18 +906,45 @@ async def async_load_config(
 
 def update_config(path: str, dev_id: str, device: Device):
     """Add device to YAML configuration file."""
-    with open(path, "a") as out:
-        device = {
-            device.dev_id: {
-                ATTR_NAME: device.name,
-                ATTR_MAC: device.mac,
-                ATTR_ICON: device.icon,
-                "picture": device.config_picture,
-                "track": device.track,
+    update_config_devices(path, [device])
+
+
+def update_config_devices(path: str, devices: List[Device]) -> None:
+    """Add devices to YAML configuration file in a single atomic write."""
+    try:
+        with open(path) as fdesc:
+            content = fdesc.read()
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        content = ""
+        mode = 0o644
+
+    for device in devices:
+        content += "\n"
+        content += dump(
+            {
+                device.dev_id: {
+                    ATTR_NAME: device.name,
+                    ATTR_MAC: device.mac,
+                    ATTR_ICON: device.icon,
+                    "picture": device.config_picture,
+                    "track": device.track,
+                }
             }
-        }
-        out.write("\n")
-        out.write(dump(device))
+        )
+
+    tmp_filename = ""
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=os.path.dirname(path), delete=False
+        ) as fdesc:
+            fdesc.write(content)
+            tmp_filename = fdesc.name
+        os.chmod(tmp_filename, mode)
+        os.replace(tmp_filename, path)
+    finally:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
 
 
 def get_gravatar_for_email(email: str):
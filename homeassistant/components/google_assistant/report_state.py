@@ -1,8 +1,9 @@
 """Google Report State implementation."""
 import logging
+from typing import Any, Dict, Optional
 
 from homeassistant.const import MATCH_ALL
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .error import SmartHomeError
@@ -12,6 +13,9 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes before they are reported in a single request
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,49 +23,84 @@ _LOGGER = logging.getLogger(__name__)
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
-
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
-        if not hass.is_running:
+    # Last serialization reported to Google per entity
+    checker: Dict[str, Dict[str, Any]] = {}
+    # Serializations waiting to be reported per entity
+    pending: Dict[str, Dict[str, Any]] = {}
+    unsub_pending: Optional[CALLBACK_TYPE] = None
+
+    async def report_states(_now=None):
+        """Report the pending states in a single request."""
+        nonlocal unsub_pending, pending
+        unsub_pending = None
+
+        if not pending:
             return
 
-        if not new_state:
+        states, pending = pending, {}
+        checker.update(states)
+        _LOGGER.debug("Reporting states for %s", list(states))
+
+        await google_config.async_report_state_all({"devices": {"states": states}})
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
+
+        if not hass.is_running:
             return
 
-        if not google_config.should_expose(new_state):
+        if not new_state or not google_config.should_expose(new_state):
+            checker.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
         entity = GoogleEntity(hass, google_config, new_state)
 
         if not entity.is_supported():
+            checker.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
         try:
             entity_data = entity.query_serialize()
         except SmartHomeError as err:
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
+            checker.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
-
-            # Only report to Google if data that Google cares about has changed
+        if changed_entity in checker:
+            old_entity_data = checker[changed_entity]
+        elif old_state:
+            # Never reported before, compare against the previous state
             try:
-                if entity_data == old_entity.query_serialize():
-                    return
+                old_entity_data = GoogleEntity(
+                    hass, google_config, old_state
+                ).query_serialize()
             except SmartHomeError:
                 # Happens if old state could not be serialized.
                 # In that case the data is different and should be
                 # reported.
-                pass
+                old_entity_data = None
+        else:
+            old_entity_data = None
+
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == old_entity_data:
+            pending.pop(changed_entity, None)
+            return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        _LOGGER.debug("Queueing state for %s: %s", changed_entity, entity_data)
+        pending[changed_entity] = entity_data
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if unsub_pending is None:
+            unsub_pending = async_call_later(hass, REPORT_STATE_WINDOW, report_states)
 
     async def inital_report(_now):
         """Report initially all states."""
+        nonlocal unsub_initial
+        unsub_initial = None
         entities = {}
 
         for entity in async_get_entities(hass, google_config):
@@ -76,10 +115,25 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
+        checker.update(entities)
         await google_config.async_report_state_all({"devices": {"states": entities}})
 
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+    unsub_initial: Optional[CALLBACK_TYPE] = async_call_later(
+        hass, INITIAL_REPORT_DELAY, inital_report
+    )
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_state = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub():
+        """Stop reporting states."""
+        unsub_state()
+        if unsub_initial is not None:
+            unsub_initial()
+        if unsub_pending is not None:
+            unsub_pending()
+        pending.clear()
+
+    return unsub
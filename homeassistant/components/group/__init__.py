@@ -3,7 +3,7 @@ from abc import abstractmethod
 import asyncio
 from contextvars import ContextVar
 import logging
-from typing import Any, Dict, Iterable, List, Optional, Set, cast
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, cast
 
 import voluptuous as vol
 
@@ -38,6 +38,8 @@ from homeassistant.loader import bind_hass
 
 DOMAIN = "group"
 GROUP_ORDER = "group_order"
+GROUP_EXPANSIONS = "group_expansions"
+GROUP_MEMBERSHIP = "group_membership"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
@@ -133,40 +135,89 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
 
     Async friendly.
     """
-    found_ids: List[str] = []
+    # Dicts are used as ordered sets
+    found_ids: Dict[str, None] = {}
+    for entity_id in _valid_entity_ids(entity_ids):
+        if ha.split_entity_id(entity_id)[0] == DOMAIN:
+            # If entity_id points at a group, expand it
+            expansion = _async_expand_group(hass, entity_id, set())
+            found_ids.update(dict.fromkeys(expansion.entity_ids))
+        else:
+            found_ids[entity_id] = None
+
+    return list(found_ids)
+
+
+def _valid_entity_ids(entity_ids: Iterable[Any]) -> Iterable[str]:
+    """Return the lower cased entity ids, skipping the invalid ones."""
     for entity_id in entity_ids:
-        if not isinstance(entity_id, str) or entity_id in (
+        if isinstance(entity_id, str) and entity_id not in (
             ENTITY_MATCH_NONE,
             ENTITY_MATCH_ALL,
         ):
-            continue
+            yield entity_id.lower()
 
-        entity_id = entity_id.lower()
 
-        try:
-            # If entity_id points at a group, expand it
-            domain, _ = ha.split_entity_id(entity_id)
+class _GroupExpansion(NamedTuple):
+    """Members of a group, with the members of nested groups expanded."""
 
-            if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
+    entity_ids: Tuple[str, ...]
+    # Members attribute of the state of every group expanded, the expansion
+    # is valid as long as none of them changed
+    members: Dict[str, Any]
+    # Groups skipped because they were already being expanded
+    cycles: Set[str]
 
-            else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
 
-        except AttributeError:
-            # Raised by split_entity_id if entity_id is not a string
-            pass
+def _group_members(hass: HomeAssistantType, entity_id: str) -> Any:
+    """Return the members attribute of the state of a group."""
+    state = hass.states.get(entity_id)
+    if state is None:
+        return None
+    return state.attributes.get(ATTR_ENTITY_ID)
+
+
+def _async_expand_group(
+    hass: HomeAssistantType, entity_id: str, expanding: Set[str]
+) -> _GroupExpansion:
+    """Return the expanded members of a group, cached until membership changes.
+
+    Groups write the same members tuple to their state as long as their
+    membership does not change, so an expansion is checked for changes by
+    identity instead of comparing all the members again.
+    """
+    expansions: Dict[str, _GroupExpansion] = hass.data.setdefault(GROUP_EXPANSIONS, {})
+    expansion = expansions.get(entity_id)
+    if expansion is not None and all(
+        _group_members(hass, group_id) is members
+        for group_id, members in expansion.members.items()
+    ):
+        return expansion
+
+    members = _group_members(hass, entity_id)
+    found_ids: Dict[str, None] = {}
+    all_members = {entity_id: members}
+    cycles = set()
+
+    expanding.add(entity_id)
+    for member_id in _valid_entity_ids(members or ()):
+        if ha.split_entity_id(member_id)[0] != DOMAIN:
+            found_ids[member_id] = None
+        elif member_id in expanding:
+            cycles.add(member_id)
+        else:
+            nested = _async_expand_group(hass, member_id, expanding)
+            found_ids.update(dict.fromkeys(nested.entity_ids))
+            all_members.update(nested.members)
+            cycles.update(nested.cycles)
+    expanding.discard(entity_id)
 
-    return found_ids
+    expansion = _GroupExpansion(tuple(found_ids), all_members, cycles)
+    # An expansion that skipped a group containing this one is incomplete
+    # when this group is expanded on its own
+    if cycles.issubset(all_members):
+        expansions[entity_id] = expansion
+    return expansion
 
 
 @bind_hass
@@ -197,16 +248,7 @@ def groups_with_entity(hass: HomeAssistantType, entity_id: str) -> List[str]:
 
     Async friendly.
     """
-    if DOMAIN not in hass.data:
-        return []
-
-    groups = []
-
-    for group in hass.data[DOMAIN].entities:
-        if entity_id in group.tracking:
-            groups.append(group.entity_id)
-
-    return groups
+    return list(hass.data.get(GROUP_MEMBERSHIP, {}).get(entity_id, ()))
 
 
 async def async_setup(hass, config):
@@ -442,8 +484,11 @@ class Group(Entity):
         self._icon = icon
         self._set_tracked(entity_ids)
         self._on_off = None
+        self._on_count = 0
         self._assumed = None
+        self._assumed_count = 0
         self._on_states = None
+        self._registered_members = None
         self.user_defined = user_defined
         self.mode = any
         if mode:
@@ -575,6 +620,9 @@ class Group(Entity):
         """
         self._async_stop()
         self._set_tracked(entity_ids)
+        if self._registered_members is not None:
+            self._async_unregister_members()
+            self._async_register_members()
         self._reset_tracked_state()
         self._async_start()
 
@@ -602,6 +650,29 @@ class Group(Entity):
         self.trackable = tuple(trackable)
         self.tracking = tuple(tracking)
 
+    @callback
+    def _async_register_members(self):
+        """Add the group to the groups of its members."""
+        membership = self.hass.data.setdefault(GROUP_MEMBERSHIP, {})
+        for entity_id in self.tracking:
+            membership.setdefault(entity_id, {})[self.entity_id] = None
+        self._registered_members = self.tracking
+
+    @callback
+    def _async_unregister_members(self):
+        """Remove the group from the groups of its members."""
+        if self._registered_members is None:
+            return
+        membership = self.hass.data[GROUP_MEMBERSHIP]
+        for entity_id in self._registered_members:
+            groups = membership.get(entity_id)
+            if groups is None:
+                continue
+            groups.pop(self.entity_id, None)
+            if not groups:
+                del membership[entity_id]
+        self._registered_members = None
+
     @callback
     def _async_start(self, *_):
         """Start tracking members and write state."""
@@ -639,6 +710,8 @@ class Group(Entity):
 
     async def async_added_to_hass(self):
         """Handle addition to Home Assistant."""
+        self._async_register_members()
+
         if self.hass.state != CoreState.running:
             self.hass.bus.async_listen_once(
                 EVENT_HOMEASSISTANT_START, self._async_start
@@ -652,6 +725,7 @@ class Group(Entity):
     async def async_will_remove_from_hass(self):
         """Handle removal from Home Assistant."""
         self._async_stop()
+        self._async_unregister_members()
 
     async def _async_state_changed_listener(self, event):
         """Respond to a member state changing.
@@ -675,7 +749,9 @@ class Group(Entity):
     def _reset_tracked_state(self):
         """Reset tracked state."""
         self._on_off = {}
+        self._on_count = 0
         self._assumed = {}
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -690,7 +766,12 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
+        # Keep counting the members that are on, instead of checking all the
+        # members every time one of them changes
+        self._on_count -= self._on_off.get(entity_id, False)
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -704,6 +785,13 @@ class Group(Entity):
             if domain in self.hass.data[REG_KEY].on_states_by_domain:
                 self._on_states.update(entity_on_state)
             self._on_off[entity_id] = state in entity_on_state
+        self._on_count += self._on_off[entity_id]
+
+    def _mode_result(self, count):
+        """Return the mode of the group applied to a count of members."""
+        if self.mode is all:
+            return count == len(self._on_off)
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -726,7 +814,7 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_result(self._assumed_count)
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -746,7 +834,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_result(self._on_count)
         if group_is_on:
             self._state = on_state
         else:
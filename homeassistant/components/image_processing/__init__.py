@@ -2,10 +2,18 @@
 import asyncio
 from datetime import timedelta
 import logging
+from time import monotonic
 
 import voluptuous as vol
 
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, CONF_ENTITY_ID, CONF_NAME
+from homeassistant.components import websocket_api
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_NAME,
+    CONF_ENTITY_ID,
+    CONF_NAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
@@ -14,11 +22,14 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.util.async_ import run_callback_threadsafe
 
+from .pipeline import ImageProcessingPipeline
+
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "image_processing"
+DATA_PIPELINE = "image_processing_pipeline"
 SCAN_INTERVAL = timedelta(seconds=10)
 
 DEVICE_CLASSES = [
@@ -65,6 +76,10 @@ PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
 
 async def async_setup(hass, config):
     """Set up the image processing."""
+    pipeline = hass.data[DATA_PIPELINE] = ImageProcessingPipeline(hass)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, pipeline.async_shutdown)
+    websocket_api.async_register_command(hass, websocket_statistics)
+
     component = EntityComponent(_LOGGER, DOMAIN, hass, SCAN_INTERVAL)
 
     await component.async_setup(config)
@@ -73,10 +88,13 @@ async def async_setup(hass, config):
         """Service handler for scan."""
         image_entities = await component.async_extract_from_service(service)
 
+        # asyncio.wait only accepts tasks on newer Python versions
         update_tasks = []
         for entity in image_entities:
             entity.async_set_context(service.context)
-            update_tasks.append(entity.async_update_ha_state(True))
+            update_tasks.append(
+                hass.async_create_task(entity.async_update_ha_state(True))
+            )
 
         if update_tasks:
             await asyncio.wait(update_tasks)
@@ -88,6 +106,24 @@ async def async_setup(hass, config):
     return True
 
 
+@websocket_api.websocket_command({vol.Required("type"): "image_processing/statistics"})
+@websocket_api.require_admin
+@callback
+def websocket_statistics(hass, connection, msg):
+    """Return the processing pipeline statistics per platform."""
+    pipeline = hass.data[DATA_PIPELINE]
+    connection.send_result(
+        msg["id"],
+        {
+            "max_workers": pipeline.max_workers,
+            "platforms": {
+                platform: stats.as_dict()
+                for platform, stats in pipeline.statistics.items()
+            },
+        },
+    )
+
+
 class ImageProcessingEntity(Entity):
     """Base entity class for image processing."""
 
@@ -109,7 +145,10 @@ class ImageProcessingEntity(Entity):
 
     async def async_process_image(self, image):
         """Process image."""
-        return await self.hass.async_add_executor_job(self.process_image, image)
+        pipeline = self.hass.data.get(DATA_PIPELINE)
+        if pipeline is None:
+            return await self.hass.async_add_executor_job(self.process_image, image)
+        return await pipeline.async_add_executor_job(self.process_image, image)
 
     async def async_update(self):
         """Update image and process it.
@@ -117,7 +156,9 @@ class ImageProcessingEntity(Entity):
         This method is a coroutine.
         """
         camera = self.hass.components.camera
+        pipeline = self.hass.data.get(DATA_PIPELINE)
         image = None
+        start = monotonic()
 
         try:
             image = await camera.async_get_image(
@@ -126,10 +167,23 @@ class ImageProcessingEntity(Entity):
 
         except HomeAssistantError as err:
             _LOGGER.error("Error on receive image from entity: %s", err)
+            if pipeline is not None:
+                pipeline.async_record_fetch(self, None)
             return
 
         # process image data
-        await self.async_process_image(image.content)
+        if pipeline is None:
+            await self.async_process_image(image.content)
+            return
+
+        pipeline.async_record_fetch(self, monotonic() - start)
+        # Only the executor based default implementation is bounded by the
+        # worker pool, platform specific implementations do their own I/O.
+        await pipeline.async_process(
+            self,
+            image.content,
+            type(self).async_process_image is ImageProcessingEntity.async_process_image,
+        )
 
 
 class ImageProcessingFaceEntity(ImageProcessingEntity):
@@ -0,0 +1,173 @@
+"""Processing pipeline for image processing entities."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from . import ImageProcessingEntity  # noqa: F401
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class PipelineStatistics:
+    """Latency and drop counters of a single image processing platform."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.frames_fetched = 0
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        self.fetch_errors = 0
+        self.last_fetch_latency: Optional[float] = None
+        self.last_queue_latency: Optional[float] = None
+        self.last_process_latency: Optional[float] = None
+        self.max_process_latency = 0.0
+        self._total_process_latency = 0.0
+
+    @callback
+    def async_record_fetch(self, latency: float) -> None:
+        """Record a fetched camera frame."""
+        self.frames_fetched += 1
+        self.last_fetch_latency = latency
+
+    @callback
+    def async_record_processed(self, queued: float, latency: float) -> None:
+        """Record a processed camera frame."""
+        self.frames_processed += 1
+        self.last_queue_latency = queued
+        self.last_process_latency = latency
+        self.max_process_latency = max(self.max_process_latency, latency)
+        self._total_process_latency += latency
+
+    @property
+    def average_process_latency(self) -> Optional[float]:
+        """Return the average processing latency."""
+        if not self.frames_processed:
+            return None
+        return self._total_process_latency / self.frames_processed
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "frames_fetched": self.frames_fetched,
+            "frames_processed": self.frames_processed,
+            "frames_dropped": self.frames_dropped,
+            "fetch_errors": self.fetch_errors,
+            "last_fetch_latency": self.last_fetch_latency,
+            "last_queue_latency": self.last_queue_latency,
+            "last_process_latency": self.last_process_latency,
+            "average_process_latency": self.average_process_latency,
+            "max_process_latency": self.max_process_latency,
+        }
+
+
+class ImageProcessingPipeline:
+    """Run image processing on a dedicated, bounded worker pool.
+
+    Only platforms that process images in the executor (``process_image``)
+    share the worker pool and its limit. Platforms that implement their own
+    ``async_process_image`` (cloud APIs, subprocesses) are not throttled.
+
+    Polls of a platform never overlap, so a frame only waits behind a newer
+    frame of the same entity when a scan service call overlaps a poll or
+    another scan. While waiting for a worker, such a stale frame is dropped.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
+        """Initialize the pipeline."""
+        self.hass = hass
+        self.max_workers = max_workers
+        self.statistics: Dict[str, PipelineStatistics] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._latest: Dict[str, object] = {}
+
+    @callback
+    def async_statistics(self, platform: str) -> PipelineStatistics:
+        """Return the statistics of a platform."""
+        stats = self.statistics.get(platform)
+        if stats is None:
+            stats = self.statistics[platform] = PipelineStatistics()
+        return stats
+
+    @callback
+    def async_record_fetch(
+        self, entity: "ImageProcessingEntity", latency: Optional[float]
+    ) -> None:
+        """Record a camera fetch, a latency of None marks a failed fetch."""
+        stats = self.async_statistics(_platform_name(entity))
+        if latency is None:
+            stats.fetch_errors += 1
+        else:
+            stats.async_record_fetch(latency)
+
+    @callback
+    def async_add_executor_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> Awaitable[T]:
+        """Run a job in the inference worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ImageProcessing"
+            )
+        return self.hass.loop.run_in_executor(self._executor, target, *args)
+
+    async def async_process(
+        self, entity: "ImageProcessingEntity", image: bytes, bounded: bool = True
+    ) -> bool:
+        """Process a frame for an entity.
+
+        Unbounded frames are processed right away. Returns False if a bounded
+        frame was dropped in favour of a newer one.
+        """
+        stats = self.async_statistics(_platform_name(entity))
+        process_image: Callable[[bytes], Awaitable[None]] = entity.async_process_image
+
+        if not bounded:
+            start = monotonic()
+            await process_image(image)
+            stats.async_record_processed(0.0, monotonic() - start)
+            return True
+
+        key = entity.entity_id
+        token = object()
+        self._latest[key] = token
+        queued = monotonic()
+
+        async with self._semaphore:
+            if self._latest.get(key) is not token:
+                stats.frames_dropped += 1
+                _LOGGER.debug("Dropping stale frame for %s", key)
+                return False
+
+            del self._latest[key]
+            start = monotonic()
+            await process_image(image)
+            stats.async_record_processed(start - queued, monotonic() - start)
+
+        return True
+
+    @callback
+    def async_shutdown(self, *_: Any) -> None:
+        """Shut down the inference worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def _platform_name(entity: "ImageProcessingEntity") -> str:
+    """Return the platform name of an entity."""
+    if entity.platform is None:
+        return "unknown"
+    return entity.platform.platform_name
@@ -5,7 +5,7 @@ import math
 import queue
 import threading
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
@@ -26,7 +26,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import callback
+from homeassistant.core import State, callback
 from homeassistant.helpers import event as event_helper, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -53,6 +53,7 @@ from .const import (
     CONF_DEFAULT_MEASUREMENT,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_LINE_PROTOCOL,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -61,6 +62,7 @@ from .const import (
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL_SIZE,
     CONF_SSL,
     CONF_TAGS,
     CONF_TAGS_ATTRIBUTES,
@@ -81,23 +83,35 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_BATCH_SIZE,
+    MIN_BATCH_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_RETRY_INTERVAL,
+    SPOOLING_MESSAGE,
+    TARGET_WRITE_LATENCY,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .line_protocol import encode_fields, encode_prefix, encode_timestamp
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precision names of the V1 API for points in line protocol
+V1_LINE_PRECISION = {"ns": "n", "us": "u"}
+
 
 def create_influx_url(conf: Dict) -> Dict:
     """Build URL used from config inputs and default when necessary."""
@@ -146,6 +160,14 @@ def validate_version_specific_config(conf: Dict) -> Dict:
     return conf
 
 
+def validate_spool_config(conf: Dict) -> Dict:
+    """Enable line protocol when spooling, the spool stores points in it."""
+    if CONF_SPOOL_SIZE in conf:
+        conf[CONF_LINE_PROTOCOL] = True
+
+    return conf
+
+
 _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
@@ -156,6 +178,9 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_LINE_PROTOCOL, default=False): cv.boolean,
+        # Maximum size of the spool in megabytes
+        vol.Optional(CONF_SPOOL_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1)),
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -183,6 +208,7 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
 INFLUX_SCHEMA = vol.All(
     _INFLUX_BASE_SCHEMA.extend(COMPONENT_CONFIG_SCHEMA_CONNECTION),
     validate_version_specific_config,
+    validate_spool_config,
     create_influx_url,
 )
 
@@ -192,8 +218,24 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
-    """Build event to json converter and add to config."""
+class _EntityPoint(NamedTuple):
+    """Measurement and tags of the points of an entity."""
+
+    measurement: str
+    tags: Dict[str, Any]
+    include_uom: bool
+    include_dc: bool
+    ignore_attributes: Set[str]
+    # Measurement and tags encoded in line protocol
+    prefix: Optional[str]
+
+
+def _generate_event_to_json(conf: Dict) -> Callable[[Dict], Any]:
+    """Build event to json converter and add to config.
+
+    With line protocol enabled, the converter returns a point in line
+    protocol instead of a json dict.
+    """
     entity_filter = convert_include_exclude_filter(conf)
     tags = conf.get(CONF_TAGS)
     tags_attributes = conf.get(CONF_TAGS_ATTRIBUTES)
@@ -206,29 +248,15 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
+    line_protocol = conf.get(CONF_LINE_PROTOCOL)
+    precision = conf.get(CONF_PRECISION)
 
-    def event_to_json(event: Dict) -> str:
-        """Convert event into json in format Influx expects."""
-        state = event.data.get(EVENT_NEW_STATE)
-        if (
-            state is None
-            or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE)
-            or not entity_filter(state.entity_id)
-        ):
-            return
-
-        try:
-            _include_state = _include_value = False
-
-            _state_as_value = float(state.state)
-            _include_value = True
-        except ValueError:
-            try:
-                _state_as_value = float(state_helper.state_as_number(state))
-                _include_state = _include_value = True
-            except ValueError:
-                _include_state = True
+    # Attributes the measurement and tags of an entity depend on
+    key_attributes = [measurement_attr, "device_class", *tags_attributes]
+    entities: Dict[str, Tuple[Tuple, _EntityPoint]] = {}
 
+    def resolve_entity(state: State) -> _EntityPoint:
+        """Resolve the measurement and tags of an entity."""
         include_uom = True
         include_dc = True
         entity_config = component_config.get(state.entity_id)
@@ -257,59 +285,111 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
+        point_tags = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
         }
-        if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
-        if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+        for key in tags_attributes:
+            if key in state.attributes:
+                point_tags[key] = state.attributes[key]
+        point_tags.update(tags)
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
+
+        return _EntityPoint(
+            measurement,
+            point_tags,
+            include_uom,
+            include_dc,
+            ignore_attributes,
+            encode_prefix(measurement, point_tags) if line_protocol else None,
+        )
+
+    def get_entity(state: State) -> _EntityPoint:
+        """Return the measurement and tags of an entity, cached per entity."""
+        key = tuple(state.attributes.get(attribute) for attribute in key_attributes)
+        cached = entities.get(state.entity_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        entity = resolve_entity(state)
+        entities[state.entity_id] = (key, entity)
+        return entity
+
+    def event_to_json(event: Dict) -> Any:
+        """Convert event into json in format Influx expects."""
+        state = event.data.get(EVENT_NEW_STATE)
+        if (
+            state is None
+            or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE)
+            or not entity_filter(state.entity_id)
+        ):
+            return
+
+        try:
+            _include_state = _include_value = False
+
+            _state_as_value = float(state.state)
+            _include_value = True
+        except ValueError:
+            try:
+                _state_as_value = float(state_helper.state_as_number(state))
+                _include_state = _include_value = True
+            except ValueError:
+                _include_state = True
+
+        entity = get_entity(state)
+        fields = {}
+        if _include_state:
+            fields[INFLUX_CONF_STATE] = state.state
+        if _include_value:
+            fields[INFLUX_CONF_VALUE] = _state_as_value
+
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
-            elif (
-                (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
-                and (key != "device_class" or include_dc)
-                and key not in ignore_attributes
+                continue
+            if (
+                (key != CONF_UNIT_OF_MEASUREMENT or entity.include_uom)
+                and (key != "device_class" or entity.include_dc)
+                and key not in entity.ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we can not do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 try:
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
                 except (KeyError, TypeError):
                     pass
 
-        json[INFLUX_CONF_TAGS].update(tags)
+        if line_protocol:
+            encoded_fields = encode_fields(fields)
+            if not encoded_fields:
+                return None
+            timestamp = encode_timestamp(event.time_fired, precision)
+            return f"{entity.prefix} {encoded_fields} {timestamp}"
 
-        return json
+        return {
+            INFLUX_CONF_MEASUREMENT: entity.measurement,
+            INFLUX_CONF_TAGS: dict(entity.tags),
+            INFLUX_CONF_TIME: event.time_fired,
+            INFLUX_CONF_FIELDS: fields,
+        }
 
     return event_to_json
 
@@ -330,6 +410,9 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         CONF_TIMEOUT: TIMEOUT,
     }
     precision = conf.get(CONF_PRECISION)
+    line_protocol = conf.get(CONF_LINE_PROTOCOL)
+    # Failed writes can only be spooled if they are synchronous
+    write_mode = SYNCHRONOUS if CONF_SPOOL_SIZE in conf else ASYNCHRONOUS
 
     if conf[CONF_API_VERSION] == API_VERSION_2:
         kwargs[CONF_URL] = conf[CONF_URL]
@@ -338,7 +421,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
+        initial_write_mode = SYNCHRONOUS if test_write else write_mode
         write_api = influx.write_api(write_options=initial_write_mode)
 
         def write_v2(json):
@@ -380,7 +463,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
                 write_v2(b"")
             except ValueError:
                 pass
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
+            write_api = influx.write_api(write_options=write_mode)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -416,11 +499,17 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
     influx = InfluxDBClient(**kwargs)
+    line_precision = V1_LINE_PRECISION.get(precision, precision)
 
     def write_v1(json):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            if line_protocol:
+                influx.write_points(
+                    json, time_precision=line_precision, protocol="line"
+                )
+            else:
+                influx.write_points(json, time_precision=precision)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -473,7 +562,14 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = None
+    if CONF_SPOOL_SIZE in conf:
+        spool = InfluxSpool(
+            hass.config.path(SPOOL_DIRECTORY), conf[CONF_SPOOL_SIZE] * 1024 * 1024
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -488,17 +584,25 @@ def setup(hass, config):
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    With a spool, batches that cannot be written are stored on disk and
+    replayed in order once InfluxDB is available again. While the spool holds
+    points, new batches are appended to it to keep them in order.
+    """
+
+    def __init__(self, hass, influx, event_to_json, max_tries, spool=None):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool = spool
+        self.batch_size = BATCH_BUFFER_SIZE
         self.write_errors = 0
         self.shutdown = False
+        self._next_replay = 0.0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -512,6 +616,12 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
+    def first_timeout(self):
+        """Return number of seconds to wait for the first event of a batch."""
+        if self.spool is None or not self.spool.pending:
+            return None
+        return max(0, self._next_replay - time.monotonic())
+
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
@@ -522,8 +632,8 @@ class InfluxThread(threading.Thread):
         dropped = 0
 
         try:
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while len(json) < self.batch_size and not self.shutdown:
+                timeout = self.first_timeout() if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
@@ -533,7 +643,8 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
+                    # Old events are only dropped if they cannot be spooled
+                    if self.spool is not None or age < queue_seconds:
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
@@ -548,11 +659,26 @@ class InfluxThread(threading.Thread):
 
         return count, json
 
+    def _write(self, json):
+        """Write a batch and adapt the batch size to the write latency."""
+        start = time.monotonic()
+        self.influx.write(json)
+        latency = time.monotonic() - start
+
+        if latency > TARGET_WRITE_LATENCY:
+            self.batch_size = max(MIN_BATCH_SIZE, self.batch_size // 2)
+        elif len(json) >= self.batch_size:
+            self.batch_size = min(MAX_BATCH_SIZE, self.batch_size * 2)
+
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
+        if self.spool is not None and self.spool.pending:
+            self.spool.append(json)
+            return
+
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self._write(json)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
@@ -566,17 +692,44 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spool is not None:
+                    _LOGGER.error(SPOOLING_MESSAGE, err)
+                    self.spool.append(json)
+                    self._next_replay = time.monotonic() + SPOOL_RETRY_INTERVAL
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def replay_spool(self):
+        """Write the oldest segment of the spool to influxdb."""
+        segment, lines = self.spool.oldest()
+
+        for index in range(0, len(lines), self.batch_size):
+            try:
+                self._write(lines[index : index + self.batch_size])
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError as err:
+                _LOGGER.debug("Replaying spool failed: %s", err)
+                self._next_replay = time.monotonic() + SPOOL_RETRY_INTERVAL
+                return
+
+        self.spool.remove(segment)
+        _LOGGER.info(REPLAYED_MESSAGE, len(lines))
+
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
             count, json = self.get_events_json()
             if json:
                 self.write_to_influxdb(json)
+            if (
+                self.spool is not None
+                and self.spool.pending
+                and time.monotonic() >= self._next_replay
+            ):
+                self.replay_spool()
             for _ in range(count):
                 self.queue.task_done()
 
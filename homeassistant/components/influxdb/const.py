@@ -31,6 +31,8 @@ CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
+CONF_LINE_PROTOCOL = "line_protocol"
+CONF_SPOOL_SIZE = "spool_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -77,6 +79,12 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+MIN_BATCH_SIZE = 10
+MAX_BATCH_SIZE = 5000
+TARGET_WRITE_LATENCY = 1  # seconds
+SPOOL_DIRECTORY = "influxdb_spool"
+SPOOL_SEGMENT_SIZE = 1024 * 1024  # bytes
+SPOOL_RETRY_INTERVAL = 30  # seconds
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -119,6 +127,9 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPOOLING_MESSAGE = "%s Spooling events to disk until InfluxDB is available."
+REPLAYED_MESSAGE = "Replayed %d spooled events."
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d bytes of the oldest events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -0,0 +1,48 @@
+"""Encode InfluxDB points in line protocol."""
+import calendar
+from datetime import datetime
+import math
+from typing import Any, Dict, Optional
+
+# Number of nanoseconds in a unit of each precision
+PRECISION_NANOSECONDS = {None: 1, "ns": 1, "us": 10 ** 3, "ms": 10 ** 6, "s": 10 ** 9}
+
+_ESCAPE_MEASUREMENT = str.maketrans({"\\": "\\\\", ",": "\\,", " ": "\\ ", "\n": "\\n"})
+_ESCAPE_KEY = str.maketrans(
+    {"\\": "\\\\", ",": "\\,", "=": "\\=", " ": "\\ ", "\n": "\\n"}
+)
+_ESCAPE_STRING = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+def encode_prefix(measurement: str, tags: Dict[str, Any]) -> str:
+    """Return the measurement and tags of a point, sorted by tag key."""
+    prefix = str(measurement).translate(_ESCAPE_MEASUREMENT)
+    for key in sorted(tags):
+        value = tags[key]
+        if value is None or value == "":
+            continue
+        key = str(key).translate(_ESCAPE_KEY)
+        prefix += f",{key}={str(value).translate(_ESCAPE_KEY)}"
+    return prefix
+
+
+def encode_fields(fields: Dict[str, Any]) -> str:
+    """Return the fields of a point, skipping values InfluxDB does not accept."""
+    encoded = []
+    for key, value in fields.items():
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                continue
+            value = repr(value)
+        else:
+            value = f'"{str(value).translate(_ESCAPE_STRING)}"'
+        encoded.append(f"{key.translate(_ESCAPE_KEY)}={value}")
+    return ",".join(encoded)
+
+
+def encode_timestamp(time_fired: datetime, precision: Optional[str] = None) -> int:
+    """Return a timestamp in the units of a precision."""
+    nanoseconds = (
+        calendar.timegm(time_fired.utctimetuple()) * 10 ** 6 + time_fired.microsecond
+    ) * 1000
+    return nanoseconds // PRECISION_NANOSECONDS[precision]
@@ -0,0 +1,96 @@
+"""Disk spool of InfluxDB points that could not be written."""
+import logging
+import os
+from typing import List, Optional, Tuple
+
+from .const import SPOOL_FULL_MESSAGE, SPOOL_SEGMENT_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".lp"
+
+
+class InfluxSpool:
+    """Append-only segment files of points in line protocol.
+
+    Points are appended to the newest segment and replayed from the oldest
+    one. When the spool grows beyond its maximum size, the oldest segments
+    are dropped. Only used from the InfluxDB thread.
+    """
+
+    def __init__(
+        self, path: str, max_size: int, segment_size: int = SPOOL_SEGMENT_SIZE
+    ) -> None:
+        """Initialize the spool and find the segments left by a previous run."""
+        self.path = path
+        self.max_size = max_size
+        self.segment_size = segment_size
+        self._segments: List[str] = []
+        self._size = 0
+        self._next_sequence = 0
+        # Segment new points are appended to
+        self._current: Optional[str] = None
+
+        os.makedirs(path, exist_ok=True)
+        for name in sorted(os.listdir(path)):
+            if not name.endswith(SEGMENT_SUFFIX):
+                continue
+            segment = os.path.join(path, name)
+            self._segments.append(segment)
+            self._size += os.path.getsize(segment)
+            self._next_sequence = int(name[: -len(SEGMENT_SUFFIX)]) + 1
+
+    @property
+    def pending(self) -> bool:
+        """Return if the spool holds points."""
+        return bool(self._segments)
+
+    def append(self, lines: List[str]) -> None:
+        """Append points to the newest segment."""
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+
+        if self._current is None:
+            self._current = os.path.join(
+                self.path, f"{self._next_sequence:012d}{SEGMENT_SUFFIX}"
+            )
+            self._next_sequence += 1
+            self._segments.append(self._current)
+
+        with open(self._current, "ab") as fil:
+            fil.write(data)
+        self._size += len(data)
+
+        if os.path.getsize(self._current) >= self.segment_size:
+            self._current = None
+
+        dropped = 0
+        while self._size > self.max_size and len(self._segments) > 1:
+            dropped += self._remove(self._segments[0])
+        if dropped:
+            _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+
+    def oldest(self) -> Optional[Tuple[str, List[str]]]:
+        """Return the oldest segment and its points."""
+        if not self._segments:
+            return None
+
+        segment = self._segments[0]
+        if segment == self._current:
+            self._current = None
+
+        with open(segment, encoding="utf-8") as fil:
+            return segment, fil.read().splitlines()
+
+    def remove(self, segment: str) -> None:
+        """Remove a replayed segment."""
+        self._remove(segment)
+
+    def _remove(self, segment: str) -> int:
+        """Remove a segment and return its size."""
+        size = os.path.getsize(segment)
+        os.remove(segment)
+        self._segments.remove(segment)
+        self._size -= size
+        if segment == self._current:
+            self._current = None
+        return size
@@ -1,7 +1,6 @@
 """Component to interface with various media players."""
 import asyncio
 import base64
-import collections
 from datetime import timedelta
 import functools as ft
 import hashlib
@@ -57,6 +56,7 @@ from homeassistant.helpers.config_validation import (  # noqa: F401
 )
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.image_cache import async_get_image_cache
 from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
@@ -123,12 +123,6 @@ _LOGGER = logging.getLogger(__name__)
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
-CACHE_IMAGES = "images"
-CACHE_MAXSIZE = "maxsize"
-CACHE_LOCK = "lock"
-CACHE_URL = "url"
-CACHE_CONTENT = "content"
-ENTITY_IMAGE_CACHE = {CACHE_IMAGES: collections.OrderedDict(), CACHE_MAXSIZE: 16}
 
 SCAN_INTERVAL = timedelta(seconds=10)
 
@@ -862,29 +856,15 @@ class MediaPlayerEntity(Entity):
     async def _async_fetch_image_from_cache(self, url):
         """Fetch image.
 
-        Images are cached in memory (the images are typically 10-100kB in size).
+        Images are cached in memory by the image cache shared with the other
+        integrations serving images.
         """
-        cache_images = ENTITY_IMAGE_CACHE[CACHE_IMAGES]
-        cache_maxsize = ENTITY_IMAGE_CACHE[CACHE_MAXSIZE]
-
         if urlparse(url).hostname is None:
             url = f"{get_url(self.hass)}{url}"
 
-        if url not in cache_images:
-            cache_images[url] = {CACHE_LOCK: asyncio.Lock()}
-
-        async with cache_images[url][CACHE_LOCK]:
-            if CACHE_CONTENT in cache_images[url]:
-                return cache_images[url][CACHE_CONTENT]
-
-        (content, content_type) = await self._async_fetch_image(url)
-
-        async with cache_images[url][CACHE_LOCK]:
-            cache_images[url][CACHE_CONTENT] = content, content_type
-            while len(cache_images) > cache_maxsize:
-                cache_images.popitem(last=False)
-
-        return content, content_type
+        return await async_get_image_cache(self.hass).async_get(
+            url, ft.partial(self._async_fetch_image, url)
+        )
 
     async def _async_fetch_image(self, url):
         """Retrieve an image."""
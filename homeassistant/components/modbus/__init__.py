@@ -28,15 +28,18 @@ from homeassistant.const import (
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.discovery import load_platform
 
+from .block_read import BlockReader, ReadRange
 from .const import (
     ATTR_ADDRESS,
     ATTR_HUB,
     ATTR_UNIT,
     ATTR_VALUE,
     CALL_TYPE_COIL,
+    CALL_TYPE_DISCRETE,
     CALL_TYPE_REGISTER_HOLDING,
     CALL_TYPE_REGISTER_INPUT,
     CONF_BAUDRATE,
+    CONF_BLOCK_READS,
     CONF_BYTESIZE,
     CONF_CLIMATES,
     CONF_CURRENT_TEMP,
@@ -44,6 +47,8 @@ from .const import (
     CONF_DATA_COUNT,
     CONF_DATA_TYPE,
     CONF_INPUT_TYPE,
+    CONF_MAX_COUNT,
+    CONF_MAX_GAP,
     CONF_MAX_TEMP,
     CONF_MIN_TEMP,
     CONF_OFFSET,
@@ -66,6 +71,8 @@ from .const import (
     DATA_TYPE_INT,
     DATA_TYPE_UINT,
     DEFAULT_HUB,
+    DEFAULT_MAX_COUNT,
+    DEFAULT_MAX_GAP,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SLAVE,
     DEFAULT_STRUCTURE_PREFIX,
@@ -77,7 +84,28 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-BASE_SCHEMA = vol.Schema({vol.Optional(CONF_NAME, default=DEFAULT_HUB): cv.string})
+READ_METHODS = {
+    CALL_TYPE_COIL: "read_coils",
+    CALL_TYPE_DISCRETE: "read_discrete_inputs",
+    CALL_TYPE_REGISTER_HOLDING: "read_holding_registers",
+    CALL_TYPE_REGISTER_INPUT: "read_input_registers",
+}
+
+BLOCK_READS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MAX_COUNT, default=DEFAULT_MAX_COUNT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=DEFAULT_MAX_COUNT)
+        ),
+        vol.Optional(CONF_MAX_GAP, default=DEFAULT_MAX_GAP): cv.positive_int,
+    }
+)
+
+BASE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NAME, default=DEFAULT_HUB): cv.string,
+        vol.Optional(CONF_BLOCK_READS): BLOCK_READS_SCHEMA,
+    }
+)
 
 CLIMATE_SCHEMA = vol.Schema(
     {
@@ -266,6 +294,14 @@ class ModbusHub:
         self._config_port = client_config[CONF_PORT]
         self._config_timeout = client_config[CONF_TIMEOUT]
         self._config_delay = 0
+        self._block_reader = None
+
+        if CONF_BLOCK_READS in client_config:
+            self._block_reader = BlockReader(
+                self._read_direct,
+                client_config[CONF_BLOCK_READS][CONF_MAX_GAP],
+                client_config[CONF_BLOCK_READS][CONF_MAX_COUNT],
+            )
 
         if self._config_type == "serial":
             # serial configuration
@@ -336,44 +372,74 @@ class ModbusHub:
         with self._lock:
             self._client.connect()
 
-    def read_coils(self, unit, address, count):
-        """Read coils."""
+    def register_read(self, unit, call_type, address, count, scan_interval):
+        """Register a range an entity reads every scan interval."""
+        if self._block_reader is not None:
+            self._block_reader.add(
+                ReadRange(unit, call_type, address, count), scan_interval
+            )
+
+    def unregister_read(self, unit, call_type, address, count, scan_interval):
+        """Unregister a range of a removed entity."""
+        if self._block_reader is not None:
+            self._block_reader.remove(
+                ReadRange(unit, call_type, address, count), scan_interval
+            )
+
+    def _read(self, call_type, unit, address, count):
+        """Read a range, from a block read if block reads are enabled."""
+        if self._block_reader is not None:
+            result = self._block_reader.read(ReadRange(unit, call_type, address, count))
+            if result is not None:
+                return result
+        return self._read_direct(call_type, unit, address, count)
+
+    def _read_direct(self, call_type, unit, address, count):
+        """Read a range from the device."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
-            return self._client.read_coils(address, count, **kwargs)
+            return getattr(self._client, READ_METHODS[call_type])(
+                address, count, **kwargs
+            )
+
+    def _invalidate(self, unit):
+        """Make the next reads of a unit see a write."""
+        if self._block_reader is not None:
+            self._block_reader.invalidate(unit)
+
+    def read_coils(self, unit, address, count):
+        """Read coils."""
+        return self._read(CALL_TYPE_COIL, unit, address, count)
 
     def read_discrete_inputs(self, unit, address, count):
         """Read discrete inputs."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_discrete_inputs(address, count, **kwargs)
+        return self._read(CALL_TYPE_DISCRETE, unit, address, count)
 
     def read_input_registers(self, unit, address, count):
         """Read input registers."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_input_registers(address, count, **kwargs)
+        return self._read(CALL_TYPE_REGISTER_INPUT, unit, address, count)
 
     def read_holding_registers(self, unit, address, count):
         """Read holding registers."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_holding_registers(address, count, **kwargs)
+        return self._read(CALL_TYPE_REGISTER_HOLDING, unit, address, count)
 
     def write_coil(self, unit, address, value):
         """Write coil."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_coil(address, value, **kwargs)
+        self._invalidate(unit)
 
     def write_register(self, unit, address, value):
         """Write register."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_register(address, value, **kwargs)
+        self._invalidate(unit)
 
     def write_registers(self, unit, address, values):
         """Write registers."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_registers(address, values, **kwargs)
+        self._invalidate(unit)
@@ -84,6 +84,24 @@ class ModbusBinarySensor(BinarySensorEntity):
         self._value = None
         self._available = True
 
+    async def async_added_to_hass(self):
+        """Read the input of the sensor in block reads."""
+        self._hub.register_read(*self._read_range())
+
+    async def async_will_remove_from_hass(self):
+        """Stop reading the input of the sensor in block reads."""
+        self._hub.unregister_read(*self._read_range())
+
+    def _read_range(self):
+        """Return the input read by the sensor and its scan interval."""
+        return (
+            self._slave,
+            self._input_type,
+            self._address,
+            1,
+            self.platform.scan_interval.total_seconds(),
+        )
+
     @property
     def name(self):
         """Return the name of the sensor."""
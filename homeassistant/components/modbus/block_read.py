@@ -0,0 +1,159 @@
+"""Coalesce the reads of a Modbus hub into block reads."""
+from collections import defaultdict
+import threading
+import time
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, NamedTuple, Tuple
+
+from pymodbus.exceptions import ModbusException
+from pymodbus.pdu import ExceptionResponse
+
+from .const import CALL_TYPE_COIL, CALL_TYPE_DISCRETE
+
+# Coils and discrete inputs are packed 16 per register in a response
+BITS_PER_REGISTER = 16
+
+
+class ReadRange(NamedTuple):
+    """Address range of a read."""
+
+    unit: Any
+    call_type: str
+    address: int
+    count: int
+
+
+class ReadSlice(NamedTuple):
+    """Part of a block read, returned in place of a pymodbus response."""
+
+    registers: List[int]
+    bits: List[bool]
+
+
+def plan_reads(
+    ranges: Iterable[ReadRange], max_gap: int, max_count: int
+) -> Dict[ReadRange, ReadRange]:
+    """Merge read ranges into blocks and return the block of each range.
+
+    Ranges of the same unit and call type are merged when the gap between
+    them is at most max_gap and the block stays at most max_count long. For
+    coils and discrete inputs both limits are in registers worth of bits.
+    """
+    grouped: DefaultDict[Tuple[Any, str], List[ReadRange]] = defaultdict(list)
+    for read_range in ranges:
+        grouped[(read_range.unit, read_range.call_type)].append(read_range)
+
+    plan = {}
+    for (unit, call_type), group in grouped.items():
+        gap, count = max_gap, max_count
+        if call_type in (CALL_TYPE_COIL, CALL_TYPE_DISCRETE):
+            gap, count = gap * BITS_PER_REGISTER, count * BITS_PER_REGISTER
+
+        members: List[ReadRange] = []
+        start = end = 0
+        for read_range in sorted(group, key=lambda item: item.address):
+            range_end = read_range.address + read_range.count
+            if (
+                members
+                and read_range.address - end <= gap
+                and max(end, range_end) - start <= count
+            ):
+                members.append(read_range)
+                end = max(end, range_end)
+                continue
+
+            if members:
+                block = ReadRange(unit, call_type, start, end - start)
+                plan.update((member, block) for member in members)
+            members = [read_range]
+            start, end = read_range.address, range_end
+
+        block = ReadRange(unit, call_type, start, end - start)
+        plan.update((member, block) for member in members)
+
+    return plan
+
+
+class BlockReader:
+    """Serve the reads of a hub from block reads.
+
+    The entities of a hub register the ranges they poll. The first read of a
+    range in a scan interval reads its whole block, the other ranges in the
+    block are served from that response until it is half an interval old.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[str, Any, int, int], Any],
+        max_gap: int,
+        max_count: int,
+    ) -> None:
+        """Initialize the block reader."""
+        self._read = read
+        self._max_gap = max_gap
+        self._max_count = max_count
+        self._lock = threading.Lock()
+        # Scan intervals of the registered ranges, a range may be registered
+        # by more than one entity
+        self._ranges: DefaultDict[ReadRange, List[float]] = defaultdict(list)
+        self._plan: Dict[ReadRange, ReadRange] = {}
+        self._max_age: Dict[ReadRange, float] = {}
+        self._responses: Dict[ReadRange, Tuple[float, Any]] = {}
+
+    def add(self, read_range: ReadRange, scan_interval: float) -> None:
+        """Register a range polled every scan interval."""
+        with self._lock:
+            self._ranges[read_range].append(scan_interval)
+            self._update_plan()
+
+    def remove(self, read_range: ReadRange, scan_interval: float) -> None:
+        """Unregister a range."""
+        with self._lock:
+            intervals = self._ranges.get(read_range)
+            if not intervals or scan_interval not in intervals:
+                return
+            intervals.remove(scan_interval)
+            if not intervals:
+                del self._ranges[read_range]
+            self._update_plan()
+
+    def _update_plan(self) -> None:
+        """Plan the block reads of the registered ranges."""
+        self._plan = plan_reads(self._ranges, self._max_gap, self._max_count)
+        self._max_age = {}
+        for read_range, block in self._plan.items():
+            max_age = min(self._ranges[read_range]) / 2
+            self._max_age[block] = min(max_age, self._max_age.get(block, max_age))
+        self._responses.clear()
+
+    def read(self, read_range: ReadRange) -> Any:
+        """Read a registered range, return None if it is not registered."""
+        with self._lock:
+            block = self._plan.get(read_range)
+            if block is None:
+                return None
+
+            now = time.monotonic()
+            cached = self._responses.get(block)
+            if cached is not None and now - cached[0] < self._max_age[block]:
+                response = cached[1]
+            else:
+                response = self._read(
+                    block.call_type, block.unit, block.address, block.count
+                )
+                if isinstance(response, (ModbusException, ExceptionResponse)):
+                    self._responses.pop(block, None)
+                    return response
+                self._responses[block] = (now, response)
+
+        start = read_range.address - block.address
+        end = start + read_range.count
+        if block.call_type in (CALL_TYPE_COIL, CALL_TYPE_DISCRETE):
+            return ReadSlice([], list(response.bits[start:end]))
+        return ReadSlice(list(response.registers[start:end]), [])
+
+    def invalidate(self, unit: Any) -> None:
+        """Drop the block responses of a unit after a write."""
+        with self._lock:
+            for block in list(self._responses):
+                if block.unit == unit:
+                    del self._responses[block]
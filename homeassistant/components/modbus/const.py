@@ -15,6 +15,9 @@ CONF_COUNT = "count"
 CONF_PRECISION = "precision"
 CONF_OFFSET = "offset"
 CONF_COILS = "coils"
+CONF_BLOCK_READS = "block_reads"
+CONF_MAX_COUNT = "max_count"
+CONF_MAX_GAP = "max_gap"
 
 # integration names
 DEFAULT_HUB = "default"
@@ -47,6 +50,8 @@ ATTR_VALUE = "value"
 SERVICE_WRITE_COIL = "write_coil"
 SERVICE_WRITE_REGISTER = "write_register"
 DEFAULT_SCAN_INTERVAL = 15  # seconds
+DEFAULT_MAX_COUNT = 125  # registers, the most a single request can read
+DEFAULT_MAX_GAP = 0  # registers
 
 # binary_sensor.py
 CONF_INPUTS = "inputs"
@@ -196,11 +196,26 @@ class ModbusRegisterSensor(RestoreEntity):
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
+        self._hub.register_read(*self._read_range())
         state = await self.async_get_last_state()
         if not state:
             return
         self._value = state.state
 
+    async def async_will_remove_from_hass(self):
+        """Stop reading the registers of the sensor in block reads."""
+        self._hub.unregister_read(*self._read_range())
+
+    def _read_range(self):
+        """Return the range read by the sensor and its scan interval."""
+        return (
+            self._slave,
+            self._register_type,
+            self._register,
+            self._count,
+            self.platform.scan_interval.total_seconds(),
+        )
+
     @property
     def state(self):
         """Return the state of the sensor."""
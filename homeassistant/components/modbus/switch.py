@@ -109,11 +109,28 @@ class ModbusBaseSwitch(ToggleEntity, RestoreEntity, ABC):
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
+        read_range = self._read_range()
+        if read_range is not None:
+            self._hub.register_read(
+                *read_range, self.platform.scan_interval.total_seconds()
+            )
         state = await self.async_get_last_state()
         if not state:
             return
         self._is_on = state.state == STATE_ON
 
+    async def async_will_remove_from_hass(self):
+        """Stop reading the state of the switch in block reads."""
+        read_range = self._read_range()
+        if read_range is not None:
+            self._hub.unregister_read(
+                *read_range, self.platform.scan_interval.total_seconds()
+            )
+
+    def _read_range(self):
+        """Return the range read to update the switch, if any."""
+        return None
+
     @property
     def is_on(self):
         """Return true if switch is on."""
@@ -138,6 +155,10 @@ class ModbusCoilSwitch(ModbusBaseSwitch, SwitchEntity):
         super().__init__(hub, config)
         self._coil = config[CALL_TYPE_COIL]
 
+    def _read_range(self):
+        """Return the coil read to update the switch."""
+        return (self._slave, CALL_TYPE_COIL, self._coil, 1)
+
     def turn_on(self, **kwargs):
         """Set switch on."""
         self._write_coil(self._coil, True)
@@ -198,6 +219,12 @@ class ModbusRegisterSwitch(ModbusBaseSwitch, SwitchEntity):
         self._available = True
         self._is_on = None
 
+    def _read_range(self):
+        """Return the register read to verify the state of the switch."""
+        if not self._verify_state:
+            return None
+        return (self._slave, self._register_type, self._verify_register, 1)
+
     def turn_on(self, **kwargs):
         """Set switch on."""
 
@@ -5,6 +5,7 @@ from homeassistant.core import callback
 DOMAIN = "ping"
 PLATFORMS = ["binary_sensor"]
 
+PING_ENGINE = "ping_engine"
 PING_ID = "ping_id"
 DEFAULT_START_ID = 129
 MAX_PING_ID = 65534
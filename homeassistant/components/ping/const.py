@@ -2,3 +2,10 @@
 
 PING_TIMEOUT = 3
 PING_ATTEMPTS_COUNT = 3
+
+# Seconds between the echo requests sent to a host
+ECHO_INTERVAL = 1
+# Seconds to wait for an echo reply
+ECHO_TIMEOUT = 1
+# Ping processes run at the same time when ICMP sockets are not permitted
+MAX_PING_SUBPROCESSES = 10
@@ -0,0 +1,353 @@
+"""Ping many hosts concurrently from a single socket."""
+import asyncio
+import logging
+import math
+import re
+import socket
+import struct
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+
+from . import DOMAIN, PING_ENGINE, async_get_next_ping_id
+from .const import ECHO_INTERVAL, ECHO_TIMEOUT, MAX_PING_SUBPROCESSES, PING_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+ICMP_ECHO_REQUEST = {socket.AF_INET: 8, socket.AF_INET6: 128}
+ICMP_ECHO_REPLY = {socket.AF_INET: 0, socket.AF_INET6: 129}
+ICMP_PROTOCOL = {socket.AF_INET: socket.IPPROTO_ICMP, socket.AF_INET6: 58}
+ICMP_HEADER = struct.Struct("!BBHHH")
+PAYLOAD = bytes(range(56))
+
+PING_MATCHER = re.compile(
+    r"(?P<min>\d+.\d+)\/(?P<avg>\d+.\d+)\/(?P<max>\d+.\d+)\/(?P<mdev>\d+.\d+)"
+)
+
+PING_MATCHER_BUSYBOX = re.compile(
+    r"(?P<min>\d+.\d+)\/(?P<avg>\d+.\d+)\/(?P<max>\d+.\d+)"
+)
+
+WIN32_PING_MATCHER = re.compile(r"(?P<min>\d+)ms.+(?P<max>\d+)ms.+(?P<avg>\d+)ms")
+
+
+class PingResult(NamedTuple):
+    """Round trip times of the echo replies of a host in milliseconds."""
+
+    min: float
+    avg: float
+    max: float
+    mdev: Optional[float]
+
+
+def checksum(data: bytes) -> int:
+    """Return the internet checksum of data."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def round_trip_stats(round_trip_times: List[float]) -> Optional[PingResult]:
+    """Return the statistics of round trip times like ping does."""
+    if not round_trip_times:
+        return None
+
+    avg = sum(round_trip_times) / len(round_trip_times)
+    mean_square = sum(rtt * rtt for rtt in round_trip_times) / len(round_trip_times)
+    return PingResult(
+        round(min(round_trip_times), 3),
+        round(avg, 3),
+        round(max(round_trip_times), 3),
+        round(math.sqrt(max(mean_square - avg * avg, 0)), 3),
+    )
+
+
+def parse_ping_output(out_data: bytes) -> Optional[PingResult]:
+    """Return the statistics printed by the ping binary."""
+    last_line = str(out_data).split("\n")[-1]
+    if sys.platform == "win32":
+        match = WIN32_PING_MATCHER.search(last_line)
+    elif "max/" not in str(out_data):
+        match = PING_MATCHER_BUSYBOX.search(last_line)
+    else:
+        match = PING_MATCHER.search(last_line)
+
+    if match is None:
+        return None
+
+    values = match.groupdict()
+    mdev = values.get("mdev")
+    return PingResult(
+        float(values["min"]),
+        float(values["avg"]),
+        float(values["max"]),
+        float(mdev) if mdev is not None else None,
+    )
+
+
+class IcmpSocket:
+    """Send echo requests to many hosts through one socket.
+
+    Uses an unprivileged ICMP datagram socket where the platform allows it,
+    and a raw socket otherwise. Replies are matched to requests by sequence
+    number, so any number of hosts can be pinged at the same time.
+    """
+
+    def __init__(self, loop, family: int, identifier: int) -> None:
+        """Open the socket, raise OSError if ICMP sockets are not permitted."""
+        self._loop = loop
+        self._family = family
+        self._identifier = identifier
+        try:
+            self._sock = socket.socket(family, socket.SOCK_DGRAM, ICMP_PROTOCOL[family])
+            self._raw = False
+        except OSError:
+            self._sock = socket.socket(family, socket.SOCK_RAW, ICMP_PROTOCOL[family])
+            self._raw = True
+        self._sock.setblocking(False)
+        self._sequence = 0
+        self._pending: Dict[int, Tuple[str, asyncio.Future]] = {}
+        loop.add_reader(self._sock.fileno(), self._read_replies)
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+
+    async def async_echo(self, address: str, timeout: float) -> Optional[float]:
+        """Send an echo request and return the round trip time in milliseconds."""
+        sequence = self._sequence
+        while sequence in self._pending:
+            sequence = (sequence + 1) & 0xFFFF
+        self._sequence = (sequence + 1) & 0xFFFF
+
+        packet = ICMP_HEADER.pack(
+            ICMP_ECHO_REQUEST[self._family], 0, 0, self._identifier, sequence
+        )
+        if self._family == socket.AF_INET:
+            packet = ICMP_HEADER.pack(
+                ICMP_ECHO_REQUEST[self._family],
+                0,
+                checksum(packet + PAYLOAD),
+                self._identifier,
+                sequence,
+            )
+
+        future = self._loop.create_future()
+        self._pending[sequence] = (address, future)
+        try:
+            sent = time.monotonic()
+            self._sock.sendto(packet + PAYLOAD, (address, 0))
+            received = await asyncio.wait_for(future, timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        finally:
+            del self._pending[sequence]
+
+        return (received - sent) * 1000
+
+    def _read_replies(self) -> None:
+        """Resolve the requests answered by the replies in the socket buffer."""
+        while True:
+            try:
+                data, source = self._sock.recvfrom(4096)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                continue
+
+            received = time.monotonic()
+            if self._raw and self._family == socket.AF_INET:
+                # Raw IPv4 sockets receive the IP header too
+                data = data[(data[0] & 0x0F) * 4 :]
+            if len(data) < ICMP_HEADER.size:
+                continue
+
+            icmp_type, _, _, identifier, sequence = ICMP_HEADER.unpack_from(data)
+            if icmp_type != ICMP_ECHO_REPLY[self._family]:
+                continue
+            # The kernel sets the identifier of datagram sockets
+            if self._raw and identifier != self._identifier:
+                continue
+
+            pending = self._pending.get(sequence)
+            if pending is None or pending[0] != source[0] or pending[1].done():
+                continue
+            pending[1].set_result(received)
+
+
+class PingEngine:
+    """Ping hosts for all the entities of the integration.
+
+    Results are shared: entities pinging the same host at the same time wait
+    for the same pings instead of sending their own.
+    """
+
+    def __init__(self, hass) -> None:
+        """Initialize the engine."""
+        self.hass = hass
+        self._sockets: Dict[int, Optional[IcmpSocket]] = {}
+        self._pinging: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._results: Dict[Tuple[str, int], Tuple[float, Optional[PingResult]]] = {}
+        self._subprocesses = asyncio.Semaphore(MAX_PING_SUBPROCESSES)
+
+    def _socket(self, family: int) -> Optional[IcmpSocket]:
+        """Return the ICMP socket of an address family, opening it if needed."""
+        if family not in self._sockets:
+            try:
+                self._sockets[family] = IcmpSocket(
+                    self.hass.loop, family, async_get_next_ping_id(self.hass)
+                )
+            except OSError as err:
+                _LOGGER.debug("Unable to open ICMP socket, using ping: %s", err)
+                self._sockets[family] = None
+        return self._sockets[family]
+
+    @callback
+    def async_close(self) -> None:
+        """Close the sockets."""
+        for icmp_socket in self._sockets.values():
+            if icmp_socket is not None:
+                icmp_socket.close()
+        self._sockets.clear()
+
+    async def async_ping(
+        self, host: str, count: int, max_age: float = 0
+    ) -> Optional[PingResult]:
+        """Ping a host, return None if it did not reply.
+
+        A result less than max_age seconds old is returned without pinging.
+        """
+        key = (host, count)
+        result = self._results.get(key)
+        if result is not None and time.monotonic() - result[0] < max_age:
+            return result[1]
+
+        pinging = self._pinging.get(key)
+        if pinging is None:
+            pinging = self._pinging[key] = self.hass.async_create_task(
+                self._async_ping(host, count)
+            )
+            pinging.add_done_callback(lambda _: self._pinging.pop(key, None))
+        return await asyncio.shield(pinging)
+
+    async def _async_ping(self, host: str, count: int) -> Optional[PingResult]:
+        """Ping a host and store the result."""
+        if self._socket(socket.AF_INET) is None:
+            result = await self._async_ping_subprocess(host, count)
+        else:
+            result = await self._async_ping_icmp(host, count)
+
+        self._results[(host, count)] = (time.monotonic(), result)
+        return result
+
+    async def _async_ping_icmp(self, host: str, count: int) -> Optional[PingResult]:
+        """Ping a host through the ICMP socket of its address family."""
+        try:
+            infos = await self.hass.loop.getaddrinfo(
+                host, None, proto=socket.IPPROTO_UDP
+            )
+        except OSError as err:
+            _LOGGER.debug("Unable to resolve %s: %s", host, err)
+            return None
+
+        family, address = infos[0][0], infos[0][4][0]
+        icmp_socket = self._socket(family)
+        if icmp_socket is None:
+            return await self._async_ping_subprocess(host, count)
+
+        round_trip_times = []
+        for attempt in range(count):
+            if attempt:
+                await asyncio.sleep(ECHO_INTERVAL)
+            rtt = await icmp_socket.async_echo(address, ECHO_TIMEOUT)
+            if rtt is not None:
+                round_trip_times.append(rtt)
+        return round_trip_stats(round_trip_times)
+
+    async def _async_ping_subprocess(
+        self, host: str, count: int
+    ) -> Optional[PingResult]:
+        """Ping a host with the ping binary."""
+        async with self._subprocesses:
+            return await self._async_run_ping(host, count)
+
+    async def _async_run_ping(self, host: str, count: int) -> Optional[PingResult]:
+        """Run the ping binary."""
+        if sys.platform == "win32":
+            ping_cmd = ["ping", "-n", str(count), "-w", "1000", host]
+        else:
+            ping_cmd = ["ping", "-n", "-q", "-c", str(count), "-W1", host]
+
+        try:
+            pinger = await asyncio.create_subprocess_exec(
+                *ping_cmd,
+                stdin=None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as err:
+            _LOGGER.error("Error running command: `%s`: %s", " ".join(ping_cmd), err)
+            return None
+
+        try:
+            out_data, out_error = await asyncio.wait_for(
+                pinger.communicate(), count + PING_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.error(
+                "Timed out running command: `%s`, after: %ss",
+                " ".join(ping_cmd),
+                count + PING_TIMEOUT,
+            )
+            pinger.kill()
+            await pinger.wait()
+            return None
+
+        if out_data:
+            _LOGGER.debug(
+                "Output of command: `%s`, return code: %s:\n%s",
+                " ".join(ping_cmd),
+                pinger.returncode,
+                out_data,
+            )
+        if out_error:
+            _LOGGER.debug(
+                "Error of command: `%s`, return code: %s:\n%s",
+                " ".join(ping_cmd),
+                pinger.returncode,
+                out_error,
+            )
+
+        if pinger.returncode > 1:
+            # returncode of 1 means the host is unreachable
+            _LOGGER.error(
+                "Error running command: `%s`, return code: %s",
+                " ".join(ping_cmd),
+                pinger.returncode,
+            )
+
+        return parse_ping_output(out_data)
+
+
+@callback
+def async_get_ping_engine(hass) -> PingEngine:
+    """Return the ping engine shared by the ping platforms."""
+    data = hass.data.setdefault(DOMAIN, {})
+    engine = data.get(PING_ENGINE)
+    if engine is None:
+        engine = data[PING_ENGINE] = PingEngine(hass)
+
+        @callback
+        def close_engine(event):
+            """Close the sockets of the engine."""
+            engine.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, close_engine)
+    return engine
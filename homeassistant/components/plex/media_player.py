@@ -559,7 +559,7 @@ class PlexMediaPlayer(MediaPlayerEntity):
         """Get media image from Plex server."""
         image_url = self.plex_server.thumbnail_cache.get(media_content_id)
         if image_url:
-            result = await self._async_fetch_image(image_url)
+            result = await self._async_fetch_image_from_cache(image_url)
             return result
 
         return (None, None)
@@ -1,12 +1,14 @@
 """Support for Prometheus metrics export."""
+from functools import partial
 import logging
 import string
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
 import voluptuous as vol
 
-from homeassistant import core as hacore
 from homeassistant.components.climate.const import (
     ATTR_CURRENT_TEMPERATURE,
     ATTR_HVAC_ACTION,
@@ -24,6 +26,7 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_TEMPERATURE,
     ATTR_UNIT_OF_MEASUREMENT,
+    CONF_MODE,
     CONTENT_TYPE_TEXT_PLAIN,
     EVENT_STATE_CHANGED,
     PERCENTAGE,
@@ -32,6 +35,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
+from homeassistant.core import State, callback
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -49,6 +53,8 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+MODE_EVENT = "event"
+MODE_SCRAPE = "scrape"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -59,6 +65,9 @@ CONFIG_SCHEMA = vol.Schema(
             {
                 vol.Optional(CONF_FILTER, default={}): entityfilter.FILTER_SCHEMA,
                 vol.Optional(CONF_PROM_NAMESPACE): cv.string,
+                vol.Optional(CONF_MODE, default=MODE_EVENT): vol.In(
+                    [MODE_EVENT, MODE_SCRAPE]
+                ),
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
@@ -77,10 +86,12 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+# A sample of a metric: name, documentation, value and extra labels
+Sample = Tuple[str, str, float, Optional[Dict[str, str]]]
+
+
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -103,12 +114,30 @@ def setup(hass, config):
         default_metric,
     )
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+    if conf[CONF_MODE] == MODE_SCRAPE:
+        hass.http.register_view(PrometheusView(prometheus_client, metrics))
+        hass.bus.listen(EVENT_STATE_CHANGED, metrics.async_count_state_change)
+    else:
+        hass.http.register_view(PrometheusView(prometheus_client))
+        hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
 
+class EntityInfo(NamedTuple):
+    """Metric names and labels of an entity, resolved from its attributes."""
+
+    attributes: Dict[str, Any]
+    labels: Dict[str, Any]
+    handler: Optional[Callable[[State], Iterable[Sample]]]
+
+
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    In event mode every state change updates the prometheus_client metrics.
+    In scrape mode only the state changes are counted and the metrics are
+    generated from the state machine when Prometheus scrapes them.
+    """
 
     def __init__(
         self,
@@ -140,58 +169,189 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        self._included: Dict[str, bool] = {}
+        self._entity_info: Dict[str, EntityInfo] = {}
+        self._state_changes: Dict[str, int] = {}
+        self._automation_triggers: Dict[str, int] = {}
 
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
         state = event.data.get("new_state")
         if state is None:
+            self._entity_info.pop(event.data["entity_id"], None)
             return
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
-        if not self._filter(state.entity_id):
+        if not self._is_included(entity_id):
             return
 
-        handler = f"_handle_{domain}"
+        info = self._get_entity_info(state)
 
-        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
-            getattr(self, handler)(state)
+        for metric, documentation, value, extra_labels in self._samples(state, info):
+            labels = info.labels
+            if extra_labels:
+                labels = {**labels, **extra_labels}
+            self._metric(
+                metric, self.prometheus_cli.Gauge, documentation, extra_labels
+            ).labels(**labels).set(value)
 
-        labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        state_change.labels(**info.labels).inc()
+
+        if state.domain == "automation" and state.state != STATE_UNAVAILABLE:
+            automation_triggered = self._metric(
+                "automation_triggered_count",
+                self.prometheus_cli.Counter,
+                "Count of times an automation has been triggered",
+            )
+            automation_triggered.labels(**info.labels).inc()
+
+    @callback
+    def async_count_state_change(self, event):
+        """Count a state change of an entity for scrape mode."""
+        entity_id = event.data["entity_id"]
+        state = event.data.get("new_state")
+
+        if state is None:
+            self._included.pop(entity_id, None)
+            self._entity_info.pop(entity_id, None)
+            self._state_changes.pop(entity_id, None)
+            self._automation_triggers.pop(entity_id, None)
+            return
+
+        if not self._is_included(entity_id):
+            return
+
+        self._state_changes[entity_id] = self._state_changes.get(entity_id, 0) + 1
 
-        entity_available = self._metric(
+        if state.domain == "automation" and state.state != STATE_UNAVAILABLE:
+            self._automation_triggers[entity_id] = (
+                self._automation_triggers.get(entity_id, 0) + 1
+            )
+
+    @callback
+    def async_snapshot(self, hass):
+        """Return the entities and counters to generate the metrics from.
+
+        Metric names and labels are resolved in the event loop, the metrics
+        are generated from the snapshot in the executor.
+        """
+        entities = [
+            (state, self._get_entity_info(state))
+            for state in hass.states.async_all()
+            if self._is_included(state.entity_id)
+        ]
+        return entities, dict(self._state_changes), dict(self._automation_triggers)
+
+    def generate_latest(self, entities, state_changes, automation_triggers):
+        """Generate the text exposition of a snapshot."""
+        families = {}
+
+        def add_sample(factory, metric, documentation, labels, value):
+            if metric not in families:
+                families[metric] = (
+                    factory(
+                        self._sanitize_metric_name(f"{self.metrics_prefix}{metric}"),
+                        documentation,
+                        labels=list(labels),
+                    ),
+                    list(labels),
+                )
+            family, label_names = families[metric]
+            family.add_metric([str(labels[name]) for name in label_names], value)
+
+        for state, info in entities:
+            for metric, documentation, value, extra_labels in self._samples(
+                state, info
+            ):
+                labels = info.labels
+                if extra_labels:
+                    labels = {**labels, **extra_labels}
+                add_sample(GaugeMetricFamily, metric, documentation, labels, value)
+
+            count = state_changes.get(state.entity_id)
+            if count is not None:
+                add_sample(
+                    CounterMetricFamily,
+                    "state_change",
+                    "The number of state changes",
+                    info.labels,
+                    count,
+                )
+
+            count = automation_triggers.get(state.entity_id)
+            if count is not None:
+                add_sample(
+                    CounterMetricFamily,
+                    "automation_triggered_count",
+                    "Count of times an automation has been triggered",
+                    info.labels,
+                    count,
+                )
+
+        snapshot = _MetricFamilies([family for family, _ in families.values()])
+        return self.prometheus_cli.generate_latest(
+            self.prometheus_cli.REGISTRY
+        ) + self.prometheus_cli.generate_latest(snapshot)
+
+    def _is_included(self, entity_id: str) -> bool:
+        """Return if an entity passes the filter."""
+        included = self._included.get(entity_id)
+        if included is None:
+            included = self._included[entity_id] = self._filter(entity_id)
+        return included
+
+    def _get_entity_info(self, state: State) -> EntityInfo:
+        """Return the metric names and labels of an entity."""
+        info = self._entity_info.get(state.entity_id)
+        if info is not None and info.attributes == state.attributes:
+            return info
+
+        if state.domain == "sensor":
+            handler = self._sensor_handler(state)
+        else:
+            handler = getattr(self, f"_handle_{state.domain}", None)
+
+        info = self._entity_info[state.entity_id] = EntityInfo(
+            state.attributes, self._labels(state), handler
+        )
+        return info
+
+    @staticmethod
+    def _samples(state: State, info: EntityInfo) -> Iterable[Sample]:
+        """Return the samples of an entity."""
+        if info.handler is not None and state.state != STATE_UNAVAILABLE:
+            yield from info.handler(state)
+
+        yield (
             "entity_available",
-            self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable state)",
+            float(state.state != STATE_UNAVAILABLE),
+            None,
         )
-        entity_available.labels(**labels).set(float(state.state != STATE_UNAVAILABLE))
-
-        last_updated_time_seconds = self._metric(
+        yield (
             "last_updated_time_seconds",
-            self.prometheus_cli.Gauge,
             "The last_updated timestamp",
+            state.last_updated.timestamp(),
+            None,
         )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
-            metric = self._metric(
-                f"{state.domain}_attr_{key.lower()}",
-                self.prometheus_cli.Gauge,
-                f"{key} attribute of {state.domain} entity",
-            )
-
             try:
                 value = float(value)
-                metric.labels(**self._labels(state)).set(value)
             except (ValueError, TypeError):
-                pass
+                continue
+            yield (
+                f"{state.domain}_attr_{key.lower()}",
+                f"{key} attribute of {state.domain} entity",
+                value,
+                None,
+            )
 
     def _metric(self, metric, factory, documentation, extra_labels=None):
         labels = ["entity", "friendly_name", "domain"]
@@ -241,145 +401,126 @@ class PrometheusMetrics:
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
-            metric = self._metric(
-                "battery_level_percent",
-                self.prometheus_cli.Gauge,
-                "Battery level as a percentage of its capacity",
-            )
             try:
                 value = float(state.attributes[ATTR_BATTERY_LEVEL])
-                metric.labels(**self._labels(state)).set(value)
             except ValueError:
-                pass
+                return
+            yield (
+                "battery_level_percent",
+                "Battery level as a percentage of its capacity",
+                value,
+                None,
+            )
 
     def _handle_binary_sensor(self, state):
-        metric = self._metric(
+        yield (
             "binary_sensor_state",
-            self.prometheus_cli.Gauge,
             "State of the binary sensor (0/1)",
+            self.state_as_number(state),
+            None,
         )
-        value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
 
     def _handle_input_boolean(self, state):
-        metric = self._metric(
+        yield (
             "input_boolean_state",
-            self.prometheus_cli.Gauge,
             "State of the input boolean (0/1)",
+            self.state_as_number(state),
+            None,
         )
-        value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
 
     def _handle_device_tracker(self, state):
-        metric = self._metric(
+        yield (
             "device_tracker_state",
-            self.prometheus_cli.Gauge,
             "State of the device tracker (0/1)",
+            self.state_as_number(state),
+            None,
         )
-        value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
 
     def _handle_person(self, state):
-        metric = self._metric(
-            "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
+        yield (
+            "person_state",
+            "State of the person (0/1)",
+            self.state_as_number(state),
+            None,
         )
-        value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
 
     def _handle_light(self, state):
-        metric = self._metric(
-            "light_state", self.prometheus_cli.Gauge, "Load level of a light (0..1)"
-        )
-
         try:
             if "brightness" in state.attributes and state.state == STATE_ON:
                 value = state.attributes["brightness"] / 255.0
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
         except ValueError:
-            pass
+            return
+        yield ("light_state", "Load level of a light (0..1)", value, None)
 
     def _handle_lock(self, state):
-        metric = self._metric(
-            "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
+        yield (
+            "lock_state",
+            "State of the lock (0/1)",
+            self.state_as_number(state),
+            None,
         )
-        value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
 
     def _handle_climate(self, state):
         temp = state.attributes.get(ATTR_TEMPERATURE)
         if temp:
             if self._climate_units == TEMP_FAHRENHEIT:
                 temp = fahrenheit_to_celsius(temp)
-            metric = self._metric(
-                "temperature_c",
-                self.prometheus_cli.Gauge,
-                "Temperature in degrees Celsius",
-            )
-            metric.labels(**self._labels(state)).set(temp)
+            yield ("temperature_c", "Temperature in degrees Celsius", temp, None)
 
         current_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         if current_temp:
             if self._climate_units == TEMP_FAHRENHEIT:
                 current_temp = fahrenheit_to_celsius(current_temp)
-            metric = self._metric(
+            yield (
                 "current_temperature_c",
-                self.prometheus_cli.Gauge,
                 "Current Temperature in degrees Celsius",
+                current_temp,
+                None,
             )
-            metric.labels(**self._labels(state)).set(current_temp)
 
         current_action = state.attributes.get(ATTR_HVAC_ACTION)
         if current_action:
-            metric = self._metric(
-                "climate_action",
-                self.prometheus_cli.Gauge,
-                "HVAC action",
-                ["action"],
-            )
             for action in CURRENT_HVAC_ACTIONS:
-                metric.labels(**dict(self._labels(state), action=action)).set(
-                    float(action == current_action)
+                yield (
+                    "climate_action",
+                    "HVAC action",
+                    float(action == current_action),
+                    {"action": action},
                 )
 
     def _handle_humidifier(self, state):
         humidifier_target_humidity_percent = state.attributes.get(ATTR_HUMIDITY)
         if humidifier_target_humidity_percent:
-            metric = self._metric(
+            yield (
                 "humidifier_target_humidity_percent",
-                self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
+                humidifier_target_humidity_percent,
+                None,
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
 
-        metric = self._metric(
+        yield (
             "humidifier_state",
-            self.prometheus_cli.Gauge,
             "State of the humidifier (0/1)",
+            self.state_as_number(state),
+            None,
         )
-        try:
-            value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
-        except ValueError:
-            pass
 
         current_mode = state.attributes.get(ATTR_MODE)
         available_modes = state.attributes.get(ATTR_AVAILABLE_MODES)
         if current_mode and available_modes:
-            metric = self._metric(
-                "humidifier_mode",
-                self.prometheus_cli.Gauge,
-                "Humidifier Mode",
-                ["mode"],
-            )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
+                yield (
+                    "humidifier_mode",
+                    "Humidifier Mode",
+                    float(mode == current_mode),
+                    {"mode": mode},
                 )
 
-    def _handle_sensor(self, state):
+    def _sensor_handler(self, state):
+        """Return the handler of a sensor with its metric name resolved."""
         unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
 
         for metric_handler in self._sensor_metric_handlers:
@@ -387,20 +528,20 @@ class PrometheusMetrics:
             if metric is not None:
                 break
 
-        if metric is not None:
-            _metric = self._metric(
-                metric, self.prometheus_cli.Gauge, f"Sensor data measured in {unit}"
-            )
+        return partial(self._handle_sensor, metric, unit)
 
+    def _handle_sensor(self, metric, unit, state):
+        if metric is not None:
             try:
                 value = self.state_as_number(state)
                 if unit == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
             except ValueError:
                 pass
+            else:
+                yield (metric, f"Sensor data measured in {unit}", value, None)
 
-        self._battery(state)
+        yield from self._battery(state)
 
     def _sensor_default_metric(self, state, unit):
         """Get default metric."""
@@ -448,29 +589,29 @@ class PrometheusMetrics:
         return units.get(unit, default)
 
     def _handle_switch(self, state):
-        metric = self._metric(
-            "switch_state", self.prometheus_cli.Gauge, "State of the switch (0/1)"
+        yield (
+            "switch_state",
+            "State of the switch (0/1)",
+            self.state_as_number(state),
+            None,
         )
 
-        try:
-            value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
-        except ValueError:
-            pass
-
-        self._handle_attributes(state)
+        yield from self._handle_attributes(state)
 
     def _handle_zwave(self, state):
-        self._battery(state)
+        yield from self._battery(state)
 
-    def _handle_automation(self, state):
-        metric = self._metric(
-            "automation_triggered_count",
-            self.prometheus_cli.Counter,
-            "Count of times an automation has been triggered",
-        )
 
-        metric.labels(**self._labels(state)).inc()
+class _MetricFamilies:
+    """Collector of metric families generated from a snapshot."""
+
+    def __init__(self, families):
+        """Initialize the collector."""
+        self._families = families
+
+    def collect(self):
+        """Return the metric families."""
+        return self._families
 
 
 class PrometheusView(HomeAssistantView):
@@ -479,15 +620,26 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics=None):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
+        hass = request.app["hass"]
+
+        if self.metrics is None:
+            body = await hass.async_add_executor_job(
+                self.prometheus_cli.generate_latest
+            )
+        else:
+            body = await hass.async_add_executor_job(
+                self.metrics.generate_latest, *self.metrics.async_snapshot(hass)
+            )
 
         return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+            body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
@@ -1,5 +1,4 @@
 """Support for RESTful binary sensors."""
-import httpx
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import (
@@ -31,7 +30,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.reload import async_setup_reload_service
 
 from . import DOMAIN, PLATFORMS
-from .data import DEFAULT_TIMEOUT, RestData
+from .data import DEFAULT_TIMEOUT, RestData, async_get_rest_data, create_auth
 
 DEFAULT_METHOD = "GET"
 DEFAULT_NAME = "REST Binary Sensor"
@@ -92,17 +91,32 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     if value_template is not None:
         value_template.hass = hass
 
-    if username and password:
-        if config.get(CONF_AUTHENTICATION) == HTTP_DIGEST_AUTHENTICATION:
-            auth = httpx.DigestAuth(username, password)
-        else:
-            auth = (username, password)
+    if resource_template is not None:
+        rest = RestData(
+            hass,
+            method,
+            resource,
+            create_auth(config.get(CONF_AUTHENTICATION), username, password),
+            headers,
+            params,
+            payload,
+            verify_ssl,
+            timeout,
+        )
     else:
-        auth = None
-
-    rest = RestData(
-        hass, method, resource, auth, headers, params, payload, verify_ssl, timeout
-    )
+        rest = async_get_rest_data(
+            hass,
+            method,
+            resource,
+            config.get(CONF_AUTHENTICATION),
+            username,
+            password,
+            headers,
+            params,
+            payload,
+            verify_ssl,
+            timeout,
+        )
     await rest.async_update()
 
     if rest.data is None:
@@ -172,7 +186,7 @@ class RestBinarySensor(BinarySensorEntity):
 
         if self._value_template is not None:
             response = self._value_template.async_render_with_possible_json_value(
-                self.rest.data, False
+                self.rest.data, False, self.rest.variables
             )
 
         try:
@@ -192,4 +206,6 @@ class RestBinarySensor(BinarySensorEntity):
         if self._resource_template is not None:
             self.rest.set_url(self._resource_template.async_render(parse_result=False))
 
-        await self.rest.async_update()
+        await self.rest.async_update(
+            self.platform.scan_interval.total_seconds() / 2, self
+        )
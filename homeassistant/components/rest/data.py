@@ -1,15 +1,79 @@
 """Support for RESTful API."""
+import asyncio
+import json
 import logging
+from weakref import WeakValueDictionary
 
 import httpx
 
+from homeassistant.const import HTTP_DIGEST_AUTHENTICATION, HTTP_NOT_MODIFIED
+from homeassistant.core import callback
 from homeassistant.helpers.httpx_client import get_async_client
+import homeassistant.util.dt as dt_util
 
+DATA_REST_DATA = "rest_data"
 DEFAULT_TIMEOUT = 10
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def create_auth(authentication, username, password):
+    """Return the httpx authentication for a configuration."""
+    if not username or not password:
+        return None
+    if authentication == HTTP_DIGEST_AUTHENTICATION:
+        return httpx.DigestAuth(username, password)
+    return (username, password)
+
+
+@callback
+def async_get_rest_data(
+    hass,
+    method,
+    resource,
+    authentication,
+    username,
+    password,
+    headers,
+    params,
+    data,
+    verify_ssl,
+    timeout=DEFAULT_TIMEOUT,
+):
+    """Return the data of a resource, shared by the entities polling it.
+
+    Entities configured with the same request share one data object, so the
+    resource is fetched once per scan interval however many entities read it.
+    """
+    key = (
+        method,
+        resource,
+        authentication,
+        username,
+        password,
+        tuple(sorted((headers or {}).items())),
+        tuple(sorted((params or {}).items())),
+        data,
+        verify_ssl,
+        timeout,
+    )
+    shared = hass.data.setdefault(DATA_REST_DATA, WeakValueDictionary())
+    rest = shared.get(key)
+    if rest is None:
+        rest = shared[key] = RestData(
+            hass,
+            method,
+            resource,
+            create_auth(authentication, username, password),
+            headers,
+            params,
+            data,
+            verify_ssl,
+            timeout,
+        )
+    return rest
+
+
 class RestData:
     """Class for handling the data retrieval."""
 
@@ -36,15 +100,72 @@ class RestData:
         self._timeout = timeout
         self._verify_ssl = verify_ssl
         self._async_client = None
+        self._lock = asyncio.Lock()
+        self._last_update = None
+        self._last_requester = None
+        # Validators of the last response for conditional requests
+        self._etag = None
+        self._last_modified = None
+        self._variables = None
         self.data = None
         self.headers = None
 
     def set_url(self, url):
         """Set url."""
+        if url != self._resource:
+            self._etag = self._last_modified = None
         self._resource = url
 
-    async def async_update(self):
-        """Get the latest data from REST service with provided method."""
+    @property
+    def variables(self):
+        """Return the template variables of the data.
+
+        The data is parsed as JSON once per response, instead of once for
+        every template rendered with it.
+        """
+        if self._variables is None:
+            self._variables = {}
+            try:
+                self._variables["value_json"] = json.loads(self.data)
+            except (ValueError, TypeError):
+                pass
+        return self._variables
+
+    def _conditional_headers(self):
+        """Return the request headers, with the validators of the last response."""
+        if self._method != "GET" or (
+            self._etag is None and self._last_modified is None
+        ):
+            return self._headers
+
+        headers = dict(self._headers or {})
+        if self._etag is not None:
+            headers.setdefault("If-None-Match", self._etag)
+        if self._last_modified is not None:
+            headers.setdefault("If-Modified-Since", self._last_modified)
+        return headers
+
+    async def async_update(self, max_age=0, requester=None):
+        """Get the latest data from REST service with provided method.
+
+        An update requested by an entity is skipped if another entity sharing
+        the data updated it less than max_age seconds ago.
+        """
+        async with self._lock:
+            if (
+                max_age
+                and self._last_update is not None
+                and self._last_requester is not requester
+                and (dt_util.utcnow() - self._last_update).total_seconds() < max_age
+            ):
+                return
+
+            await self._async_fetch()
+            self._last_update = dt_util.utcnow()
+            self._last_requester = requester
+
+    async def _async_fetch(self):
+        """Fetch the resource, keeping the data if it was not modified."""
         if not self._async_client:
             self._async_client = get_async_client(
                 self._hass, verify_ssl=self._verify_ssl
@@ -55,15 +176,26 @@ class RestData:
             response = await self._async_client.request(
                 self._method,
                 self._resource,
-                headers=self._headers,
+                headers=self._conditional_headers(),
                 params=self._params,
                 auth=self._auth,
                 data=self._request_data,
                 timeout=self._timeout,
             )
-            self.data = response.text
-            self.headers = response.headers
         except httpx.RequestError as ex:
             _LOGGER.error("Error fetching data: %s failed with %s", self._resource, ex)
             self.data = None
             self.headers = None
+            self._etag = self._last_modified = None
+            self._variables = None
+            return
+
+        if response.status_code == HTTP_NOT_MODIFIED and self.data is not None:
+            _LOGGER.debug("%s was not modified", self._resource)
+            return
+
+        self.data = response.text
+        self.headers = response.headers
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._variables = None
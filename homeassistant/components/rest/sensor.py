@@ -3,7 +3,6 @@ import json
 import logging
 from xml.parsers.expat import ExpatError
 
-import httpx
 from jsonpath import jsonpath
 import voluptuous as vol
 import xmltodict
@@ -35,7 +34,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.reload import async_setup_reload_service
 
 from . import DOMAIN, PLATFORMS
-from .data import DEFAULT_TIMEOUT, RestData
+from .data import DEFAULT_TIMEOUT, RestData, async_get_rest_data, create_auth
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -108,16 +107,32 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         resource_template.hass = hass
         resource = resource_template.async_render(parse_result=False)
 
-    if username and password:
-        if config.get(CONF_AUTHENTICATION) == HTTP_DIGEST_AUTHENTICATION:
-            auth = httpx.DigestAuth(username, password)
-        else:
-            auth = (username, password)
+    if resource_template is not None:
+        rest = RestData(
+            hass,
+            method,
+            resource,
+            create_auth(config.get(CONF_AUTHENTICATION), username, password),
+            headers,
+            params,
+            payload,
+            verify_ssl,
+            timeout,
+        )
     else:
-        auth = None
-    rest = RestData(
-        hass, method, resource, auth, headers, params, payload, verify_ssl, timeout
-    )
+        rest = async_get_rest_data(
+            hass,
+            method,
+            resource,
+            config.get(CONF_AUTHENTICATION),
+            username,
+            password,
+            headers,
+            params,
+            payload,
+            verify_ssl,
+            timeout,
+        )
 
     await rest.async_update()
 
@@ -209,7 +224,9 @@ class RestSensor(Entity):
         if self._resource_template is not None:
             self.rest.set_url(self._resource_template.async_render(parse_result=False))
 
-        await self.rest.async_update()
+        await self.rest.async_update(
+            self.platform.scan_interval.total_seconds() / 2, self
+        )
         self._update_from_rest_data()
 
     async def async_added_to_hass(self):
@@ -219,6 +236,7 @@ class RestSensor(Entity):
     def _update_from_rest_data(self):
         """Update state from the rest data."""
         value = self.rest.data
+        variables = self.rest.variables
         _LOGGER.debug("Data fetched from resource: %s", value)
         if self.rest.headers is not None:
             # If the http request failed, headers will be None
@@ -231,6 +249,7 @@ class RestSensor(Entity):
             ):
                 try:
                     value = json.dumps(xmltodict.parse(value))
+                    variables = None
                     _LOGGER.debug("JSON converted from XML: %s", value)
                 except ExpatError:
                     _LOGGER.warning(
@@ -242,7 +261,12 @@ class RestSensor(Entity):
             self._attributes = {}
             if value:
                 try:
-                    json_dict = json.loads(value)
+                    if variables is None:
+                        json_dict = json.loads(value)
+                    elif "value_json" in variables:
+                        json_dict = variables["value_json"]
+                    else:
+                        raise ValueError
                     if self._json_attrs_path is not None:
                         json_dict = jsonpath(json_dict, self._json_attrs_path)
                     # jsonpath will always store the result in json_dict[0]
@@ -269,7 +293,7 @@ class RestSensor(Entity):
 
         if value is not None and self._value_template is not None:
             value = self._value_template.async_render_with_possible_json_value(
-                value, None
+                value, None, variables
             )
 
         self._state = value
@@ -244,7 +244,7 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
         """Fetch media browser image to serve via proxy."""
         if media_content_type == MEDIA_TYPE_APP and media_content_id:
             image_url = self.coordinator.roku.app_icon_url(media_content_id)
-            return await self._async_fetch_image(image_url)
+            return await self._async_fetch_image_from_cache(image_url)
 
         return (None, None)
 
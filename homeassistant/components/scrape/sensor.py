@@ -2,10 +2,9 @@
 import logging
 
 from bs4 import BeautifulSoup
-from requests.auth import HTTPBasicAuth, HTTPDigestAuth
 import voluptuous as vol
 
-from homeassistant.components.rest.data import RestData
+from homeassistant.components.rest.data import async_get_rest_data
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     CONF_AUTHENTICATION,
@@ -71,14 +70,18 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     if value_template is not None:
         value_template.hass = hass
 
-    if username and password:
-        if config.get(CONF_AUTHENTICATION) == HTTP_DIGEST_AUTHENTICATION:
-            auth = HTTPDigestAuth(username, password)
-        else:
-            auth = HTTPBasicAuth(username, password)
-    else:
-        auth = None
-    rest = RestData(hass, method, resource, auth, headers, None, payload, verify_ssl)
+    rest = async_get_rest_data(
+        hass,
+        method,
+        resource,
+        config.get(CONF_AUTHENTICATION),
+        username,
+        password,
+        headers,
+        None,
+        payload,
+        verify_ssl,
+    )
     await rest.async_update()
 
     if rest.data is None:
@@ -136,7 +139,9 @@ class ScrapeSensor(Entity):
 
     async def async_update(self):
         """Get the latest data from the source and updates the state."""
-        await self.rest.async_update()
+        await self.rest.async_update(
+            self.platform.scan_interval.total_seconds() / 2, self
+        )
         await self._async_update_from_rest_data()
 
     async def async_added_to_hass(self):
@@ -24,6 +24,12 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    REFERENCE_AREA,
+    REFERENCE_DEVICE,
+    REFERENCE_ENTITY,
+    async_get_reference_index,
+)
 from homeassistant.helpers.script import (
     ATTR_CUR,
     ATTR_MAX,
@@ -94,13 +100,9 @@ def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referencing(
+        REFERENCE_ENTITY, entity_id
+    )
 
 
 @callback
@@ -125,13 +127,9 @@ def scripts_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referencing(
+        REFERENCE_DEVICE, device_id
+    )
 
 
 @callback
@@ -150,6 +148,33 @@ def devices_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
     return list(script_entity.script.referenced_devices)
 
 
+@callback
+def scripts_with_area(hass: HomeAssistant, area_id: str) -> List[str]:
+    """Return all scripts that reference the area."""
+    if DOMAIN not in hass.data:
+        return []
+
+    return async_get_reference_index(hass, DOMAIN).async_referencing(
+        REFERENCE_AREA, area_id
+    )
+
+
+@callback
+def areas_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
+    """Return all areas in script."""
+    if DOMAIN not in hass.data:
+        return []
+
+    component = hass.data[DOMAIN]
+
+    script_entity = component.get_entity(entity_id)
+
+    if script_entity is None:
+        return []
+
+    return list(script_entity.script.referenced_areas)
+
+
 async def async_setup(hass, config):
     """Load the scripts from the configuration."""
     hass.data[DOMAIN] = component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -331,8 +356,18 @@ class ScriptEntity(ToggleEntity):
         """Turn script off."""
         await self.script.async_stop()
 
+    async def async_added_to_hass(self):
+        """Index the references of the script."""
+        async_get_reference_index(self.hass, DOMAIN).async_add(
+            self.entity_id,
+            self.script.referenced_entities,
+            self.script.referenced_devices,
+            self.script.referenced_areas,
+        )
+
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        async_get_reference_index(self.hass, DOMAIN).async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
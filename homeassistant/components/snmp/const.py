@@ -19,6 +19,10 @@ DEFAULT_PRIV_PROTOCOL = "none"
 DEFAULT_VERSION = "1"
 DEFAULT_VARTYPE = "none"
 
+DATA_SNMP_AGENTS = "snmp_agents"
+# Variable bindings in a request, fewer are sent to agents answering tooBig
+MAX_VARBINDS = 24
+
 SNMP_VERSIONS = {"1": 0, "2c": 1, "3": None}
 
 MAP_AUTH_PROTOCOLS = {
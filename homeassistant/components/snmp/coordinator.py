@@ -0,0 +1,110 @@
+"""Poll the OIDs read from an SNMP agent in shared requests."""
+from datetime import timedelta
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+from pysnmp.hlapi.asyncio import ObjectIdentity, ObjectType, getCmd
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import MAX_VARBINDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OidResult(NamedTuple):
+    """Result of reading an OID."""
+
+    errindication: Optional[str]
+    errstatus: Optional[str]
+    value: Optional[str]
+
+
+class SnmpAgentCoordinator(DataUpdateCoordinator):
+    """Read all the OIDs of the sensors of an agent every scan interval.
+
+    The OIDs are read with GET requests of as many variable bindings as the
+    agent accepts, instead of one request for every sensor.
+    """
+
+    def __init__(self, hass, name, request_args):
+        """Initialize the coordinator."""
+        super().__init__(hass, _LOGGER, name=name)
+        self._request_args = request_args
+        self._max_varbinds = MAX_VARBINDS
+        # Scan intervals of the sensors reading each OID
+        self._oids: Dict[str, List[timedelta]] = {}
+        self.data: Dict[str, OidResult] = {}
+
+    @callback
+    def async_add_oid(self, oid: str, scan_interval: timedelta) -> CALLBACK_TYPE:
+        """Read an OID every scan interval, return a callback to stop."""
+        self._oids.setdefault(oid, []).append(scan_interval)
+        self._update_interval()
+
+        @callback
+        def remove_oid() -> None:
+            """Stop reading the OID."""
+            intervals = self._oids[oid]
+            intervals.remove(scan_interval)
+            if not intervals:
+                del self._oids[oid]
+                self.data.pop(oid, None)
+            self._update_interval()
+
+        return remove_oid
+
+    def _update_interval(self) -> None:
+        """Poll as often as the sensor with the shortest scan interval."""
+        intervals = [min(intervals) for intervals in self._oids.values()]
+        self.update_interval = min(intervals) if intervals else None
+
+    async def _async_update_data(self) -> Dict[str, OidResult]:
+        """Read all the OIDs of the sensors."""
+        return await self.async_get(list(self._oids))
+
+    async def async_get(self, oids: List[str]) -> Dict[str, OidResult]:
+        """Read OIDs with as few requests as possible."""
+        results = {}
+        pending = list(oids)
+        while pending:
+            chunk = pending[: self._max_varbinds]
+            errindication, errstatus, errindex, varbinds = await getCmd(
+                *self._request_args,
+                *(ObjectType(ObjectIdentity(oid)) for oid in chunk),
+            )
+
+            if errindication:
+                for oid in chunk:
+                    results[oid] = OidResult(str(errindication), None, None)
+
+            elif errstatus and errstatus.prettyPrint() == "tooBig" and len(chunk) > 1:
+                # Retry with smaller requests from now on
+                self._max_varbinds = max(1, len(chunk) // 2)
+                continue
+
+            elif errstatus:
+                index = int(errindex) - 1
+                if 0 <= index < len(chunk) and len(chunk) > 1:
+                    # An SNMPv1 agent fails the request for a single OID,
+                    # read the other OIDs again without it
+                    oid = chunk[index]
+                    results[oid] = OidResult(
+                        None, f"{errstatus.prettyPrint()} at {oid}", None
+                    )
+                    pending.remove(oid)
+                    continue
+
+                for oid in chunk:
+                    results[oid] = OidResult(
+                        None, f"{errstatus.prettyPrint()} at {oid}", None
+                    )
+
+            else:
+                for oid, varbind in zip(chunk, varbinds):
+                    results[oid] = OidResult(None, None, str(varbind[-1]))
+
+            del pending[: len(chunk)]
+
+        return results
@@ -6,12 +6,9 @@ import pysnmp.hlapi.asyncio as hlapi
 from pysnmp.hlapi.asyncio import (
     CommunityData,
     ContextData,
-    ObjectIdentity,
-    ObjectType,
     SnmpEngine,
     UdpTransportTarget,
     UsmUserData,
-    getCmd,
 )
 import voluptuous as vol
 
@@ -20,13 +17,15 @@ from homeassistant.const import (
     CONF_HOST,
     CONF_NAME,
     CONF_PORT,
+    CONF_SCAN_INTERVAL,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_USERNAME,
     CONF_VALUE_TEMPLATE,
     STATE_UNKNOWN,
 )
+from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_ACCEPT_ERRORS,
@@ -38,6 +37,7 @@ from .const import (
     CONF_PRIV_KEY,
     CONF_PRIV_PROTOCOL,
     CONF_VERSION,
+    DATA_SNMP_AGENTS,
     DEFAULT_AUTH_PROTOCOL,
     DEFAULT_COMMUNITY,
     DEFAULT_HOST,
@@ -49,6 +49,7 @@ from .const import (
     MAP_PRIV_PROTOCOLS,
     SNMP_VERSIONS,
 )
+from .coordinator import SnmpAgentCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -96,59 +97,84 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     accept_errors = config.get(CONF_ACCEPT_ERRORS)
     default_value = config.get(CONF_DEFAULT_VALUE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    scan_interval = config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL)
 
     if value_template is not None:
         value_template.hass = hass
 
+    # Sensors reading from the same agent share a coordinator
+    agents = hass.data.setdefault(DATA_SNMP_AGENTS, {})
     if version == "3":
-
-        if not authkey:
-            authproto = "none"
-        if not privkey:
-            privproto = "none"
-
-        request_args = [
-            SnmpEngine(),
-            UsmUserData(
-                username,
-                authKey=authkey or None,
-                privKey=privkey or None,
-                authProtocol=getattr(hlapi, MAP_AUTH_PROTOCOLS[authproto]),
-                privProtocol=getattr(hlapi, MAP_PRIV_PROTOCOLS[privproto]),
-            ),
-            UdpTransportTarget((host, port)),
-            ContextData(),
-        ]
+        agent = (host, port, version, username, authkey, authproto, privkey, privproto)
     else:
-        request_args = [
-            SnmpEngine(),
-            CommunityData(community, mpModel=SNMP_VERSIONS[version]),
-            UdpTransportTarget((host, port)),
-            ContextData(),
-        ]
-
-    errindication, _, _, _ = await getCmd(
-        *request_args, ObjectType(ObjectIdentity(baseoid))
-    )
+        agent = (host, port, version, community)
+
+    coordinator = agents.get(agent)
+    if coordinator is None:
+        if version == "3":
+
+            if not authkey:
+                authproto = "none"
+            if not privkey:
+                privproto = "none"
+
+            request_args = [
+                SnmpEngine(),
+                UsmUserData(
+                    username,
+                    authKey=authkey or None,
+                    privKey=privkey or None,
+                    authProtocol=getattr(hlapi, MAP_AUTH_PROTOCOLS[authproto]),
+                    privProtocol=getattr(hlapi, MAP_PRIV_PROTOCOLS[privproto]),
+                ),
+                UdpTransportTarget((host, port)),
+                ContextData(),
+            ]
+        else:
+            request_args = [
+                SnmpEngine(),
+                CommunityData(community, mpModel=SNMP_VERSIONS[version]),
+                UdpTransportTarget((host, port)),
+                ContextData(),
+            ]
+
+        coordinator = agents[agent] = SnmpAgentCoordinator(
+            hass, f"{host}:{port}", request_args
+        )
+
+    result = (await coordinator.async_get([baseoid]))[baseoid]
 
-    if errindication and not accept_errors:
+    if result.errindication and not accept_errors:
         _LOGGER.error("Please check the details in the configuration file")
         return
 
-    data = SnmpData(request_args, baseoid, accept_errors, default_value)
-    async_add_entities([SnmpSensor(data, name, unit, value_template)], True)
+    coordinator.data[baseoid] = result
+    data = SnmpData(baseoid, accept_errors, default_value)
+    async_add_entities(
+        [SnmpSensor(coordinator, data, name, unit, value_template, scan_interval)]
+    )
 
 
-class SnmpSensor(Entity):
+class SnmpSensor(CoordinatorEntity):
     """Representation of a SNMP sensor."""
 
-    def __init__(self, data, name, unit_of_measurement, value_template):
+    def __init__(
+        self,
+        coordinator,
+        data,
+        name,
+        unit_of_measurement,
+        value_template,
+        scan_interval,
+    ):
         """Initialize the sensor."""
+        super().__init__(coordinator)
         self.data = data
         self._name = name
         self._state = None
         self._unit_of_measurement = unit_of_measurement
         self._value_template = value_template
+        self._scan_interval = scan_interval
 
     @property
     def name(self):
@@ -165,9 +191,31 @@ class SnmpSensor(Entity):
         """Return the unit the value is expressed in."""
         return self._unit_of_measurement
 
-    async def async_update(self):
-        """Get the latest data and updates the states."""
-        await self.data.async_update()
+    @property
+    def available(self):
+        """Return True, errors are reported through the state."""
+        return True
+
+    async def async_added_to_hass(self):
+        """Read the OID of the sensor with the other OIDs of the agent."""
+        self.async_on_remove(
+            self.coordinator.async_add_oid(self.data.baseoid, self._scan_interval)
+        )
+        await super().async_added_to_hass()
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write the state only when the value changed."""
+        if self._update_from_data():
+            self.async_write_ha_state()
+
+    @callback
+    def _update_from_data(self):
+        """Update the state from the agent data, return if it changed."""
+        result = self.coordinator.data.get(self.data.baseoid)
+        if result is not None:
+            self.data.update(result)
         value = self.data.value
 
         if value is None:
@@ -177,37 +225,28 @@ class SnmpSensor(Entity):
                 value, STATE_UNKNOWN
             )
 
+        changed = value != self._state
         self._state = value
+        return changed
 
 
 class SnmpData:
     """Get the latest data and update the states."""
 
-    def __init__(self, request_args, baseoid, accept_errors, default_value):
+    def __init__(self, baseoid, accept_errors, default_value):
         """Initialize the data object."""
-        self._request_args = request_args
-        self._baseoid = baseoid
+        self.baseoid = baseoid
         self._accept_errors = accept_errors
         self._default_value = default_value
         self.value = None
 
-    async def async_update(self):
-        """Get the latest data from the remote SNMP capable host."""
-
-        errindication, errstatus, errindex, restable = await getCmd(
-            *self._request_args, ObjectType(ObjectIdentity(self._baseoid))
-        )
-
-        if errindication and not self._accept_errors:
-            _LOGGER.error("SNMP error: %s", errindication)
-        elif errstatus and not self._accept_errors:
-            _LOGGER.error(
-                "SNMP error: %s at %s",
-                errstatus.prettyPrint(),
-                errindex and restable[-1][int(errindex) - 1] or "?",
-            )
-        elif (errindication or errstatus) and self._accept_errors:
+    def update(self, result):
+        """Update the value from the result of reading the OID."""
+        if result.errindication and not self._accept_errors:
+            _LOGGER.error("SNMP error: %s", result.errindication)
+        elif result.errstatus and not self._accept_errors:
+            _LOGGER.error("SNMP error: %s", result.errstatus)
+        elif (result.errindication or result.errstatus) and self._accept_errors:
             self.value = self._default_value
         else:
-            for resrow in restable:
-                self.value = str(resrow[-1])
+            self.value = result.value
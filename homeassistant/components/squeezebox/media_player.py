@@ -596,7 +596,7 @@ class SqueezeBoxEntity(MediaPlayerEntity):
         """Get album art from Squeezebox server."""
         if media_image_id:
             image_url = self._player.generate_image_url_from_track_id(media_image_id)
-            result = await self._async_fetch_image(image_url)
+            result = await self._async_fetch_image_from_cache(image_url)
             if result == (None, None):
                 _LOGGER.debug("Error retrieving proxied album art from %s", image_url)
             return result
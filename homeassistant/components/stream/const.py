@@ -16,6 +16,7 @@ OUTPUT_FORMATS = ["hls"]
 FORMAT_CONTENT_TYPE = {"hls": "application/vnd.apple.mpegurl"}
 
 MAX_SEGMENTS = 3  # Max number of segments to keep around
+MAX_SEGMENTS_SIZE = 32 * 1024 * 1024  # Max bytes of segments to keep per output
 MIN_SEGMENT_DURATION = 1.5  # Each segment is at least this many seconds
 
 PACKETS_TO_WAIT_FOR_AUDIO = 20  # Some streams have an audio stream with no audio
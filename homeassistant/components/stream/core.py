@@ -2,7 +2,7 @@
 import asyncio
 from collections import deque
 import io
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional, Tuple
 
 from aiohttp import web
 import attr
@@ -12,7 +12,7 @@ from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN, MAX_SEGMENTS
+from .const import ATTR_STREAMS, DOMAIN, MAX_SEGMENTS, MAX_SEGMENTS_SIZE
 
 PROVIDERS = Registry()
 
@@ -34,15 +34,29 @@ class Segment:
     sequence: int = attr.ib()
     segment: io.BytesIO = attr.ib()
     duration: float = attr.ib()
+    # Offsets of the moof and mfra boxes, filled in by outputs that need them
+    fragment_offsets: Optional[Tuple[int, int]] = attr.ib(default=None)
+
+    @property
+    def size(self) -> int:
+        """Return the size of the segment in bytes."""
+        return self.segment.getbuffer().nbytes
+
+    def view(self, start: int = 0, end: Optional[int] = None) -> memoryview:
+        """Return a view of the segment data without copying it."""
+        return self.segment.getbuffer()[start:end]
 
 
 class StreamOutput:
     """Represents a stream output."""
 
-    def __init__(self, stream, timeout: int = 300) -> None:
-        """Initialize a stream output."""
+    def __init__(
+        self, stream, timeout: int = 300, max_size: Optional[int] = MAX_SEGMENTS_SIZE
+    ) -> None:
+        """Initialize a stream output, a max_size of None keeps every segment."""
         self.idle = False
         self.timeout = timeout
+        self.max_size = max_size
         self._stream = stream
         self._cursor = None
         self._event = asyncio.Event()
@@ -135,6 +149,14 @@ class StreamOutput:
             return
 
         self._segments.append(segment)
+        # Evict the oldest segments once over the memory budget, the newest
+        # segment is always kept
+        while (
+            self.max_size is not None
+            and len(self._segments) > 1
+            and sum(s.size for s in self._segments) > self.max_size
+        ):
+            self._segments.popleft()
         self._event.set()
         self._event.clear()
 
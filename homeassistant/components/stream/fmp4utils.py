@@ -1,5 +1,6 @@
 """Utilities to help convert mp4s to fmp4s."""
 import io
+from typing import Tuple
 
 
 def find_box(segment: io.BytesIO, target_type: bytes, box_start: int = 0) -> int:
@@ -23,19 +24,15 @@ def find_box(segment: io.BytesIO, target_type: bytes, box_start: int = 0) -> int
         index += int.from_bytes(box_header[0:4], byteorder="big")
 
 
-def get_init(segment: io.BytesIO) -> bytes:
-    """Get init section from fragmented mp4."""
-    moof_location = next(find_box(segment, b"moof"))
-    segment.seek(0)
-    return segment.read(moof_location)
-
+def get_fragment_offsets(segment: io.BytesIO) -> Tuple[int, int]:
+    """Get the offsets of the moof and mfra boxes of a fragmented mp4.
 
-def get_m4s(segment: io.BytesIO, sequence: int) -> bytes:
-    """Get m4s section from fragmented mp4."""
+    The init section spans up to the moof box, the m4s section from the moof
+    box up to the mfra box.
+    """
     moof_location = next(find_box(segment, b"moof"))
     mfra_location = next(find_box(segment, b"mfra"))
-    segment.seek(moof_location)
-    return segment.read(mfra_location - moof_location)
+    return moof_location, mfra_location
 
 
 def get_codec_string(segment: io.BytesIO) -> str:
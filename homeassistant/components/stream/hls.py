@@ -1,5 +1,4 @@
 """Provide functionality to stream HLS."""
-import io
 from typing import Callable
 
 from aiohttp import web
@@ -7,8 +6,8 @@ from aiohttp import web
 from homeassistant.core import callback
 
 from .const import FORMAT_CONTENT_TYPE
-from .core import PROVIDERS, StreamOutput, StreamView
-from .fmp4utils import get_codec_string, get_init, get_m4s
+from .core import PROVIDERS, Segment, StreamOutput, StreamView
+from .fmp4utils import get_codec_string, get_fragment_offsets
 
 
 @callback
@@ -35,9 +34,7 @@ class HlsMasterPlaylistView(StreamView):
         # Calculate file size / duration and use a small multiplier to account for variation
         # hls spec already allows for 25% variation
         segment = track.get_segment(track.segments[-1])
-        bandwidth = round(
-            segment.segment.seek(0, io.SEEK_END) * 8 / segment.duration * 1.2
-        )
+        bandwidth = round(segment.size * 8 / segment.duration * 1.2)
         codecs = get_codec_string(segment.segment)
         lines = [
             "#EXTM3U",
@@ -123,8 +120,10 @@ class HlsInitView(StreamView):
         segments = track.get_segment()
         if not segments:
             return web.HTTPNotFound()
+        segment = segments[0]
+        moof_location, _ = segment.fragment_offsets
         headers = {"Content-Type": "video/mp4"}
-        return web.Response(body=get_init(segments[0].segment), headers=headers)
+        return web.Response(body=segment.view(end=moof_location), headers=headers)
 
 
 class HlsSegmentView(StreamView):
@@ -140,9 +139,10 @@ class HlsSegmentView(StreamView):
         segment = track.get_segment(int(sequence))
         if not segment:
             return web.HTTPNotFound()
+        moof_location, mfra_location = segment.fragment_offsets
         headers = {"Content-Type": "video/iso.segment"}
         return web.Response(
-            body=get_m4s(segment.segment, int(sequence)),
+            body=segment.view(moof_location, mfra_location),
             headers=headers,
         )
 
@@ -180,3 +180,10 @@ class HlsStreamOutput(StreamOutput):
             "avoid_negative_ts": "make_non_negative",
             "fragment_index": str(sequence),
         }
+
+    @callback
+    def put(self, segment: Segment) -> None:
+        """Store output, locating the fmp4 sections once for all requests."""
+        if segment is not None and segment.fragment_offsets is None:
+            segment.fragment_offsets = get_fragment_offsets(segment.segment)
+        super().put(segment)
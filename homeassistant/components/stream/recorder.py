@@ -71,7 +71,8 @@ class RecorderOutput(StreamOutput):
 
     def __init__(self, stream, timeout: int = 30) -> None:
         """Initialize recorder output."""
-        super().__init__(stream, timeout)
+        # The whole recording is kept until it is written
+        super().__init__(stream, timeout, max_size=None)
         self.video_path = None
         self._segments = []
 
@@ -18,6 +18,7 @@ from homeassistant.helpers.event import TrackTemplate, async_track_template_resu
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.template import Template
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_timeline
 
 from . import const, decorators, messages
 
@@ -40,6 +41,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
+    async_reg(hass, handle_setup_timeline)
 
 
 def pong_message(iden):
@@ -409,3 +411,11 @@ async def handle_test_condition(hass, connection, msg):
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "setup_timeline"})
+@decorators.require_admin
+def handle_setup_timeline(hass, connection, msg):
+    """Handle startup setup timeline command."""
+    connection.send_result(msg["id"], async_get_setup_timeline(hass))
@@ -4,12 +4,12 @@ import asyncio
 import collections
 from datetime import timedelta
 from enum import Enum
-import itertools
+import functools
 import logging
 import os
 import time
 import traceback
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from serial import SerialException
 from zigpy.config import CONF_DEVICE
@@ -95,6 +95,12 @@ EntityReference = collections.namedtuple(
     "reference_id zha_device cluster_channels device_info remove_future",
 )
 
+# Devices initialized at the same time, adjusted between the limits to keep
+# the time a device takes to initialize under the target
+INITIALIZE_CONCURRENCY = 2
+INITIALIZE_CONCURRENCY_MAX = 16
+INITIALIZE_TARGET_SECONDS = 5
+
 
 class DevicePairingStatus(Enum):
     """Status of a device."""
@@ -105,6 +111,43 @@ class DevicePairingStatus(Enum):
     INITIALIZED = 4
 
 
+class InitializeLimiter:
+    """Limit the devices initialized at the same time.
+
+    The limit is raised by one after each device initialized within the
+    target time, and halved when a device takes longer, so that a radio
+    answering quickly is used fully and a busy radio is not flooded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the limiter."""
+        self.limit = INITIALIZE_CONCURRENCY
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def async_run(self, target: Callable[[], Awaitable[None]]) -> None:
+        """Run target once the limit allows it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+        start = time.monotonic()
+        try:
+            await target()
+        finally:
+            self.adjust(time.monotonic() - start)
+            async with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def adjust(self, duration: float) -> None:
+        """Adjust the limit to the time a device took to initialize."""
+        if duration <= INITIALIZE_TARGET_SECONDS:
+            self.limit = min(self.limit + 1, INITIALIZE_CONCURRENCY_MAX)
+        else:
+            self.limit = max(self.limit // 2, 1)
+
+
 class ZHAGateway:
     """Gateway that handles events that happen on the ZHA Zigbee network."""
 
@@ -116,6 +159,9 @@ class ZHAGateway:
         self._groups = {}
         self.coordinator_zha_device = None
         self._device_registry = collections.defaultdict(list)
+        self._entity_references: Dict[str, EntityReference] = {}
+        self._initialize_limiter = InitializeLimiter()
+        self._refresh_task = None
         self.zha_storage = None
         self.ha_device_registry = None
         self.ha_entity_registry = None
@@ -215,29 +261,38 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
-
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
+        """Initialize devices and load entities.
 
-        _LOGGER.debug("Loading battery powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=True)
-                for dev in self.devices.values()
-                if not dev.is_mains_powered
-            ]
+        All devices are initialized from the attributes cached by zigpy, so the
+        entities are usable right after a start. Mains powered devices are then
+        refreshed over the radio in the background.
+        """
+        _LOGGER.debug("Loading devices from cache")
+        await self._async_initialize_devices(self.devices.values(), cached=True)
+
+        # Not tracked by Home Assistant, so the refresh does not hold up the
+        # startup, shutdown cancels it
+        self._refresh_task = self._hass.loop.create_task(
+            self._async_initialize_devices(
+                [dev for dev in self.devices.values() if dev.is_mains_powered],
+                cached=False,
+            )
         )
 
-        _LOGGER.debug("Loading mains powered devices")
+    async def _async_initialize_devices(
+        self, zha_devices: List[zha_typing.ZhaDeviceType], cached: bool
+    ) -> None:
+        """Initialize devices, as many at a time as the radio keeps up with."""
+        if not cached:
+            _LOGGER.debug("Refreshing mains powered devices")
+
         await asyncio.gather(
-            *[
-                _throttle(dev, cached=False)
-                for dev in self.devices.values()
-                if dev.is_mains_powered
-            ]
+            *(
+                self._initialize_limiter.async_run(
+                    functools.partial(zha_device.async_initialize, from_cache=cached)
+                )
+                for zha_device in zha_devices
+            )
         )
 
     def device_joined(self, device):
@@ -356,6 +411,8 @@ class ZHAGateway:
         """Handle device being removed from the network."""
         zha_device = self._devices.pop(device.ieee, None)
         entity_refs = self._device_registry.pop(device.ieee, None)
+        for entity_ref in entity_refs or ():
+            self._entity_references.pop(entity_ref.reference_id, None)
         if zha_device is not None:
             device_info = zha_device.zha_device_info
             zha_device.async_cleanup_handles()
@@ -391,14 +448,11 @@ class ZHAGateway:
 
     def get_entity_reference(self, entity_id):
         """Return entity reference for given entity_id if found."""
-        for entity_reference in itertools.chain.from_iterable(
-            self.device_registry.values()
-        ):
-            if entity_id == entity_reference.reference_id:
-                return entity_reference
+        return self._entity_references.get(entity_id)
 
     def remove_entity_reference(self, entity):
         """Remove entity reference for given entity_id if found."""
+        self._entity_references.pop(entity.entity_id, None)
         if entity.zha_device.ieee in self.device_registry:
             entity_refs = self.device_registry.get(entity.zha_device.ieee)
             self.device_registry[entity.zha_device.ieee] = [
@@ -461,15 +515,15 @@ class ZHAGateway:
         remove_future,
     ):
         """Record the creation of a hass entity associated with ieee."""
-        self._device_registry[ieee].append(
-            EntityReference(
-                reference_id=reference_id,
-                zha_device=zha_device,
-                cluster_channels=cluster_channels,
-                device_info=device_info,
-                remove_future=remove_future,
-            )
+        entity_reference = EntityReference(
+            reference_id=reference_id,
+            zha_device=zha_device,
+            cluster_channels=cluster_channels,
+            device_info=device_info,
+            remove_future=remove_future,
         )
+        self._device_registry[ieee].append(entity_reference)
+        self._entity_references[reference_id] = entity_reference
 
     @callback
     def async_enable_debug_mode(self):
@@ -667,6 +721,8 @@ class ZHAGateway:
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
         for unsubscribe in self._unsubs:
             unsubscribe()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
         await self.application_controller.pre_shutdown()
 
     def handle_message(
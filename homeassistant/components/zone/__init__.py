@@ -29,10 +29,12 @@ from homeassistant.helpers import (
     service,
     storage,
 )
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
 from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +44,8 @@ DEFAULT_RADIUS = 100
 ENTITY_ID_FORMAT = "zone.{}"
 ENTITY_ID_HOME = ENTITY_ID_FORMAT.format(HOME_ZONE)
 
+DATA_ZONE_INDEX = "zone_index"
+
 ICON_HOME = "mdi:home"
 ICON_IMPORT = "mdi:import"
 
@@ -96,11 +100,9 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    # Candidates are sorted by entity ID so that we are deterministic if equal
+    # distance to 2 zones
+    zones = _async_get_zone_index(hass).candidates(latitude, longitude, radius)
 
     min_dist = None
     closest = None
@@ -134,6 +136,28 @@ def async_active_zone(
     return closest
 
 
+@callback
+def _async_get_zone_index(hass: HomeAssistant) -> ZoneIndex:
+    """Return the zone index, rebuilding it after zones changed."""
+    index: Optional[ZoneIndex] = hass.data.get(DATA_ZONE_INDEX)
+    if index is not None:
+        return index
+
+    if DATA_ZONE_INDEX not in hass.data:
+
+        @callback
+        def _async_zones_changed(event: Event) -> None:
+            """Drop the index when a zone changes."""
+            hass.data[DATA_ZONE_INDEX] = None
+
+        async_track_state_change_filtered(
+            hass, TrackStates(False, set(), {DOMAIN}), _async_zones_changed
+        )
+
+    index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(hass.states.async_all(DOMAIN))
+    return index
+
+
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
     """Test if given latitude, longitude is in given zone.
 
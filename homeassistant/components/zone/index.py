@@ -0,0 +1,104 @@
+"""Grid index to find the zones near a location."""
+from collections import defaultdict
+import math
+from typing import DefaultDict, Iterable, List, Optional, Tuple
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, STATE_UNAVAILABLE
+from homeassistant.core import State
+
+from .const import ATTR_PASSIVE, ATTR_RADIUS
+
+# Size of a grid cell in degrees
+CELL_SIZE = 0.1
+# Circles covering more cells are not put in the grid
+MAX_CELLS = 1024
+# Shortest length of a degree of latitude on the WGS84 ellipsoid in meters,
+# with a margin so bounding boxes always cover their circle
+METERS_PER_DEGREE = 110574 / 1.1
+MAX_LATITUDE = 89
+
+Cell = Tuple[int, int]
+
+
+def _cells(latitude: float, longitude: float, radius: float) -> Optional[List[Cell]]:
+    """Return the grid cells covered by the bounding box of a circle.
+
+    Returns None if the box is too large or crosses a pole or the antimeridian.
+    """
+    if not math.isfinite(latitude + longitude + radius):
+        return None
+
+    delta_lat = radius / METERS_PER_DEGREE
+    max_lat = abs(latitude) + delta_lat
+    if max_lat >= MAX_LATITUDE:
+        return None
+
+    delta_lon = delta_lat / math.cos(math.radians(max_lat))
+    if longitude - delta_lon < -180 or longitude + delta_lon > 180:
+        return None
+
+    lat_range = range(
+        math.floor((latitude - delta_lat) / CELL_SIZE),
+        math.floor((latitude + delta_lat) / CELL_SIZE) + 1,
+    )
+    lon_range = range(
+        math.floor((longitude - delta_lon) / CELL_SIZE),
+        math.floor((longitude + delta_lon) / CELL_SIZE) + 1,
+    )
+    if len(lat_range) * len(lon_range) > MAX_CELLS:
+        return None
+
+    return [(lat, lon) for lat in lat_range for lon in lon_range]
+
+
+class ZoneIndex:
+    """Index of the active zones in a grid of latitude and longitude cells.
+
+    Every zone is stored in the cells covered by the bounding box of its
+    circle, so a location only has to be compared to the zones in the cells
+    covered by its own accuracy circle.
+    """
+
+    def __init__(self, zones: Iterable[State]) -> None:
+        """Build the index."""
+        self._zones: List[State] = []
+        self._cells: DefaultDict[Cell, List[State]] = defaultdict(list)
+        # Zones that are not stored in the grid and are always candidates
+        self._unindexed: List[State] = []
+
+        for zone in sorted(zones, key=lambda zone: zone.entity_id):
+            if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
+                continue
+
+            self._zones.append(zone)
+
+            try:
+                cells = _cells(
+                    float(zone.attributes[ATTR_LATITUDE]),
+                    float(zone.attributes[ATTR_LONGITUDE]),
+                    float(zone.attributes[ATTR_RADIUS]),
+                )
+            except (KeyError, TypeError, ValueError):
+                cells = None
+
+            if cells is None:
+                self._unindexed.append(zone)
+                continue
+
+            for cell in cells:
+                self._cells[cell].append(zone)
+
+    def candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> List[State]:
+        """Return the zones that may contain a location, sorted by entity ID."""
+        cells = _cells(latitude, longitude, radius)
+        if cells is None:
+            return self._zones
+
+        found = {zone.entity_id: zone for zone in self._unindexed}
+        for cell in cells:
+            for zone in self._cells.get(cell, ()):
+                found[zone.entity_id] = zone
+
+        return [found[entity_id] for entity_id in sorted(found)]
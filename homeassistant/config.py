@@ -35,8 +35,10 @@ from homeassistant.const import (
     CONF_LEGACY_TEMPLATES,
     CONF_LONGITUDE,
     CONF_MEDIA_DIRS,
+    CONF_MIN_WRITE_INTERVAL,
     CONF_NAME,
     CONF_PACKAGES,
+    CONF_SIGNIFICANT_CHANGE,
     CONF_TEMPERATURE_UNIT,
     CONF_TIME_ZONE,
     CONF_TYPE,
@@ -157,6 +159,12 @@ CUSTOMIZE_DICT_SCHEMA = vol.Schema(
         vol.Optional(ATTR_FRIENDLY_NAME): cv.string,
         vol.Optional(ATTR_HIDDEN): cv.boolean,
         vol.Optional(ATTR_ASSUMED_STATE): cv.boolean,
+        vol.Optional(CONF_MIN_WRITE_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_SIGNIFICANT_CHANGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -120,6 +120,7 @@ CONF_MAC = "mac"
 CONF_MAXIMUM = "maximum"
 CONF_MEDIA_DIRS = "media_dirs"
 CONF_METHOD = "method"
+CONF_MIN_WRITE_INTERVAL = "min_write_interval"
 CONF_MINIMUM = "minimum"
 CONF_MODE = "mode"
 CONF_MONITORED_CONDITIONS = "monitored_conditions"
@@ -163,6 +164,7 @@ CONF_SERVICE = "service"
 CONF_SERVICE_DATA = "data"
 CONF_SERVICE_TEMPLATE = "service_template"
 CONF_SHOW_ON_MAP = "show_on_map"
+CONF_SIGNIFICANT_CHANGE = "significant_change"
 CONF_SLAVE = "slave"
 CONF_SOURCE = "source"
 CONF_SSL = "ssl"
@@ -604,6 +606,7 @@ HTTP_OK = 200
 HTTP_CREATED = 201
 HTTP_ACCEPTED = 202
 HTTP_MOVED_PERMANENTLY = 301
+HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
 HTTP_FORBIDDEN = 403
@@ -1,7 +1,18 @@
 """Provide a way to connect entities belonging to one device."""
 from collections import OrderedDict
+from functools import partial
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import attr
 
@@ -125,7 +136,9 @@ class DeviceRegistry:
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
         self._clear_index()
 
     @callback
@@ -486,39 +499,17 @@ class DeviceRegistry:
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Return data of device registry to store in a file."""
-        data = {}
-
-        data["devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "entry_type": entry.entry_type,
-                "id": entry.id,
-                "via_device_id": entry.via_device_id,
-                "area_id": entry.area_id,
-                "name_by_user": entry.name_by_user,
-                "disabled_by": entry.disabled_by,
-            }
-            for entry in self.devices.values()
-        ]
-        data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-            }
-            for entry in self.deleted_devices.values()
-        ]
-
-        return data
+    def _data_to_save(self) -> Callable[[], Dict[str, List[Dict[str, Any]]]]:
+        """Return a function building the data of device registry to store.
+
+        Entries are immutable, so only the lists of entries are copied in the
+        event loop and the data is built in the executor.
+        """
+        return partial(
+            _entries_to_save,
+            list(self.devices.values()),
+            list(self.deleted_devices.values()),
+        )
 
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
@@ -649,6 +640,43 @@ def async_setup_cleanup(hass: HomeAssistantType, dev_reg: DeviceRegistry) -> Non
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, startup_clean)
 
 
+def _entries_to_save(
+    devices: List[DeviceEntry], deleted_devices: List[DeletedDeviceEntry]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Return data of device registry entries to store in a file."""
+    data = {}
+
+    data["devices"] = [
+        {
+            "config_entries": list(entry.config_entries),
+            "connections": list(entry.connections),
+            "identifiers": list(entry.identifiers),
+            "manufacturer": entry.manufacturer,
+            "model": entry.model,
+            "name": entry.name,
+            "sw_version": entry.sw_version,
+            "entry_type": entry.entry_type,
+            "id": entry.id,
+            "via_device_id": entry.via_device_id,
+            "area_id": entry.area_id,
+            "name_by_user": entry.name_by_user,
+            "disabled_by": entry.disabled_by,
+        }
+        for entry in devices
+    ]
+    data["deleted_devices"] = [
+        {
+            "config_entries": list(entry.config_entries),
+            "connections": list(entry.connections),
+            "identifiers": list(entry.identifiers),
+            "id": entry.id,
+        }
+        for entry in deleted_devices
+    ]
+
+    return data
+
+
 def _normalize_connections(connections: set) -> set:
     """Normalize connections to ensure we can match mac addresses."""
     return {
@@ -16,6 +16,8 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_SUPPORTED_FEATURES,
     ATTR_UNIT_OF_MEASUREMENT,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_SIGNIFICANT_CHANGE,
     DEVICE_DEFAULT_NAME,
     STATE_OFF,
     STATE_ON,
@@ -28,7 +30,11 @@ from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import RegistryEntry
-from homeassistant.helpers.event import Event, async_track_entity_registry_updated_event
+from homeassistant.helpers.event import (
+    Event,
+    async_track_entity_registry_updated_event,
+    async_track_point_in_utc_time,
+)
 from homeassistant.helpers.typing import StateType
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
@@ -123,6 +129,10 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # Rate limiting of state writes
+    _last_write: Optional[datetime] = None
+    _write_flush: Optional[CALLBACK_TYPE] = None
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -237,6 +247,23 @@ class Entity(ABC):
         """Return if the entity should be enabled when first added to the entity registry."""
         return True
 
+    @property
+    def min_write_interval(self) -> Optional[float]:
+        """Return the minimum number of seconds between state writes.
+
+        Writes within the interval are coalesced and the latest state is
+        written at the end of it.
+        """
+        return None
+
+    @property
+    def significant_change(self) -> Optional[float]:
+        """Return the change of a numeric state that is written right away.
+
+        Changes of a non-numeric state are always written right away.
+        """
+        return None
+
     # DO NOT OVERWRITE
     # These properties and methods are either managed by Home Assistant or they
     # are used to perform a very specific function. Overwriting these may
@@ -379,8 +406,14 @@ class Entity(ABC):
 
         # Overwrite properties that have been set in the config file.
         assert self.hass is not None
+        customize: Dict[str, Any] = {}
         if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+            customize = self.hass.data[DATA_CUSTOMIZE].get(self.entity_id)
+            attr.update(
+                (key, value)
+                for key, value in customize.items()
+                if key not in (CONF_MIN_WRITE_INTERVAL, CONF_SIGNIFICANT_CHANGE)
+            )
 
         # Convert temperature if we detect one
         try:
@@ -405,10 +438,65 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
+        if self._async_write_rate_limited(state, customize):
+            return
+
         self.hass.states.async_set(
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_write_rate_limited(self, state: str, customize: Dict[str, Any]) -> bool:
+        """Return True if the state write is postponed to the end of the interval.
+
+        The entity registry overrides customize, which overrides the entity.
+        """
+        entry = self.registry_entry
+        interval = _first_set(
+            entry.min_write_interval if entry else None,
+            customize.get(CONF_MIN_WRITE_INTERVAL),
+            self.min_write_interval,
+        )
+        if not interval:
+            return False
+
+        assert self.hass is not None
+        now = dt_util.utcnow()
+
+        if self._last_write is not None and (
+            now - self._last_write < timedelta(seconds=interval)
+        ):
+            old_state = self.hass.states.get(self.entity_id)
+            threshold = _first_set(
+                entry.significant_change if entry else None,
+                customize.get(CONF_SIGNIFICANT_CHANGE),
+                self.significant_change,
+            )
+            if old_state is None or not _is_significant_change(
+                old_state.state, state, threshold
+            ):
+                if self._write_flush is None:
+                    self._write_flush = async_track_point_in_utc_time(
+                        self.hass,
+                        self._async_flush_write,
+                        self._last_write + timedelta(seconds=interval),
+                    )
+                return True
+
+        if self._write_flush is not None:
+            self._write_flush()
+            self._write_flush = None
+
+        self._last_write = now
+        return False
+
+    @callback
+    def _async_flush_write(self, _: datetime) -> None:
+        """Write the latest state at the end of the write interval."""
+        self._write_flush = None
+        self._last_write = None
+        self._async_write_ha_state()
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -541,6 +629,10 @@ class Entity(ABC):
 
         self._added = False
 
+        if self._write_flush is not None:
+            self._write_flush()
+            self._write_flush = None
+
         if self._on_remove is not None:
             while self._on_remove:
                 self._on_remove.pop()()
@@ -711,3 +803,24 @@ class ToggleEntity(Entity):
             await self.async_turn_off(**kwargs)
         else:
             await self.async_turn_on(**kwargs)
+
+
+def _first_set(*values: Optional[float]) -> Optional[float]:
+    """Return the first value that is not None."""
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
+def _is_significant_change(
+    old_state: str, new_state: str, threshold: Optional[float]
+) -> bool:
+    """Return if a state change has to be written right away."""
+    if old_state == new_state:
+        return False
+    try:
+        change = abs(float(new_state) - float(old_state))
+    except ValueError:
+        return True
+    return threshold is not None and change >= threshold
@@ -3,6 +3,7 @@ import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
 
@@ -18,6 +19,7 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.setup import async_record_setup_phase
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
@@ -192,6 +194,7 @@ class EntityPlatform:
             SLOW_SETUP_WARNING,
         )
 
+        start = timer()
         try:
             task = async_create_setup_task()
 
@@ -208,6 +211,7 @@ class EntityPlatform:
 
             hass.config.components.add(full_name)
             self._setup_complete = True
+            async_record_setup_phase(hass, full_name, "setup", start, timer())
             return True
         except PlatformNotReady:
             tries += 1
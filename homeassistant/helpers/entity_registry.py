@@ -8,6 +8,7 @@ registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
 from collections import OrderedDict
+from functools import partial
 import logging
 from typing import (
     TYPE_CHECKING,
@@ -102,6 +103,9 @@ class RegistryEntry:
     supported_features: int = attr.ib(default=0)
     device_class: Optional[str] = attr.ib(default=None)
     unit_of_measurement: Optional[str] = attr.ib(default=None)
+    # Rate limiting of state writes, as set by the user
+    min_write_interval: Optional[float] = attr.ib(default=None)
+    significant_change: Optional[float] = attr.ib(default=None)
     # As set by integration
     original_name: Optional[str] = attr.ib(default=None)
     original_icon: Optional[str] = attr.ib(default=None)
@@ -126,7 +130,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -338,6 +344,8 @@ class EntityRegistry:
         new_entity_id=UNDEFINED,
         new_unique_id=UNDEFINED,
         disabled_by=UNDEFINED,
+        min_write_interval=UNDEFINED,
+        significant_change=UNDEFINED,
     ):
         """Update properties of an entity."""
         return cast(  # cast until we have _async_update_entity type hinted
@@ -350,6 +358,8 @@ class EntityRegistry:
                 new_entity_id=new_entity_id,
                 new_unique_id=new_unique_id,
                 disabled_by=disabled_by,
+                min_write_interval=min_write_interval,
+                significant_change=significant_change,
             ),
         )
 
@@ -370,6 +380,8 @@ class EntityRegistry:
         supported_features=UNDEFINED,
         device_class=UNDEFINED,
         unit_of_measurement=UNDEFINED,
+        min_write_interval=UNDEFINED,
+        significant_change=UNDEFINED,
         original_name=UNDEFINED,
         original_icon=UNDEFINED,
     ):
@@ -389,6 +401,8 @@ class EntityRegistry:
             ("supported_features", supported_features),
             ("device_class", device_class),
             ("unit_of_measurement", unit_of_measurement),
+            ("min_write_interval", min_write_interval),
+            ("significant_change", significant_change),
             ("original_name", original_name),
             ("original_icon", original_icon),
         ):
@@ -471,6 +485,8 @@ class EntityRegistry:
                     supported_features=entity.get("supported_features", 0),
                     device_class=entity.get("device_class"),
                     unit_of_measurement=entity.get("unit_of_measurement"),
+                    min_write_interval=entity.get("min_write_interval"),
+                    significant_change=entity.get("significant_change"),
                     original_name=entity.get("original_name"),
                     original_icon=entity.get("original_icon"),
                 )
@@ -484,32 +500,13 @@ class EntityRegistry:
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> Dict[str, Any]:
-        """Return data of entity registry to store in a file."""
-        data = {}
-
-        data["entities"] = [
-            {
-                "entity_id": entry.entity_id,
-                "config_entry_id": entry.config_entry_id,
-                "device_id": entry.device_id,
-                "area_id": entry.area_id,
-                "unique_id": entry.unique_id,
-                "platform": entry.platform,
-                "name": entry.name,
-                "icon": entry.icon,
-                "disabled_by": entry.disabled_by,
-                "capabilities": entry.capabilities,
-                "supported_features": entry.supported_features,
-                "device_class": entry.device_class,
-                "unit_of_measurement": entry.unit_of_measurement,
-                "original_name": entry.original_name,
-                "original_icon": entry.original_icon,
-            }
-            for entry in self.entities.values()
-        ]
+    def _data_to_save(self) -> Callable[[], Dict[str, Any]]:
+        """Return a function building the data of entity registry to store.
 
-        return data
+        Entries are immutable, so only the list of entries is copied in the
+        event loop and the data is built in the executor.
+        """
+        return partial(_entries_to_save, list(self.entities.values()))
 
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
@@ -659,6 +656,36 @@ def async_setup_entity_restore(
     hass.bus.async_listen(EVENT_HOMEASSISTANT_START, _write_unavailable_states)
 
 
+def _entries_to_save(entries: List[RegistryEntry]) -> Dict[str, Any]:
+    """Return data of entity registry entries to store in a file."""
+    data = {}
+
+    data["entities"] = [
+        {
+            "entity_id": entry.entity_id,
+            "config_entry_id": entry.config_entry_id,
+            "device_id": entry.device_id,
+            "area_id": entry.area_id,
+            "unique_id": entry.unique_id,
+            "platform": entry.platform,
+            "name": entry.name,
+            "icon": entry.icon,
+            "disabled_by": entry.disabled_by,
+            "capabilities": entry.capabilities,
+            "supported_features": entry.supported_features,
+            "device_class": entry.device_class,
+            "unit_of_measurement": entry.unit_of_measurement,
+            "min_write_interval": entry.min_write_interval,
+            "significant_change": entry.significant_change,
+            "original_name": entry.original_name,
+            "original_icon": entry.original_icon,
+        }
+        for entry in entries
+    ]
+
+    return data
+
+
 async def async_migrate_entries(
     hass: HomeAssistantType,
     config_entry_id: str,
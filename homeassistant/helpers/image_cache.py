@@ -0,0 +1,91 @@
+"""Memory cache of images shared by the integrations serving them."""
+import asyncio
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .singleton import singleton
+
+DATA_IMAGE_CACHE = "image_cache"
+
+# Total size of the cached images, media artwork is typically 10-100kB
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+Image = Tuple[Optional[bytes], Optional[str]]
+
+
+class ImageCache:
+    """Cache images up to a total size in bytes.
+
+    The least recently used images are evicted first. Concurrent requests for
+    an image that is not cached share a single fetch. Resized versions of an
+    image are cached under their own key, such as (url, width, height), so
+    each size is produced once.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._images: "OrderedDict[Hashable, Image]" = OrderedDict()
+        self._fetching: Dict[Hashable, asyncio.Future] = {}
+
+    async def async_get(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Image]]
+    ) -> Image:
+        """Return the cached image of a key, fetching it if it is not cached.
+
+        Failed fetches, returning no content, are not cached.
+        """
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+
+        fetching = self._fetching.get(key)
+        if fetching is None:
+            fetching = self._fetching[key] = self.hass.async_create_task(
+                self._async_fetch(key, fetch)
+            )
+            fetching.add_done_callback(lambda _: self._fetching.pop(key, None))
+        # A request giving up must not cancel the fetch of the other requests
+        return await asyncio.shield(fetching)
+
+    async def _async_fetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Image]]
+    ) -> Image:
+        """Fetch an image and cache it."""
+        image = await fetch()
+        if image[0] is not None:
+            self.async_set(key, image)
+        return image
+
+    @callback
+    def async_set(self, key: Hashable, image: Image) -> None:
+        """Cache an image, evicting the least recently used ones over budget."""
+        self.async_remove(key)
+        size = len(image[0] or b"")
+        if size > self.max_bytes:
+            return
+
+        self._images[key] = image
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (content, _) = self._images.popitem(last=False)
+            self.size -= len(content or b"")
+
+    @callback
+    def async_remove(self, key: Hashable) -> None:
+        """Remove the image of a key from the cache."""
+        image = self._images.pop(key, None)
+        if image is not None:
+            self.size -= len(image[0] or b"")
+
+
+@singleton(DATA_IMAGE_CACHE)
+@callback
+def async_get_image_cache(hass: HomeAssistant) -> ImageCache:
+    """Return the image cache shared by all integrations."""
+    return ImageCache(hass)
@@ -0,0 +1,71 @@
+"""Reverse index from referenced items to the entities referencing them."""
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, List, Set, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+DATA_REFERENCE_INDEX = "reference_index"
+
+REFERENCE_AREA = "area"
+REFERENCE_DEVICE = "device"
+REFERENCE_ENTITY = "entity"
+
+
+class ReferenceIndex:
+    """Map entities, devices and areas to the entities that reference them.
+
+    Used by automations and scripts so finding what references an item does
+    not require walking the configuration of every automation and script.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reference index."""
+        self._index: DefaultDict[Tuple[str, str], Set[str]] = defaultdict(set)
+        self._references: Dict[str, Set[Tuple[str, str]]] = {}
+
+    @callback
+    def async_add(
+        self,
+        entity_id: str,
+        entities: Iterable[str] = (),
+        devices: Iterable[str] = (),
+        areas: Iterable[str] = (),
+    ) -> None:
+        """Index the references of an entity, replacing earlier ones."""
+        self.async_remove(entity_id)
+
+        references = {(REFERENCE_ENTITY, item_id) for item_id in entities}
+        references.update((REFERENCE_DEVICE, item_id) for item_id in devices)
+        references.update((REFERENCE_AREA, item_id) for item_id in areas)
+
+        for reference in references:
+            self._index[reference].add(entity_id)
+
+        self._references[entity_id] = references
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the references of an entity from the index."""
+        for reference in self._references.pop(entity_id, ()):
+            referencing = self._index[reference]
+            referencing.discard(entity_id)
+            if not referencing:
+                del self._index[reference]
+
+    @callback
+    def async_referencing(self, reference_type: str, item_id: str) -> List[str]:
+        """Return the entities referencing an item."""
+        referencing = self._index.get((reference_type, item_id))
+        if referencing is None:
+            return []
+        return list(referencing)
+
+
+@callback
+def async_get_reference_index(hass: HomeAssistant, domain: str) -> ReferenceIndex:
+    """Return the reference index of a domain."""
+    indexes: Dict[str, ReferenceIndex] = hass.data.setdefault(DATA_REFERENCE_INDEX, {})
+    index = indexes.get(domain)
+    if index is None:
+        index = indexes[domain] = ReferenceIndex()
+    return index
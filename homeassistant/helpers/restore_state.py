@@ -4,9 +4,14 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Dict, List, Optional, Set, cast
 
-from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
 from homeassistant.core import (
     CoreState,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -26,11 +31,18 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_CHANGES = "core.restore_state_changes"
 STORAGE_VERSION = 1
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between rewriting all states to disk
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
+# Rewrite all states when more than this part of the entities changed
+STATE_COMPACT_RATIO = 0.5
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -76,13 +88,22 @@ class RestoreStateData:
                 _LOGGER.error("Error loading last states", exc_info=exc)
                 stored_states = None
 
-            if stored_states is None:
+            try:
+                changed_states = await data.changes_store.async_load()
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error loading last state changes", exc_info=exc)
+                changed_states = None
+
+            if stored_states is None and changed_states is None:
                 _LOGGER.debug("Not creating cache - no saved states found")
                 data.last_states = {}
             else:
+                # Changes are saved since the last time all states were saved
                 data.last_states = {
                     item["state"]["entity_id"]: StoredState.from_dict(item)
-                    for item in stored_states
+                    for stored in (stored_states, changed_states)
+                    if isinstance(stored, list)
+                    for item in stored
                     if valid_entity_id(item["state"]["entity_id"])
                 }
                 _LOGGER.debug("Created cache with %s", list(data.last_states))
@@ -102,10 +123,22 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, compact=True
+        )
+        self.changes_store: Store = Store(
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY_CHANGES,
+            encoder=JSONEncoder,
+            compact=True,
         )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # Entities whose stored state changed since the last save
+        self.changed_entity_ids: Set[str] = set()
+        # States saved in changes_store since all states were last saved
+        self._saved_changes: Dict[str, StoredState] = {}
+        self._last_compaction: Optional[datetime] = None
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -149,19 +182,74 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_stored_state(
+        self, entity_id: str, now: datetime
+    ) -> Optional[StoredState]:
+        """Get the state of an entity which should be stored."""
+        if entity_id in self.entity_ids:
+            state = self.hass.states.get(entity_id)
+            if state is not None and not state.attributes.get(
+                entity_registry.ATTR_RESTORED
+            ):
+                return StoredState(state, now)
+
+        return self.last_states.get(entity_id)
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        self.changed_entity_ids.clear()
+        self._saved_changes.clear()
+        self._last_compaction = dt_util.utcnow()
+
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                await self.hass.async_add_executor_job(
+                    _stored_states_as_dicts, stored_states
+                )
             )
+            await self.changes_store.async_save([])
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since the last save to storage.
+
+        All states are saved instead when many states changed or when they
+        were not saved for STATE_COMPACT_INTERVAL, so the stored changes do
+        not keep growing.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._last_compaction is None
+            or now - self._last_compaction > STATE_COMPACT_INTERVAL
+            or len(self._saved_changes) + len(self.changed_entity_ids)
+            > STATE_COMPACT_RATIO * max(len(self.entity_ids), 1)
+        ):
+            await self.async_dump_states()
+            return
+
+        if not self.changed_entity_ids:
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self.changed_entity_ids))
+        for entity_id in self.changed_entity_ids:
+            stored_state = self._async_get_stored_state(entity_id, now)
+            if stored_state is not None:
+                self._saved_changes[entity_id] = stored_state
+        self.changed_entity_ids.clear()
+
+        try:
+            await self.changes_store.async_save(
+                await self.hass.async_add_executor_job(
+                    _stored_states_as_dicts, list(self._saved_changes.values())
+                )
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -169,21 +257,38 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            """Mark the stored state of an entity as changed."""
+            entity_id = event.data["entity_id"]
+            if entity_id in self.entity_ids:
+                self.changed_entity_ids.add(entity_id)
+
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed)
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
         self.hass.async_create_task(_async_dump_states())
 
-        # Dump states periodically
-        async_track_time_interval(self.hass, _async_dump_states, STATE_DUMP_INTERVAL)
+        # Dump changed states periodically
+        async_track_time_interval(
+            self.hass, _async_dump_changed_states, STATE_DUMP_INTERVAL
+        )
 
-        # Dump states when stopping hass
-        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_states)
+        # Dump changed states when stopping hass
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_dump_changed_states
+        )
 
     @callback
     def async_restore_entity_added(self, entity_id: str) -> None:
         """Store this entity's state when hass is shutdown."""
         self.entity_ids.add(entity_id)
+        self.changed_entity_ids.add(entity_id)
 
     @callback
     def async_restore_entity_removed(self, entity_id: str) -> None:
@@ -200,6 +305,12 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
 
         self.entity_ids.remove(entity_id)
+        self.changed_entity_ids.add(entity_id)
+
+
+def _stored_states_as_dicts(stored_states: List[StoredState]) -> List[Dict[str, Any]]:
+    """Return the dict representations of stored states."""
+    return [stored_state.as_dict() for stored_state in stored_states]
 
 
 def _encode(value: Any) -> Any:
@@ -1,9 +1,11 @@
 """Helper to help store data."""
 import asyncio
+from collections import deque
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, List, Optional, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
@@ -15,8 +17,12 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+DATA_STORAGE_METRICS = "storage_metrics"
 _LOGGER = logging.getLogger(__name__)
 
+# Window in seconds used for the writes per hour metric
+METRICS_WINDOW = 3600
+
 
 @bind_hass
 async def async_migrator(
@@ -60,9 +66,58 @@ async def async_migrator(
     return config
 
 
+class StoreMetrics:
+    """Write amplification metrics of a storage key."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.writes = 0
+        self.bytes_written = 0
+        self.last_size: Optional[int] = None
+        self._write_times: Deque[float] = deque()
+
+    @callback
+    def async_record_write(self, size: Optional[int]) -> None:
+        """Record a write of the storage file."""
+        self.writes += 1
+        if size is not None:
+            self.bytes_written += size
+            self.last_size = size
+        now = monotonic()
+        self._write_times.append(now)
+        while self._write_times[0] < now - METRICS_WINDOW:
+            self._write_times.popleft()
+
+    @property
+    def writes_per_hour(self) -> int:
+        """Return the number of writes during the last hour."""
+        cutoff = monotonic() - METRICS_WINDOW
+        return sum(1 for write_time in self._write_times if write_time >= cutoff)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary representation of the metrics."""
+        return {
+            "writes": self.writes,
+            "writes_per_hour": self.writes_per_hour,
+            "bytes_written": self.bytes_written,
+            "last_size": self.last_size,
+        }
+
+
+@callback
+def async_get_metrics(hass: HomeAssistant) -> Dict[str, StoreMetrics]:
+    """Return the write metrics of all storage keys written since startup."""
+    metrics: Dict[str, StoreMetrics] = hass.data.setdefault(DATA_STORAGE_METRICS, {})
+    return metrics
+
+
 @bind_hass
 class Store:
-    """Class to help storing data."""
+    """Class to help storing data.
+
+    Stores created with compact=True write JSON without indentation. Both
+    forms are valid JSON, so switching does not affect reading older files.
+    """
 
     def __init__(
         self,
@@ -72,12 +127,14 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
     ):
         """Initialize storage class."""
         self.version = version
         self.key = key
         self.hass = hass
         self._private = private
+        self._compact = compact
         self._data: Optional[Dict[str, Any]] = None
         self._unsub_delay_listener: Optional[CALLBACK_TYPE] = None
         self._unsub_final_write_listener: Optional[CALLBACK_TYPE] = None
@@ -120,6 +177,8 @@ class Store:
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
+            if callable(data["data"]):
+                data["data"] = data["data"]()
         else:
             data = await self.hass.async_add_executor_job(
                 json_util.load_json, self.path
@@ -151,8 +210,17 @@ class Store:
         await self._async_handle_write_data()
 
     @callback
-    def async_delay_save(self, data_func: Callable[[], Dict], delay: float = 0) -> None:
-        """Save data with an optional delay."""
+    def async_delay_save(
+        self, data_func: Callable[[], Union[Dict, Callable[[], Dict]]], delay: float = 0
+    ) -> None:
+        """Save data with an optional delay.
+
+        The data function is called in the event loop when the data is
+        written. It can return a function instead of the data, which is then
+        called in the executor. This allows taking a cheap snapshot of
+        immutable objects in the event loop and building the data from it
+        outside of the event loop.
+        """
         self._data = {"version": self.version, "key": self.key, "data_func": data_func}
 
         self._async_cleanup_delay_listener()
@@ -219,19 +287,34 @@ class Store:
             self._data = None
 
             try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
+                size = await self.hass.async_add_executor_job(
+                    self._build_and_write_data, self.path, data
                 )
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+                return
+
+            metrics = async_get_metrics(self.hass)
+            if self.key not in metrics:
+                metrics[self.key] = StoreMetrics()
+            metrics[self.key].async_record_write(size)
 
-    def _write_data(self, path: str, data: Dict) -> None:
-        """Write the data."""
+    def _build_and_write_data(self, path: str, data: Dict) -> Optional[int]:
+        """Build the data from a snapshot if needed and write it."""
+        if callable(data["data"]):
+            data["data"] = data["data"]()
+        return self._write_data(path, data)
+
+    def _write_data(self, path: str, data: Dict) -> Optional[int]:
+        """Write the data and return the size of the written file."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
+        return os.path.getsize(path)
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -489,7 +489,8 @@ class Template:
     ):
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too, unless value_json is
+        already passed in variables.
 
         This method must be run in the event loop.
         """
@@ -502,10 +503,11 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:
-            variables["value_json"] = json.loads(value)
-        except (ValueError, TypeError):
-            pass
+        if "value_json" not in variables:
+            try:
+                variables["value_json"] = json.loads(value)
+            except (ValueError, TypeError):
+                pass
 
         try:
             return self._compiled.render(variables).strip()
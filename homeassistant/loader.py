@@ -11,6 +11,7 @@ import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -20,6 +21,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -40,6 +42,12 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "integration_import_times"
+DATA_PENDING_IMPORTS = "integration_pending_imports"
+DATA_MANIFEST_INDEX = "manifest_index"
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -51,6 +59,7 @@ CUSTOM_WARNING = (
 _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular dependency
 
 MAX_LOAD_CONCURRENTLY = 4
+MAX_IMPORT_CONCURRENTLY = 4
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
@@ -65,6 +74,147 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     }
 
 
+class ManifestIndex:
+    """Index of parsed integration manifests, invalidated by manifest mtime.
+
+    The index is persisted so resolving integrations on the next start does
+    not have to read and parse their manifests again.
+    """
+
+    def __init__(self, hass: "HomeAssistant") -> None:
+        """Initialize the manifest index."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        self.hass = hass
+        self._store = Store(
+            hass,
+            MANIFEST_INDEX_STORAGE_VERSION,
+            MANIFEST_INDEX_STORAGE_KEY,
+        )
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the index and drop manifests that changed on disk."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.const import __version__
+        from homeassistant.exceptions import HomeAssistantError
+
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load the manifest index: %s", err)
+            return
+
+        if (
+            not isinstance(data, dict)
+            or data.get("ha_version") != __version__
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return
+
+        self.entries = await self.hass.async_add_executor_job(
+            _validate_manifest_entries, data["entries"]
+        )
+
+    def async_get_integration(self, pkg_path: str) -> "Optional[Integration]":
+        """Return an integration from the index."""
+        entry = self.entries.get(pkg_path)
+        if entry is None:
+            return None
+        return Integration(
+            self.hass,
+            pkg_path,
+            pathlib.Path(entry["file_path"]),
+            dict(entry["manifest"]),
+        )
+
+    def async_add(self, integration: "Integration", mtime: float) -> None:
+        """Add the manifest of a resolved integration to the index."""
+        self.entries[integration.pkg_path] = {
+            "file_path": str(integration.file_path),
+            "mtime": mtime,
+            "manifest": integration.manifest,
+        }
+        self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data of the index to store."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.const import __version__
+
+        return {"ha_version": __version__, "entries": self.entries}
+
+
+def _validate_manifest_entries(
+    entries: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Return the index entries whose manifest did not change on disk."""
+    valid = {}
+    for pkg_path, entry in entries.items():
+        try:
+            mtime = (pathlib.Path(entry["file_path"]) / "manifest.json").stat().st_mtime
+        except (OSError, KeyError, TypeError):
+            continue
+
+        if mtime == entry.get("mtime") and isinstance(entry.get("manifest"), dict):
+            valid[pkg_path] = entry
+
+    return valid
+
+
+async def async_get_manifest_index(hass: "HomeAssistant") -> ManifestIndex:
+    """Return the loaded manifest index."""
+    index_or_evt = hass.data.get(DATA_MANIFEST_INDEX)
+
+    if index_or_evt is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+        index = ManifestIndex(hass)
+        try:
+            await index.async_load()
+        finally:
+            # An index that failed to load starts empty
+            hass.data[DATA_MANIFEST_INDEX] = index
+            evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(ManifestIndex, hass.data[DATA_MANIFEST_INDEX])
+
+    return cast(ManifestIndex, index_or_evt)
+
+
+async def _async_resolve_from_root(
+    hass: "HomeAssistant", root_module: ModuleType, domain: str
+) -> "Optional[Integration]":
+    """Resolve an integration from a root module, using the manifest index."""
+    index = await async_get_manifest_index(hass)
+    integration = index.async_get_integration(f"{root_module.__name__}.{domain}")
+
+    if integration is not None:
+        return integration
+
+    integration, mtime = await hass.async_add_executor_job(
+        _resolve_from_root_with_mtime, hass, root_module, domain
+    )
+
+    if integration is not None:
+        index.async_add(integration, mtime)
+
+    return integration
+
+
+def _resolve_from_root_with_mtime(
+    hass: "HomeAssistant", root_module: ModuleType, domain: str
+) -> "Tuple[Optional[Integration], float]":
+    """Resolve an integration and return the mtime of its manifest."""
+    integration = Integration.resolve_from_root(hass, root_module, domain)
+    if integration is None:
+        return None, 0.0
+    return integration, (integration.file_path / "manifest.json").stat().st_mtime
+
+
 async def _async_get_custom_components(
     hass: "HomeAssistant",
 ) -> Dict[str, "Integration"]:
@@ -91,12 +241,7 @@ async def _async_get_custom_components(
     )
 
     integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        )
+        *(_async_resolve_from_root(hass, custom_components, comp.name) for comp in dirs)
     )
 
     return {
@@ -469,9 +614,13 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    try:
+        integration = await _async_resolve_from_root(hass, components, domain)
+    except BaseException:
+        # Do not leave the callers waiting on the event hanging
+        cache.pop(domain)
+        event.set()
+        raise
 
     if integration is not None:
         cache[domain] = integration
@@ -493,6 +642,66 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
     return integration
 
 
+async def async_preimport(
+    hass: "HomeAssistant", integration: Integration, platform_name: Optional[str] = None
+) -> None:
+    """Import an integration or one of its platforms in the executor.
+
+    Integrations with requirements that are not installed yet are skipped.
+    Import errors are ignored, they are reported when importing during setup.
+    """
+    full_name = integration.domain
+    if platform_name is not None:
+        full_name = f"{integration.domain}.{platform_name}"
+
+    if full_name in hass.data.setdefault(DATA_COMPONENTS, {}):
+        return
+
+    pending: Dict[str, asyncio.Future] = hass.data.setdefault(DATA_PENDING_IMPORTS, {})
+    if full_name in pending:
+        await asyncio.wait((pending[full_name],))
+        return
+
+    check_requirements = bool(integration.requirements) and not hass.config.skip_pip
+
+    def import_module() -> Optional[float]:
+        """Import the module and return the import time."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.util import package as pkg_util
+
+        if check_requirements and not all(
+            pkg_util.is_installed(req) for req in integration.requirements
+        ):
+            return None
+
+        start = timer()
+        if platform_name is None:
+            integration.get_component()
+        else:
+            integration.get_platform(platform_name)
+        return timer() - start
+
+    future = pending[full_name] = asyncio.ensure_future(
+        hass.async_add_executor_job(import_module)
+    )
+    try:
+        import_time = await future
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to import %s in the background", full_name, exc_info=True)
+    else:
+        if import_time is not None:
+            hass.data.setdefault(DATA_IMPORT_TIMES, {})[full_name] = import_time
+    finally:
+        pending.pop(full_name, None)
+
+
+async def async_wait_for_preimport(hass: "HomeAssistant", full_name: str) -> None:
+    """Wait for a background import of an integration or platform to finish."""
+    future = hass.data.get(DATA_PENDING_IMPORTS, {}).get(full_name)
+    if future is not None:
+        await asyncio.wait((future,))
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
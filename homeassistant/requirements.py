@@ -1,5 +1,6 @@
 """Module to handle installing requirements."""
 import asyncio
+import logging
 import os
 from typing import Any, Dict, Iterable, List, Optional, Set, Union, cast
 
@@ -19,6 +20,8 @@ DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
     "zeroconf": ("zeroconf", "homekit"),
 }
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class RequirementsNotFound(HomeAssistantError):
     """Raised when a component is not found."""
@@ -133,6 +136,59 @@ async def async_process_requirements(
                 raise RequirementsNotFound(name, [req])
 
 
+async def async_process_requirements_batch(
+    hass: HomeAssistant, integrations: Iterable[Integration]
+) -> None:
+    """Install the missing requirements of integrations with a single pip run.
+
+    Used at startup so a fresh install does not run pip once per
+    requirement. If the batch fails, nothing is raised: each integration
+    installs its requirements one by one in async_process_requirements
+    when it is set up, which reports the requirement that failed.
+    """
+    if hass.config.skip_pip:
+        return
+
+    requirements = sorted(
+        {
+            req
+            for integration in integrations
+            if not integration.disabled
+            for req in integration.requirements
+        }
+    )
+    if not requirements:
+        return
+
+    pip_lock = hass.data.get(DATA_PIP_LOCK)
+    if pip_lock is None:
+        pip_lock = hass.data[DATA_PIP_LOCK] = asyncio.Lock()
+
+    kwargs = pip_kwargs(hass.config.config_dir)
+
+    async with pip_lock:
+        missing = await hass.async_add_executor_job(_missing_requirements, requirements)
+        if not missing:
+            return
+
+        _LOGGER.info("Installing %s missing requirements", len(missing))
+
+        def _install(reqs: List[str], kwargs: Dict) -> bool:
+            """Install requirements."""
+            return pkg_util.install_packages(reqs, **kwargs)
+
+        if not await hass.async_add_executor_job(_install, missing, kwargs):
+            _LOGGER.warning(
+                "Unable to install requirements in one batch, "
+                "they will be installed one at a time"
+            )
+
+
+def _missing_requirements(requirements: List[str]) -> List[str]:
+    """Return the requirements which are not installed."""
+    return [req for req in requirements if not pkg_util.is_installed(req)]
+
+
 def pip_kwargs(config_dir: Optional[str]) -> Dict[str, Any]:
     """Return keyword arguments for PIP install."""
     is_docker = pkg_util.is_docker_env()
@@ -6,6 +6,7 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
@@ -323,6 +324,82 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def auth_middleware_requests(hass):
+    """Authenticate 100k requests with a bearer token through the middleware."""
+    # pylint: disable=import-outside-toplevel
+    from aiohttp import hdrs, web
+    from aiohttp.test_utils import make_mocked_request
+
+    from homeassistant.auth import auth_manager_from_config
+    from homeassistant.components.http.auth import setup_auth
+
+    count = 10 ** 5
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.auth = await auth_manager_from_config(hass, [], [])
+        user = await hass.auth.async_create_user("Benchmark")
+        refresh_token = await hass.auth.async_create_refresh_token(
+            user, "http://benchmark.local/"
+        )
+        access_token = hass.auth.async_create_access_token(refresh_token)
+
+        app = web.Application()
+        setup_auth(hass, app)
+        middleware = app.middlewares[-1]
+
+        async def handler(request):
+            """Return an empty response."""
+            return None
+
+        request = make_mocked_request(
+            "GET",
+            "/api/states",
+            headers={hdrs.AUTHORIZATION: f"Bearer {access_token}"},
+            app=app,
+        )
+
+        start = timer()
+        for _ in range(count):
+            await middleware(request, handler)
+        runtime = timer() - start
+
+        print(f"Authenticated {count / runtime:.0f} requests/s")
+        return runtime
+
+
+@benchmark
+async def active_zone(hass):
+    """Find the active zone of 100k locations among 5000 zones."""
+    # pylint: disable=import-outside-toplevel
+    import random
+
+    from homeassistant.components import zone
+
+    rng = random.Random(0)
+    for idx in range(5000):
+        hass.states.async_set(
+            f"zone.zone_{idx}",
+            "zoning",
+            {
+                "latitude": rng.uniform(50, 53),
+                "longitude": rng.uniform(3, 7),
+                "radius": rng.choice([100, 250, 1000, 5000]),
+            },
+        )
+
+    locations = [
+        (rng.uniform(50, 53), rng.uniform(3, 7), rng.choice([0, 20, 100]))
+        for _ in range(10 ** 5)
+    ]
+
+    start = timer()
+    for latitude, longitude, radius in locations:
+        zone.async_active_zone(hass, latitude, longitude, radius)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -3,7 +3,7 @@ import asyncio
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -20,6 +20,7 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
@@ -34,6 +35,97 @@ def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str])
     hass.data[DATA_SETUP_DONE] = {domain: asyncio.Event() for domain in domains}
 
 
+@core.callback
+def async_record_setup_phase(
+    hass: core.HomeAssistant, name: str, phase: str, start: float, end: float
+) -> None:
+    """Record a phase of setting up an integration or platform during startup."""
+    if hass.state != core.CoreState.running:
+        timeline = hass.data.setdefault(DATA_SETUP_TIMELINE, {})
+        timeline.setdefault(name, []).append((phase, start, end))
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> Dict[str, Any]:
+    """Return the startup timeline and its critical path.
+
+    Times are in seconds since the first recorded phase. The critical path
+    follows, from the integration that finished last, the dependency that
+    finished last. The own time of each integration on it is the most that
+    shortening that integration can gain.
+    """
+    timeline: Dict[str, List[Tuple[str, float, float]]] = hass.data.get(
+        DATA_SETUP_TIMELINE, {}
+    )
+    if not timeline:
+        return {"timeline": {}, "critical_path": []}
+
+    origin = min(start for phases in timeline.values() for _, start, _ in phases)
+    ends: Dict[str, float] = {
+        name: max(end for _, _, end in phases) - origin
+        for name, phases in timeline.items()
+    }
+    integrations: Dict[str, loader.Integration] = {
+        domain: int_or_evt
+        for domain, int_or_evt in hass.data.get(loader.DATA_INTEGRATIONS, {}).items()
+        if isinstance(int_or_evt, loader.Integration)
+    }
+
+    critical_path = []
+    name: Optional[str] = max(ends, key=ends.__getitem__)
+    while name is not None:
+        critical_path.append(
+            {
+                "name": name,
+                "end": ends[name],
+                "own_time": sum(
+                    end - start
+                    for phase, start, end in timeline[name]
+                    if phase != "dependencies"
+                ),
+            }
+        )
+        integration = integrations.get(name)
+        if integration is None:
+            break
+        deps = [
+            dep
+            for dep in integration.dependencies + integration.after_dependencies
+            if dep in ends
+        ]
+        name = max(deps, key=ends.__getitem__) if deps else None
+
+    return {
+        "timeline": {
+            name: [
+                {"phase": phase, "start": start - origin, "end": end - origin}
+                for phase, start, end in phases
+            ]
+            for name, phases in timeline.items()
+        },
+        "critical_path": critical_path,
+    }
+
+
+def setup_timeline_to_chrome_trace(timeline: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a setup timeline to the Chrome trace event format."""
+    return {
+        "traceEvents": [
+            {
+                "name": phase["phase"],
+                "cat": "setup",
+                "ph": "X",
+                "ts": round(phase["start"] * 1000000),
+                "dur": round((phase["end"] - phase["start"]) * 1000000),
+                "pid": 1,
+                "tid": name,
+            }
+            for name, phases in timeline["timeline"].items()
+            for phase in phases
+        ]
+    }
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -160,6 +252,10 @@ async def _async_setup_component(
         log_error(str(err), integration.documentation)
         return False
 
+    # Avoid importing on the event loop while a background import is running
+    start = timer()
+    await loader.async_wait_for_preimport(hass, domain)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
@@ -170,6 +266,7 @@ async def _async_setup_component(
     except Exception:  # pylint: disable=broad-except
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
+    async_record_setup_phase(hass, domain, "import", start, timer())
 
     processed_config = await conf_util.async_process_component_config(
         hass, config, integration
@@ -230,6 +327,7 @@ async def _async_setup_component(
         if warn_task:
             warn_task.cancel()
     _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
+    async_record_setup_phase(hass, domain, "setup", start, end)
 
     if result is False:
         log_error("Integration failed to initialize.")
@@ -247,12 +345,13 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
-    )
+    entries = hass.config_entries.async_entries(domain)
+    if entries:
+        start = timer()
+        await asyncio.gather(
+            *[entry.async_setup(hass, integration=integration) for entry in entries]
+        )
+        async_record_setup_phase(hass, domain, "config_entries", start, timer())
 
     hass.config.components.add(domain)
     hass.data[DATA_SETUP_STARTED].pop(domain)
@@ -294,6 +393,8 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await loader.async_wait_for_preimport(hass, f"{platform_name}.{domain}")
+
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -335,14 +436,20 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
+    start = timer()
     if not await _async_process_dependencies(hass, config, integration):
         raise HomeAssistantError("Could not set up all dependencies.")
+    async_record_setup_phase(hass, integration.domain, "dependencies", start, timer())
 
     if not hass.config.skip_pip and integration.requirements:
+        start = timer()
         async with hass.timeout.async_freeze(integration.domain):
             await requirements.async_get_integration_with_requirements(
                 hass, integration.domain
             )
+        async_record_setup_phase(
+            hass, integration.domain, "requirements", start, timer()
+        )
 
     processed.add(integration.domain)
 
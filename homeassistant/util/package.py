@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from subprocess import PIPE, Popen
 import sys
-from typing import Optional
+from typing import List, Optional
 from urllib.parse import urlparse
 
 import pkg_resources
@@ -68,10 +68,29 @@ def install_package(
 
     Return boolean if install successful.
     """
+    return install_packages(
+        [package], upgrade, target, constraints, find_links, no_cache_dir
+    )
+
+
+def install_packages(
+    packages: List[str],
+    upgrade: bool = True,
+    target: Optional[str] = None,
+    constraints: Optional[str] = None,
+    find_links: Optional[str] = None,
+    no_cache_dir: Optional[bool] = False,
+) -> bool:
+    """Install packages on PyPi with a single pip invocation.
+
+    Pip resolves the packages together, so nothing is installed if one of
+    them can not be installed. Return boolean if install successful.
+    """
+    package = ", ".join(packages)
     # Not using 'import pip; pip.main([])' because it breaks the logger
     _LOGGER.info("Attempting install of %s", package)
     env = os.environ.copy()
-    args = [sys.executable, "-m", "pip", "install", "--quiet", package]
+    args = [sys.executable, "-m", "pip", "install", "--quiet", *packages]
     if no_cache_dir:
         args.append("--no-cache-dir")
     if upgrade:
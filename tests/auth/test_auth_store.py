@@ -242,3 +242,22 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_lookups(hass):
+    """Test refresh tokens are looked up by id and token."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Test User")
+    refresh_token = await store.async_create_refresh_token(user, "http://client/")
+
+    assert await store.async_get_refresh_token(refresh_token.id) is refresh_token
+    assert (
+        await store.async_get_refresh_token_by_token(refresh_token.token)
+        is refresh_token
+    )
+    assert await store.async_get_refresh_token_by_token("invalid") is None
+
+    await store.async_remove_user(user)
+
+    assert await store.async_get_refresh_token(refresh_token.id) is None
+    assert await store.async_get_refresh_token_by_token(refresh_token.token) is None
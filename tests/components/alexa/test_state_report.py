@@ -1,8 +1,12 @@
 """Test report state."""
 from homeassistant.components.alexa import state_report
+from homeassistant.components.alexa.entities import ENTITY_ADAPTERS
+from homeassistant.components.alexa.errors import NoTokenAvailable
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.async_mock import patch
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -88,6 +92,107 @@ async def test_report_state_instance(hass, aioclient_mock):
     assert call_json["event"]["endpoint"]["endpointId"] == "fan#test_fan"
 
 
+async def test_report_state_merged(hass, aioclient_mock):
+    """Test queued changes of the same endpoint are merged."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    def alexa_entity(entity_id, state):
+        """Create an Alexa entity for a state."""
+        hass.states.async_set(
+            entity_id,
+            state,
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        return ENTITY_ADAPTERS["binary_sensor"](
+            hass, DEFAULT_CONFIG, hass.states.get(entity_id)
+        )
+
+    queue = state_report.ChangeReportQueue(hass, DEFAULT_CONFIG, max_concurrent=1)
+    queue.async_enqueue(alexa_entity("binary_sensor.test_contact", "on"))
+    queue.async_enqueue(alexa_entity("binary_sensor.test_other", "on"))
+    queue.async_enqueue(alexa_entity("binary_sensor.test_contact", "off"))
+    assert queue.depth == 2
+
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    first, second = (call[2]["event"] for call in aioclient_mock.mock_calls)
+    assert first["endpoint"]["endpointId"] == "binary_sensor#test_contact"
+    assert first["payload"]["change"]["properties"][0]["value"] == "NOT_DETECTED"
+    assert second["endpoint"]["endpointId"] == "binary_sensor#test_other"
+
+    statistics = queue.statistics
+    assert statistics["depth"] == 0
+    assert statistics["sent"] == 2
+    assert statistics["merged"] == 1
+    assert statistics["last_latency"] is not None
+
+
+async def test_report_state_token_failure(hass, aioclient_mock):
+    """Test the queue is cleared when no access token is available."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    queue = state_report.ChangeReportQueue(hass, DEFAULT_CONFIG, max_concurrent=1)
+    for idx in range(3):
+        entity_id = f"binary_sensor.test_{idx}"
+        hass.states.async_set(entity_id, "on", {"device_class": "door"})
+        queue.async_enqueue(
+            ENTITY_ADAPTERS["binary_sensor"](
+                hass, DEFAULT_CONFIG, hass.states.get(entity_id)
+            )
+        )
+
+    with patch.object(
+        DEFAULT_CONFIG, "async_get_access_token", side_effect=NoTokenAvailable
+    ):
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 0
+    assert queue.depth == 0
+    assert queue.failed == 1
+    assert queue.sent == 0
+
+
+async def test_ws_change_report_statistics(hass, hass_ws_client, aioclient_mock):
+    """Test the ChangeReport statistics websocket command."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    hass.states.async_set("binary_sensor.test_contact", "on", {"device_class": "door"})
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", {"device_class": "door"})
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "alexa/change_report_statistics"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert len(response["result"]) == 1
+    assert response["result"][0]["endpoint"] == TEST_URL
+    assert response["result"][0]["sent"] == 1
+    assert response["result"][0]["depth"] == 0
+
+    unsub()
+    assert hass.data[state_report.DATA_CHANGE_REPORT_QUEUES] == []
+
+
+async def test_token_bucket(hass):
+    """Test the token bucket waits once the burst is used up."""
+    bucket = state_report.TokenBucket(rate=2, burst=2)
+
+    with patch.object(state_report.asyncio, "sleep") as mock_sleep:
+        await bucket.async_acquire()
+        await bucket.async_acquire()
+        assert not mock_sleep.called
+
+        mock_sleep.side_effect = lambda delay: setattr(bucket, "_tokens", 1)
+        await bucket.async_acquire()
+
+    assert len(mock_sleep.mock_calls) == 1
+    assert 0 < mock_sleep.mock_calls[0][1][0] <= 0.5
+
+
 async def test_send_add_or_update_message(hass, aioclient_mock):
     """Test sending an AddOrUpdateReport message."""
     aioclient_mock.post(TEST_URL, text="")
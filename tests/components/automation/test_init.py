@@ -1121,6 +1121,50 @@ async def test_extraction_functions(hass):
     }
 
 
+async def test_reference_index_reload(hass):
+    """Test the reference index follows reloads of automations."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {
+                    "service": "test.automation",
+                    "target": {"entity_id": "light.hello", "area_id": "kitchen"},
+                },
+            }
+        },
+    )
+
+    assert automation.automations_with_entity(hass, "light.hello") == [
+        "automation.hello"
+    ]
+    assert automation.automations_with_area(hass, "kitchen") == ["automation.hello"]
+    assert automation.areas_in_automation(hass, "automation.hello") == ["kitchen"]
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            automation.DOMAIN: {
+                "alias": "bye",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {
+                    "service": "test.automation",
+                    "target": {"entity_id": "light.bye"},
+                },
+            }
+        },
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert automation.automations_with_entity(hass, "light.hello") == []
+    assert automation.automations_with_area(hass, "kitchen") == []
+    assert automation.automations_with_entity(hass, "light.bye") == ["automation.bye"]
+
+
 async def test_logbook_humanify_automation_triggered_event(hass):
     """Test humanifying Automation Trigger event."""
     hass.config.components.add("recorder")
@@ -1,201 +1,279 @@
 """The tests for the Command line sensor platform."""
-import unittest
+import asyncio
+from datetime import timedelta
+import os
 
-from homeassistant.components.command_line import sensor as command_line
-from homeassistant.helpers.template import Template
+from homeassistant import setup
+from homeassistant.components.command_line import (
+    DATA_COMMAND_SEMAPHORE,
+    sensor as command_line,
+)
+from homeassistant.components.sensor import DOMAIN
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import patch
-from tests.common import get_test_home_assistant
+from tests.common import async_fire_time_changed
 
 
-class TestCommandSensorSensor(unittest.TestCase):
-    """Test the Command line sensor."""
+async def setup_test_sensors(hass, *configs):
+    """Set up command line sensors."""
+    assert await setup.async_setup_component(
+        hass,
+        DOMAIN,
+        {DOMAIN: [{"platform": "command_line", **config} for config in configs]},
+    )
+    await hass.async_block_till_done()
 
-    def setUp(self):
-        """Set up things to be run when tests are started."""
-        self.hass = get_test_home_assistant()
-        self.addCleanup(self.hass.stop)
 
-    def update_side_effect(self, data):
-        """Side effect function for mocking CommandSensorData.update()."""
-        self.commandline.data = data
-
-    def test_setup(self):
-        """Test sensor setup."""
-        config = {
+async def test_setup(hass):
+    """Test sensor setup."""
+    await setup_test_sensors(
+        hass,
+        {
             "name": "Test",
             "unit_of_measurement": "in",
             "command": "echo 5",
             "command_timeout": 15,
-        }
-        devices = []
-
-        def add_dev_callback(devs, update):
-            """Add callback to add devices."""
-            for dev in devs:
-                devices.append(dev)
-
-        command_line.setup_platform(self.hass, config, add_dev_callback)
-
-        assert len(devices) == 1
-        entity = devices[0]
-        entity.update()
-        assert entity.name == "Test"
-        assert entity.unit_of_measurement == "in"
-        assert entity.state == "5"
-
-    def test_template(self):
-        """Test command sensor with template."""
-        data = command_line.CommandSensorData(self.hass, "echo 50", 15)
-
-        entity = command_line.CommandSensor(
-            self.hass,
-            data,
-            "test",
-            "in",
-            Template("{{ value | multiply(0.1) }}", self.hass),
-            [],
-        )
+        },
+    )
+
+    entity_state = hass.states.get("sensor.test")
+    assert entity_state.state == "5"
+    assert entity_state.attributes["unit_of_measurement"] == "in"
+
+
+async def test_template(hass):
+    """Test command sensor with template."""
+    await setup_test_sensors(
+        hass,
+        {
+            "name": "Test",
+            "command": "echo 50",
+            "value_template": "{{ value | multiply(0.1) }}",
+        },
+    )
+
+    assert float(hass.states.get("sensor.test").state) == 5
+
+
+async def test_template_render(hass):
+    """Ensure command with templates get rendered properly."""
+    hass.states.async_set("sensor.test_state", "Works")
+    data = command_line.CommandSensorData(
+        hass, "echo {{ states.sensor.test_state.state }}", 15
+    )
+    await data.async_update()
 
-        entity.update()
-        assert float(entity.state) == 5
+    assert data.value == "Works"
 
-    def test_template_render(self):
-        """Ensure command with templates get rendered properly."""
-        self.hass.states.set("sensor.test_state", "Works")
+
+async def test_template_render_with_quote(hass):
+    """Ensure command with templates and quotes get rendered properly."""
+    hass.states.async_set("sensor.test_state", "Works 2")
+    with patch(
+        "homeassistant.components.command_line.sensor.async_run_command",
+        return_value=("Works", 0.1),
+    ) as check_output:
         data = command_line.CommandSensorData(
-            self.hass, "echo {{ states.sensor.test_state.state }}", 15
+            hass,
+            'echo "{{ states.sensor.test_state.state }}" "3 4"',
+            15,
         )
-        data.update()
-
-        assert data.value == "Works"
-
-    def test_template_render_with_quote(self):
-        """Ensure command with templates and quotes get rendered properly."""
-        self.hass.states.set("sensor.test_state", "Works 2")
-        with patch(
-            "homeassistant.components.command_line.subprocess.check_output",
-            return_value=b"Works\n",
-        ) as check_output:
-            data = command_line.CommandSensorData(
-                self.hass,
-                'echo "{{ states.sensor.test_state.state }}" "3 4"',
-                15,
-            )
-            data.update()
-
-        assert data.value == "Works"
-        check_output.assert_called_once_with(
-            'echo "Works 2" "3 4"', shell=True, timeout=15  # nosec # shell by design
+        await data.async_update()
+
+    assert data.value == "Works"
+    check_output.assert_called_once_with(hass, 'echo "Works 2" "3 4"', 15)
+
+
+async def test_bad_command(hass):
+    """Test bad command."""
+    data = command_line.CommandSensorData(hass, "asdfasdf", 15)
+    await data.async_update()
+
+    assert data.value is None
+    assert data.statistics["runs"] == 1
+    assert data.statistics["failures"] == 1
+
+
+async def test_command_timeout(hass):
+    """Test a command running longer than its timeout."""
+    data = command_line.CommandSensorData(hass, "sleep 10", 0.1)
+    await data.async_update()
+
+    assert data.value is None
+
+
+async def test_command_timeout_process_exited(hass):
+    """Test a timed out command whose processes exited before being killed."""
+    killpg = os.killpg
+
+    def kill_exited(pgid, sig):
+        killpg(pgid, sig)
+        raise ProcessLookupError
+
+    with patch("os.killpg", side_effect=kill_exited):
+        data = command_line.CommandSensorData(hass, "sleep 10", 0.1)
+        await data.async_update()
+
+    assert data.value is None
+    assert data.statistics["failures"] == 1
+
+
+async def test_runtime_excludes_waiting(hass):
+    """Test the runtime of a command does not include waiting for others."""
+    semaphore = hass.data[DATA_COMMAND_SEMAPHORE] = asyncio.Semaphore(1)
+    data = command_line.CommandSensorData(hass, "echo 5", 15)
+
+    async with semaphore:
+        update = hass.async_create_task(data.async_update())
+        await asyncio.sleep(0.5)
+        assert not update.done()
+
+    await update
+    assert data.value == "5"
+    assert data.last_runtime < 0.5
+
+
+async def test_sensors_share_command(hass):
+    """Test sensors running the same command share one run per interval."""
+    now = dt_util.utcnow()
+    with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        await setup_test_sensors(
+            hass,
+            {"name": "First", "command": "echo 5", "scan_interval": 60},
+            {
+                "name": "Second",
+                "command": "echo 5",
+                "scan_interval": 60,
+                "value_template": "{{ value | multiply(2) }}",
+            },
         )
+    data = hass.data[command_line.DATA_COMMAND_SENSOR_DATA][("echo 5", 15)]
 
-    def test_bad_command(self):
-        """Test bad command."""
-        data = command_line.CommandSensorData(self.hass, "asdfasdf", 15)
-        data.update()
+    with patch(
+        "homeassistant.components.command_line.sensor.async_run_command",
+        return_value=("6", 0.1),
+    ) as check_output:
+        now += timedelta(seconds=61)
+        with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+            async_fire_time_changed(hass, now)
+            await hass.async_block_till_done()
 
-        assert data.value is None
+    assert check_output.call_count == 1
+    assert hass.states.get("sensor.first").state == "6"
+    assert hass.states.get("sensor.second").state == "12.0"
+    assert data.statistics["shared"] >= 1
 
-    def test_update_with_json_attrs(self):
-        """Test attributes get extracted from a JSON result."""
-        data = command_line.CommandSensorData(
-            self.hass,
-            (
+
+async def test_ws_command_statistics(hass, hass_ws_client):
+    """Test the command statistics websocket command."""
+    await setup_test_sensors(hass, {"name": "Test", "command": "echo 5"})
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "command_line/statistics"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    statistics = msg["result"][0]
+    assert statistics["command"] == "echo 5"
+    assert statistics["runs"] == 1
+    assert statistics["failures"] == 0
+    assert statistics["last_runtime"] is not None
+
+
+async def test_update_with_json_attrs(hass):
+    """Test attributes get extracted from a JSON result."""
+    await setup_test_sensors(
+        hass,
+        {
+            "name": "Test",
+            "command": (
                 'echo { \\"key\\": \\"some_json_value\\", \\"another_key\\":\
              \\"another_json_value\\", \\"key_three\\": \\"value_three\\" }'
             ),
-            15,
-        )
+            "json_attributes": ["key", "another_key", "key_three"],
+        },
+    )
 
-        self.sensor = command_line.CommandSensor(
-            self.hass, data, "test", None, None, ["key", "another_key", "key_three"]
-        )
-        self.sensor.update()
-        assert self.sensor.device_state_attributes["key"] == "some_json_value"
-        assert (
-            self.sensor.device_state_attributes["another_key"] == "another_json_value"
-        )
-        assert self.sensor.device_state_attributes["key_three"] == "value_three"
-
-    @patch("homeassistant.components.command_line.sensor._LOGGER")
-    def test_update_with_json_attrs_no_data(self, mock_logger):
-        """Test attributes when no JSON result fetched."""
-        data = command_line.CommandSensorData(self.hass, "echo ", 15)
-        self.sensor = command_line.CommandSensor(
-            self.hass, data, "test", None, None, ["key"]
-        )
-        self.sensor.update()
-        assert {} == self.sensor.device_state_attributes
-        assert mock_logger.warning.called
-
-    @patch("homeassistant.components.command_line.sensor._LOGGER")
-    def test_update_with_json_attrs_not_dict(self, mock_logger):
-        """Test attributes get extracted from a JSON result."""
-        data = command_line.CommandSensorData(self.hass, "echo [1, 2, 3]", 15)
-        self.sensor = command_line.CommandSensor(
-            self.hass, data, "test", None, None, ["key"]
-        )
-        self.sensor.update()
-        assert {} == self.sensor.device_state_attributes
-        assert mock_logger.warning.called
+    entity_state = hass.states.get("sensor.test")
+    assert entity_state.attributes["key"] == "some_json_value"
+    assert entity_state.attributes["another_key"] == "another_json_value"
+    assert entity_state.attributes["key_three"] == "value_three"
 
-    @patch("homeassistant.components.command_line.sensor._LOGGER")
-    def test_update_with_json_attrs_bad_JSON(self, mock_logger):
-        """Test attributes get extracted from a JSON result."""
-        data = command_line.CommandSensorData(
-            self.hass, "echo This is text rather than JSON data.", 15
-        )
-        self.sensor = command_line.CommandSensor(
-            self.hass, data, "test", None, None, ["key"]
-        )
-        self.sensor.update()
-        assert {} == self.sensor.device_state_attributes
-        assert mock_logger.warning.called
 
-    def test_update_with_missing_json_attrs(self):
-        """Test attributes get extracted from a JSON result."""
-        data = command_line.CommandSensorData(
-            self.hass,
-            (
+async def test_update_with_json_attrs_no_data(hass, caplog):
+    """Test attributes when no JSON result fetched."""
+    await setup_test_sensors(
+        hass, {"name": "Test", "command": "echo ", "json_attributes": ["key"]}
+    )
+
+    assert "key" not in hass.states.get("sensor.test").attributes
+    assert "Empty reply found when expecting JSON data" in caplog.text
+
+
+async def test_update_with_json_attrs_not_dict(hass, caplog):
+    """Test attributes get extracted from a JSON result."""
+    await setup_test_sensors(
+        hass,
+        {"name": "Test", "command": "echo [1, 2, 3]", "json_attributes": ["key"]},
+    )
+
+    assert "key" not in hass.states.get("sensor.test").attributes
+    assert "JSON result was not a dictionary" in caplog.text
+
+
+async def test_update_with_json_attrs_bad_JSON(hass, caplog):
+    """Test attributes get extracted from a JSON result."""
+    await setup_test_sensors(
+        hass,
+        {
+            "name": "Test",
+            "command": "echo This is text rather than JSON data.",
+            "json_attributes": ["key"],
+        },
+    )
+
+    assert "key" not in hass.states.get("sensor.test").attributes
+    assert "Unable to parse output as JSON" in caplog.text
+
+
+async def test_update_with_missing_json_attrs(hass):
+    """Test attributes get extracted from a JSON result."""
+    await setup_test_sensors(
+        hass,
+        {
+            "name": "Test",
+            "command": (
                 'echo { \\"key\\": \\"some_json_value\\", \\"another_key\\":\
              \\"another_json_value\\", \\"key_three\\": \\"value_three\\" }'
             ),
-            15,
-        )
+            "json_attributes": ["key", "another_key", "key_three", "special_key"],
+        },
+    )
 
-        self.sensor = command_line.CommandSensor(
-            self.hass,
-            data,
-            "test",
-            None,
-            None,
-            ["key", "another_key", "key_three", "special_key"],
-        )
-        self.sensor.update()
-        assert self.sensor.device_state_attributes["key"] == "some_json_value"
-        assert (
-            self.sensor.device_state_attributes["another_key"] == "another_json_value"
-        )
-        assert self.sensor.device_state_attributes["key_three"] == "value_three"
-        assert "special_key" not in self.sensor.device_state_attributes
+    entity_state = hass.states.get("sensor.test")
+    assert entity_state.attributes["key"] == "some_json_value"
+    assert entity_state.attributes["another_key"] == "another_json_value"
+    assert entity_state.attributes["key_three"] == "value_three"
+    assert "special_key" not in entity_state.attributes
 
-    def test_update_with_unnecessary_json_attrs(self):
-        """Test attributes get extracted from a JSON result."""
-        data = command_line.CommandSensorData(
-            self.hass,
-            (
+
+async def test_update_with_unnecessary_json_attrs(hass):
+    """Test attributes get extracted from a JSON result."""
+    await setup_test_sensors(
+        hass,
+        {
+            "name": "Test",
+            "command": (
                 'echo { \\"key\\": \\"some_json_value\\", \\"another_key\\":\
              \\"another_json_value\\", \\"key_three\\": \\"value_three\\" }'
             ),
-            15,
-        )
+            "json_attributes": ["key", "another_key"],
+        },
+    )
 
-        self.sensor = command_line.CommandSensor(
-            self.hass, data, "test", None, None, ["key", "another_key"]
-        )
-        self.sensor.update()
-        assert self.sensor.device_state_attributes["key"] == "some_json_value"
-        assert (
-            self.sensor.device_state_attributes["another_key"] == "another_json_value"
-        )
-        assert "key_three" not in self.sensor.device_state_attributes
+    entity_state = hass.states.get("sensor.test")
+    assert entity_state.attributes["key"] == "some_json_value"
+    assert entity_state.attributes["another_key"] == "another_json_value"
+    assert "key_three" not in entity_state.attributes
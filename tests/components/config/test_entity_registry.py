@@ -107,6 +107,8 @@ async def test_get_entity(hass, client):
         "original_name": None,
         "original_icon": None,
         "capabilities": None,
+        "min_write_interval": None,
+        "significant_change": None,
         "unique_id": "1234",
     }
 
@@ -131,6 +133,8 @@ async def test_get_entity(hass, client):
         "original_name": None,
         "original_icon": None,
         "capabilities": None,
+        "min_write_interval": None,
+        "significant_change": None,
         "unique_id": "6789",
     }
 
@@ -186,6 +190,8 @@ async def test_update_entity(hass, client):
             "original_name": None,
             "original_icon": None,
             "capabilities": None,
+            "min_write_interval": None,
+            "significant_change": None,
             "unique_id": "1234",
         }
     }
@@ -234,6 +240,8 @@ async def test_update_entity(hass, client):
             "original_name": None,
             "original_icon": None,
             "capabilities": None,
+            "min_write_interval": None,
+            "significant_change": None,
             "unique_id": "1234",
         },
         "reload_delay": 30,
@@ -288,6 +296,8 @@ async def test_update_entity_require_restart(hass, client):
             "original_name": None,
             "original_icon": None,
             "capabilities": None,
+            "min_write_interval": None,
+            "significant_change": None,
             "unique_id": "1234",
         },
         "require_restart": True,
@@ -389,6 +399,8 @@ async def test_update_entity_no_changes(hass, client):
             "original_name": None,
             "original_icon": None,
             "capabilities": None,
+            "min_write_interval": None,
+            "significant_change": None,
             "unique_id": "1234",
         }
     }
@@ -469,6 +481,8 @@ async def test_update_entity_id(hass, client):
             "original_name": None,
             "original_icon": None,
             "capabilities": None,
+            "min_write_interval": None,
+            "significant_change": None,
             "unique_id": "1234",
         }
     }
@@ -626,3 +626,78 @@ def test_see_schema_allowing_ios_calls():
             "hostname": "beer",
         }
     )
+
+
+async def test_new_devices_written_in_one_batch(hass, yaml_devices):
+    """Test devices seen within the write delay are written together."""
+    with open(yaml_devices, "w") as fdesc:
+        fdesc.write("# Keep this comment\n")
+
+    tracker = legacy.DeviceTracker(hass, timedelta(seconds=180), True, {}, [])
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.update_config_devices",
+        wraps=legacy.update_config_devices,
+    ) as mock_write:
+        for idx in range(5):
+            await tracker.async_see(dev_id=f"device_{idx}")
+        await hass.async_block_till_done()
+
+    assert mock_write.call_count == 1
+    assert len(mock_write.call_args[0][1]) == 5
+
+    with open(yaml_devices) as fdesc:
+        assert fdesc.read().startswith("# Keep this comment\n")
+
+    config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=0))
+    assert sorted(device.dev_id for device in config) == [
+        f"device_{idx}" for idx in range(5)
+    ]
+
+
+async def test_update_stale_only_checks_expired_devices(hass, yaml_devices):
+    """Test stale devices are taken from the expiry queue."""
+    tracker = legacy.DeviceTracker(hass, timedelta(seconds=60), True, {}, [])
+    register_time = dt_util.utcnow()
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.dt_util.utcnow",
+        return_value=register_time,
+    ):
+        await tracker.async_see(mac="AA:BB", source_type=const.SOURCE_TYPE_ROUTER)
+        await tracker.async_see(
+            mac="CC:DD",
+            source_type=const.SOURCE_TYPE_ROUTER,
+            consider_home=timedelta(seconds=600),
+        )
+    await hass.async_block_till_done()
+
+    device = tracker.mac_to_dev["AA:BB"]
+    assert hass.states.get(device.entity_id).state == STATE_HOME
+    assert len(tracker._stale_queue) == 2
+
+    # Seen again before it expired, so it is queued again with a later expiry
+    with patch(
+        "homeassistant.components.device_tracker.legacy.dt_util.utcnow",
+        return_value=register_time + timedelta(seconds=30),
+    ):
+        await tracker.async_see(mac="AA:BB", source_type=const.SOURCE_TYPE_ROUTER)
+        tracker.async_update_stale(register_time + timedelta(seconds=61))
+        await hass.async_block_till_done()
+
+    assert hass.states.get(device.entity_id).state == STATE_HOME
+    assert len(tracker._stale_queue) == 2
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.dt_util.utcnow",
+        return_value=register_time + timedelta(seconds=91),
+    ):
+        tracker.async_update_stale(register_time + timedelta(seconds=91))
+        await hass.async_block_till_done()
+
+    assert hass.states.get(device.entity_id).state == STATE_NOT_HOME
+    other = tracker.mac_to_dev["CC:DD"]
+    assert hass.states.get(other.entity_id).state == STATE_HOME
+    assert tracker._stale_queue == [
+        (register_time + timedelta(seconds=600), other.dev_id)
+    ]
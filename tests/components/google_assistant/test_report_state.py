@@ -1,8 +1,13 @@
 """Test Google report state."""
+from datetime import timedelta
+
 from homeassistant.components.google_assistant import error, report_state
+from homeassistant.components.google_assistant.const import REPORT_STATE_BASE_URL
+from homeassistant.components.google_assistant.http import GoogleConfig
 from homeassistant.util.dt import utcnow
 
 from . import BASIC_CONFIG
+from .test_http import DUMMY_CONFIG, MOCK_TOKEN
 
 from tests.async_mock import AsyncMock, patch
 from tests.common import async_fire_time_changed
@@ -37,6 +42,12 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -52,6 +63,10 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
@@ -64,6 +79,10 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -75,5 +94,138 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test state changes within the window are coalesced into one report."""
+    for idx in range(3):
+        hass.states.async_set(f"light.light_{idx}", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(
+        report_state.GoogleEntity,
+        "query_serialize",
+        autospec=True,
+        side_effect=lambda entity: {"on": entity.state.state == "on", "online": True},
+    ) as mock_serialize:
+        for idx in range(3):
+            hass.states.async_set(f"light.light_{idx}", "on")
+        # Changed back before the window closed, nothing to report
+        hass.states.async_set("light.light_2", "off")
+        # Changed twice, only the latest state is reported
+        hass.states.async_set("light.light_1", "on", {"brightness": 10})
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    # Old states are never serialized again
+    assert len(mock_serialize.mock_calls) == 5
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.light_0": {"on": True, "online": True},
+                "light.light_1": {"on": True, "online": True},
+            }
+        }
+    }
+
+    unsub()
+
+
+async def test_report_state_pending_dropped(hass, legacy_patchable_time):
+    """Test queued states are not reported once the entity can't be reported."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hidden", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 3600):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.hidden", "on")
+        await hass.async_block_till_done()
+
+        with patch(
+            "homeassistant.components.google_assistant.report_state.GoogleEntity.query_serialize",
+            side_effect=error.SmartHomeError("mock-error", "mock-msg"),
+        ):
+            hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+            await hass.async_block_till_done()
+
+        with patch.object(
+            BASIC_CONFIG,
+            "should_expose",
+            side_effect=lambda state: state.entity_id != "light.hidden",
+        ):
+            hass.states.async_set("light.hidden", "off")
+            await hass.async_block_till_done()
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+    unsub()
+
+
+async def test_report_state_homegraph(hass, aioclient_mock, legacy_patchable_time):
+    """Test batched reports are sent as a single homegraph request."""
+    aioclient_mock.post(REPORT_STATE_BASE_URL, status=200)
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("switch.ac", "off")
+
+    config = GoogleConfig(hass, DUMMY_CONFIG)
+    await config.async_initialize()
+    config._access_token = MOCK_TOKEN["access_token"]
+    config._access_token_renew = utcnow() + timedelta(hours=1)
+    await config.async_connect_agent_user("agent")
+
+    with patch.object(report_state, "INITIAL_REPORT_DELAY", 3600):
+        unsub = report_state.async_enable_report_state(hass, config)
+
+    hass.states.async_set("light.ceiling", "on")
+    hass.states.async_set("switch.ac", "on")
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    payload = aioclient_mock.mock_calls[0][2]
+    assert payload["agentUserId"] == "agent"
+    assert payload["payload"] == {
+        "devices": {
+            "states": {
+                "light.ceiling": {"on": True, "online": True},
+                "switch.ac": {"on": True, "online": True},
+            }
+        }
+    }
+
+    unsub()
@@ -223,6 +223,63 @@ async def test_expand_entity_ids_recursive(hass):
     )
 
 
+async def test_expand_entity_ids_after_membership_changes(hass):
+    """Test cached expansions of nested groups follow membership changes."""
+    assert await async_setup_component(hass, "group", {})
+
+    lights = await group.Group.async_create_group(hass, "lights", ["light.bowl"])
+    await group.Group.async_create_group(
+        hass, "all", ["group.lights", "switch.ac", "light.bowl"]
+    )
+    assert group.expand_entity_ids(hass, ["group.all"]) == ["light.bowl", "switch.ac"]
+
+    await lights.async_update_tracked_entity_ids(["light.bowl", "light.ceiling"])
+    await hass.async_block_till_done()
+    assert group.expand_entity_ids(hass, ["group.all"]) == [
+        "light.bowl",
+        "light.ceiling",
+        "switch.ac",
+    ]
+
+    hass.states.async_remove("group.lights")
+    assert group.expand_entity_ids(hass, ["group.all"]) == ["switch.ac", "light.bowl"]
+
+
+async def test_expand_entity_ids_groups_containing_each_other(hass):
+    """Test expanding groups that contain each other."""
+    assert await async_setup_component(hass, "group", {})
+
+    await group.Group.async_create_group(hass, "first", ["group.second", "light.a"])
+    await group.Group.async_create_group(hass, "second", ["group.first", "light.b"])
+
+    for entity_id in ("group.first", "group.second"):
+        assert sorted(group.expand_entity_ids(hass, [entity_id])) == [
+            "light.a",
+            "light.b",
+        ]
+
+
+async def test_groups_with_entity(hass):
+    """Test finding the groups of an entity as group membership changes."""
+    assert await async_setup_component(hass, "group", {})
+
+    first = await group.Group.async_create_group(
+        hass, "first", ["light.Bowl", "light.ceiling"]
+    )
+    await group.Group.async_create_group(hass, "second", ["light.bowl"])
+    assert group.groups_with_entity(hass, "light.bowl") == [
+        "group.first",
+        "group.second",
+    ]
+    assert group.groups_with_entity(hass, "light.ceiling") == ["group.first"]
+
+    await first.async_update_tracked_entity_ids(["light.ceiling"])
+    assert group.groups_with_entity(hass, "light.bowl") == ["group.second"]
+
+    await hass.data[group.DOMAIN].async_remove_entity("group.first")
+    assert group.groups_with_entity(hass, "light.ceiling") == []
+
+
 async def test_expand_entity_ids_ignores_non_strings(hass):
     """Test that non string elements in lists are ignored."""
     assert [] == group.expand_entity_ids(hass, [5, True])
@@ -0,0 +1,127 @@
+"""The tests for the image_processing pipeline."""
+import asyncio
+import threading
+
+from homeassistant.components import camera
+import homeassistant.components.image_processing as ip
+from homeassistant.components.image_processing.pipeline import ImageProcessingPipeline
+from homeassistant.setup import async_setup_component
+
+from tests.async_mock import patch
+
+
+class DummyProcessor(ip.ImageProcessingEntity):
+    """CPU-only image processing entity that blocks until released."""
+
+    def __init__(self, hass, name):
+        """Initialize the dummy processor."""
+        self.hass = hass
+        self.entity_id = f"image_processing.{name}"
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.processed = []
+
+    @property
+    def camera_entity(self):
+        """Return camera entity id from process pictures."""
+        return "camera.fake"
+
+    def process_image(self, image):
+        """Process image."""
+        self.started.set()
+        self.release.wait(5)
+        self.processed.append(image)
+
+
+async def test_stale_frames_are_dropped(hass):
+    """Test only the latest waiting frame of an entity is processed."""
+    pipeline = hass.data[ip.DATA_PIPELINE] = ImageProcessingPipeline(hass, 1)
+    busy = DummyProcessor(hass, "busy")
+    entity = DummyProcessor(hass, "camera")
+    entity.release.set()
+
+    busy_task = hass.async_create_task(pipeline.async_process(busy, b"busy"))
+    await hass.async_add_executor_job(busy.started.wait, 5)
+
+    first = hass.async_create_task(pipeline.async_process(entity, b"first"))
+    second = hass.async_create_task(pipeline.async_process(entity, b"second"))
+    await asyncio.sleep(0)
+
+    busy.release.set()
+    assert await busy_task is True
+    assert await first is False
+    assert await second is True
+    assert entity.processed == [b"second"]
+
+    stats = pipeline.statistics["unknown"]
+    assert stats.frames_processed == 2
+    assert stats.frames_dropped == 1
+    pipeline.async_shutdown()
+
+
+async def test_unbounded_frames_skip_worker_pool(hass):
+    """Test frames of platforms with their own I/O are not throttled."""
+    pipeline = hass.data[ip.DATA_PIPELINE] = ImageProcessingPipeline(hass, 1)
+    busy = DummyProcessor(hass, "busy")
+
+    class CloudProcessor(DummyProcessor):
+        """Processor that implements its own async processing."""
+
+        async def async_process_image(self, image):
+            """Process image."""
+            self.processed.append(image)
+
+    cloud = CloudProcessor(hass, "cloud")
+
+    busy_task = hass.async_create_task(pipeline.async_process(busy, b"busy"))
+    await hass.async_add_executor_job(busy.started.wait, 5)
+
+    with patch(
+        "homeassistant.components.camera.async_get_image",
+        return_value=camera.Image("image/jpeg", b"frame"),
+    ):
+        await cloud.async_update()
+
+    assert cloud.processed == [b"frame"]
+    assert not busy_task.done()
+
+    busy.release.set()
+    assert await busy_task is True
+    assert pipeline.statistics["unknown"].frames_processed == 2
+    pipeline.async_shutdown()
+
+
+async def test_update_records_fetch_statistics(hass):
+    """Test the entity update fetches a frame and processes it in the pipeline."""
+    pipeline = hass.data[ip.DATA_PIPELINE] = ImageProcessingPipeline(hass, 2)
+    entity = DummyProcessor(hass, "camera")
+    entity.release.set()
+
+    with patch(
+        "homeassistant.components.camera.async_get_image",
+        return_value=camera.Image("image/jpeg", b"frame"),
+    ):
+        await entity.async_update()
+
+    assert entity.processed == [b"frame"]
+    stats = pipeline.statistics["unknown"].as_dict()
+    assert stats["frames_fetched"] == 1
+    assert stats["frames_processed"] == 1
+    assert stats["last_fetch_latency"] is not None
+    pipeline.async_shutdown()
+
+
+async def test_ws_statistics(hass, hass_ws_client):
+    """Test the pipeline statistics websocket command."""
+    assert await async_setup_component(
+        hass, ip.DOMAIN, {ip.DOMAIN: {"platform": "demo"}}
+    )
+    await hass.async_block_till_done()
+    hass.data[ip.DATA_PIPELINE].async_statistics("demo").frames_dropped = 3
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "image_processing/statistics"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["platforms"]["demo"]["frames_dropped"] == 3
@@ -1,6 +1,10 @@
 """The tests for the InfluxDB component."""
 from dataclasses import dataclass
 import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import os
+import threading
+from types import SimpleNamespace
 
 import pytest
 
@@ -1657,3 +1661,179 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_line_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            lambda body: call(body, time_precision="ms", protocol="line"),
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            lambda body: call(bucket=DEFAULT_BUCKET, record=body, write_precision="ms"),
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol(
+    hass, mock_client, config_ext, get_write_api, get_line_call
+):
+    """Test the event listener encodes points in line protocol."""
+    config = {
+        "line_protocol": True,
+        "precision": "ms",
+        "tags": {"site": "main house"},
+        "tags_attributes": ["friendly_name"],
+    }
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state="on",
+        domain="fake",
+        entity_id="fake.entity_id",
+        object_id="entity_id",
+        attributes={
+            "unit_of_measurement": "foo bars",
+            "friendly_name": "Living room, left",
+            "color": 'say "red"',
+            "brightness": float("nan"),
+        },
+    )
+    event = MagicMock(
+        data={"new_state": state},
+        time_fired=datetime.datetime(2017, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    body = [
+        "foo\\ bars,domain=fake,entity_id=entity_id,"
+        "friendly_name=Living\\ room\\,\\ left,site=main\\ house "
+        'state="on",value=1.0,color_str="say \\"red\\"" 1483228800000'
+    ]
+    assert write_api.call_args == get_line_call(body)
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api",
+    [(influxdb.DEFAULT_API_VERSION, BASE_V1_CONFIG, _get_write_api_mock_v1)],
+    indirect=["mock_client"],
+)
+async def test_batch_size_follows_write_latency(
+    hass, mock_client, config_ext, get_write_api
+):
+    """Test the batch size grows for fast full batches and shrinks for slow ones."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+    assert instance.batch_size == influxdb.BATCH_BUFFER_SIZE
+
+    instance._write([{}] * instance.batch_size)
+    assert instance.batch_size == 2 * influxdb.BATCH_BUFFER_SIZE
+
+    instance._write([{}])
+    assert instance.batch_size == 2 * influxdb.BATCH_BUFFER_SIZE
+
+    with patch(
+        f"{INFLUX_PATH}.time.monotonic",
+        side_effect=[0, influxdb.TARGET_WRITE_LATENCY + 1],
+    ):
+        instance._write([{}])
+    assert instance.batch_size == influxdb.BATCH_BUFFER_SIZE
+
+
+@pytest.fixture(name="influx_server")
+def influx_server_fixture():
+    """Run a local HTTP stand-in for the InfluxDB V1 write API."""
+    received = []
+    available = threading.Event()
+    available.set()
+
+    class InfluxHandler(BaseHTTPRequestHandler):
+        """Handle writes, fail them while InfluxDB is not available."""
+
+        def do_POST(self):  # pylint: disable=invalid-name
+            """Handle a write."""
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if not available.is_set():
+                self.send_response(503)
+                self.end_headers()
+                return
+            received.extend(line for line in body.decode().splitlines() if line)
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            """Do not log requests."""
+
+    server = HTTPServer(("127.0.0.1", 0), InfluxHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield SimpleNamespace(
+        port=server.server_port, received=received, available=available
+    )
+    server.shutdown()
+    server.server_close()
+
+
+async def test_spool_replays_after_outage(hass, influx_server, tmp_path):
+    """Test points are spooled to disk while InfluxDB is down and replayed in order."""
+    hass.config.config_dir = str(tmp_path)
+    config = {
+        "influxdb": {
+            "host": "127.0.0.1",
+            "port": influx_server.port,
+            "spool_size": 1,
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    handler_method = hass.bus.listen.call_args_list[0][0][1]
+    instance = hass.data[influxdb.DOMAIN]
+
+    def make_state_event(value, second):
+        state = MagicMock(
+            state=value,
+            domain="fake",
+            entity_id="fake.entity_id",
+            object_id="entity_id",
+            attributes={"unit_of_measurement": "W"},
+        )
+        return MagicMock(
+            data={"new_state": state},
+            time_fired=datetime.datetime(
+                2017, 1, 1, 0, 0, second, tzinfo=datetime.timezone.utc
+            ),
+        )
+
+    influx_server.available.clear()
+    handler_method(make_state_event("1", 0))
+    instance.block_till_done()
+
+    assert influx_server.received == []
+    assert instance.spool.pending
+    assert os.listdir(tmp_path / influxdb.SPOOL_DIRECTORY)
+
+    influx_server.available.set()
+    instance._next_replay = 0
+    handler_method(make_state_event("2", 1))
+    instance.block_till_done()
+
+    assert influx_server.received == [
+        "W,domain=fake,entity_id=entity_id value=1.0 1483228800000000000",
+        "W,domain=fake,entity_id=entity_id value=2.0 1483228801000000000",
+    ]
+    assert not instance.spool.pending
+    assert os.listdir(tmp_path / influxdb.SPOOL_DIRECTORY) == []
+
+    handler_method(make_state_event("3", 2))
+    instance.block_till_done()
+    assert len(influx_server.received) == 3
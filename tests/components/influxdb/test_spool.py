@@ -0,0 +1,55 @@
+"""The tests for the InfluxDB spool."""
+from homeassistant.components.influxdb.spool import InfluxSpool
+
+
+def test_spool_replays_oldest_segment_first(tmp_path):
+    """Test points are replayed in order and survive a restart."""
+    spool = InfluxSpool(str(tmp_path), 1024, segment_size=10)
+    assert not spool.pending
+
+    spool.append(["first 1", "first 2"])
+    spool.append(["second"])
+    assert spool.pending
+
+    spool = InfluxSpool(str(tmp_path), 1024, segment_size=10)
+    segment, lines = spool.oldest()
+    assert lines == ["first 1", "first 2"]
+    spool.remove(segment)
+
+    spool.append(["third"])
+    segment, lines = spool.oldest()
+    assert lines == ["second"]
+    spool.remove(segment)
+
+    segment, lines = spool.oldest()
+    assert lines == ["third"]
+    spool.remove(segment)
+    assert not spool.pending
+    assert spool.oldest() is None
+
+
+def test_spool_drops_oldest_segments_when_full(tmp_path, caplog):
+    """Test the spool stays within its maximum size."""
+    spool = InfluxSpool(str(tmp_path), 20, segment_size=10)
+
+    for index in range(5):
+        spool.append([f"point {index}"])
+
+    # Segments of two points are dropped as the third point is appended
+    assert len(list(tmp_path.iterdir())) == 1
+    _, lines = spool.oldest()
+    assert lines == ["point 4"]
+    assert caplog.text.count("Spool is full, dropped 16 bytes") == 2
+
+
+def test_spool_appends_after_replaying_current_segment(tmp_path):
+    """Test points appended while replaying go to a new segment."""
+    spool = InfluxSpool(str(tmp_path), 1024)
+    spool.append(["first"])
+
+    segment, lines = spool.oldest()
+    spool.append(["second"])
+    spool.remove(segment)
+
+    assert lines == ["first"]
+    assert spool.oldest()[1] == ["second"]
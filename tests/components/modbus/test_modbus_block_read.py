@@ -0,0 +1,194 @@
+"""The tests for the Modbus block reads."""
+from datetime import timedelta
+
+from pymodbus.pdu import ExceptionResponse
+import pytest
+
+from homeassistant.components.modbus.block_read import (
+    BlockReader,
+    ReadRange,
+    plan_reads,
+)
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_COIL,
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+    CONF_BLOCK_READS,
+    CONF_INPUTS,
+    CONF_MAX_GAP,
+    CONF_REGISTER,
+    CONF_REGISTERS,
+    MODBUS_DOMAIN as DOMAIN,
+)
+from homeassistant.const import (
+    CONF_ADDRESS,
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PLATFORM,
+    CONF_PORT,
+    CONF_SCAN_INTERVAL,
+    CONF_SLAVE,
+    CONF_TYPE,
+    STATE_ON,
+)
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from .conftest import ReadResult
+
+from tests.async_mock import MagicMock, patch
+from tests.common import async_fire_time_changed
+
+
+def test_plan_reads():
+    """Test merging read ranges into blocks."""
+    first = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 100, 2)
+    adjacent = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 102, 1)
+    overlapping = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 101, 2)
+    near = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 105, 1)
+    far = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 120, 1)
+    other_unit = ReadRange(2, CALL_TYPE_REGISTER_HOLDING, 103, 1)
+    other_type = ReadRange(1, CALL_TYPE_REGISTER_INPUT, 103, 1)
+    ranges = [far, near, overlapping, adjacent, first, other_unit, other_type]
+
+    plan = plan_reads(ranges, 0, 125)
+    block = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 100, 3)
+    assert plan[first] == plan[adjacent] == plan[overlapping] == block
+    assert plan[near] == near
+    assert plan[far] == far
+    assert plan[other_unit] == other_unit
+    assert plan[other_type] == other_type
+
+    plan = plan_reads(ranges, 2, 125)
+    assert plan[first] == plan[near] == ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 100, 6)
+    assert plan[far] == far
+
+    plan = plan_reads(ranges, 20, 10)
+    assert plan[first] == plan[near] == ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 100, 6)
+    assert plan[far] == far
+
+
+def test_plan_reads_bits():
+    """Test limits of coil blocks are in registers worth of bits."""
+    first = ReadRange(1, CALL_TYPE_COIL, 0, 1)
+    near = ReadRange(1, CALL_TYPE_COIL, 16, 1)
+    far = ReadRange(1, CALL_TYPE_COIL, 40, 1)
+
+    plan = plan_reads([first, near, far], 1, 125)
+    assert plan[first] == plan[near] == ReadRange(1, CALL_TYPE_COIL, 0, 17)
+    assert plan[far] == far
+
+    plan = plan_reads([first, near, far], 1, 1)
+    assert plan[first] == first
+
+
+def test_block_reader():
+    """Test block responses are shared and expire after half an interval."""
+    read = MagicMock(return_value=ReadResult(list(range(10))))
+    reader = BlockReader(read, 0, 125)
+    first = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 0, 2)
+    second = ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 2, 3)
+    reader.add(first, 10)
+    reader.add(second, 10)
+
+    assert reader.read(ReadRange(1, CALL_TYPE_REGISTER_HOLDING, 7, 1)) is None
+
+    with patch("time.monotonic", return_value=100):
+        assert reader.read(first).registers == [0, 1]
+        assert reader.read(second).registers == [2, 3, 4]
+    read.assert_called_once_with(CALL_TYPE_REGISTER_HOLDING, 1, 0, 5)
+
+    with patch("time.monotonic", return_value=105):
+        reader.read(first)
+    assert read.call_count == 2
+
+    reader.invalidate(1)
+    with patch("time.monotonic", return_value=105):
+        reader.read(second)
+    assert read.call_count == 3
+
+    read.return_value = ExceptionResponse(3)
+    reader.invalidate(1)
+    assert reader.read(first) is read.return_value
+    assert reader.read(second) is read.return_value
+    assert read.call_count == 5
+
+    reader.remove(second, 10)
+    read.return_value = ReadResult(list(range(10)))
+    reader.invalidate(1)
+    reader.read(first)
+    read.assert_called_with(CALL_TYPE_REGISTER_HOLDING, 1, 0, 2)
+
+
+@pytest.fixture
+def mock_client():
+    """Mock the pymodbus client of a TCP hub."""
+    with patch(
+        "homeassistant.components.modbus.ModbusTcpClient", autospec=True
+    ) as client_class:
+        yield client_class.return_value
+
+
+async def test_entities_share_block_reads(hass, mock_client):
+    """Test the registers of several entities are read in one request."""
+    mock_client.read_holding_registers.return_value = ReadResult([7, 0, 9, 0, 1])
+    mock_client.read_coils.return_value = ReadResult([True, False, True])
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                CONF_TYPE: "tcp",
+                CONF_HOST: "modbusTestHost",
+                CONF_PORT: 5501,
+                CONF_BLOCK_READS: {CONF_MAX_GAP: 2},
+            }
+        },
+    )
+    now = dt_util.utcnow()
+    with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        assert await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": {
+                    CONF_PLATFORM: DOMAIN,
+                    CONF_SCAN_INTERVAL: 5,
+                    CONF_REGISTERS: [
+                        {CONF_NAME: "first", CONF_REGISTER: 10, CONF_SLAVE: 1},
+                        {CONF_NAME: "second", CONF_REGISTER: 12, CONF_SLAVE: 1},
+                        {CONF_NAME: "third", CONF_REGISTER: 14, CONF_SLAVE: 1},
+                    ],
+                }
+            },
+        )
+        assert await async_setup_component(
+            hass,
+            "binary_sensor",
+            {
+                "binary_sensor": {
+                    CONF_PLATFORM: DOMAIN,
+                    CONF_SCAN_INTERVAL: 5,
+                    CONF_INPUTS: [
+                        {CONF_NAME: "first_coil", CONF_ADDRESS: 0, CONF_SLAVE: 1},
+                        {CONF_NAME: "second_coil", CONF_ADDRESS: 2, CONF_SLAVE: 1},
+                    ],
+                }
+            },
+        )
+        await hass.async_block_till_done()
+    mock_client.read_holding_registers.reset_mock()
+    mock_client.read_coils.reset_mock()
+
+    now += timedelta(seconds=6)
+    with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+    mock_client.read_holding_registers.assert_called_once_with(10, 5, unit=1)
+    mock_client.read_coils.assert_called_once_with(0, 3, unit=1)
+    assert hass.states.get("sensor.first").state == "7"
+    assert hass.states.get("sensor.second").state == "9"
+    assert hass.states.get("sensor.third").state == "1"
+    assert hass.states.get("binary_sensor.first_coil").state == STATE_ON
+    assert hass.states.get("binary_sensor.second_coil").state == STATE_ON
@@ -0,0 +1,114 @@
+"""The tests for the ping engine."""
+import asyncio
+import socket
+
+import pytest
+
+from homeassistant.components.ping.engine import (
+    PingResult,
+    async_get_ping_engine,
+    checksum,
+    parse_ping_output,
+    round_trip_stats,
+)
+
+from tests.async_mock import AsyncMock, patch
+
+
+def test_checksum():
+    """Test the internet checksum of an echo request."""
+    assert checksum(bytes.fromhex("0800000000010001")) == 0xF7FD
+    assert checksum(b"\x01") == 0xFEFF
+
+
+def test_round_trip_stats():
+    """Test the statistics of round trip times match the ping binary."""
+    assert round_trip_stats([]) is None
+    assert round_trip_stats([1.0, 2.0, 3.0, 4.0]) == PingResult(1.0, 2.5, 4.0, 1.118)
+    assert round_trip_stats([5.0]) == PingResult(5.0, 5.0, 5.0, 0.0)
+
+
+def test_parse_ping_output():
+    """Test parsing the statistics printed by the ping binary."""
+    assert parse_ping_output(
+        b"--- 127.0.0.1 ping statistics ---\n"
+        b"3 packets transmitted, 3 received, 0% packet loss, time 2003ms\n"
+        b"rtt min/avg/max/mdev = 0.031/0.040/0.052/0.008 ms"
+    ) == PingResult(0.031, 0.04, 0.052, 0.008)
+    assert parse_ping_output(
+        b"--- 127.0.0.1 ping statistics ---\n"
+        b"round-trip min/avg/max = 0.031/0.040/0.052 ms"
+    ) == PingResult(0.031, 0.04, 0.052, None)
+    assert parse_ping_output(b"1 packets transmitted, 0 received") is None
+
+
+@pytest.fixture
+def no_icmp_sockets():
+    """Deny opening ICMP sockets."""
+    with patch(
+        "homeassistant.components.ping.engine.IcmpSocket",
+        side_effect=PermissionError,
+    ):
+        yield
+
+
+async def test_pings_are_shared(hass, no_icmp_sockets):
+    """Test concurrent and recent pings of a host are shared."""
+    engine = async_get_ping_engine(hass)
+    result = PingResult(1.0, 2.0, 3.0, 0.5)
+    with patch.object(engine, "_async_run_ping", return_value=result) as run_ping:
+        assert await asyncio.gather(
+            engine.async_ping("10.0.0.1", 2), engine.async_ping("10.0.0.1", 2)
+        ) == [result, result]
+        assert run_ping.call_count == 1
+
+        assert await engine.async_ping("10.0.0.1", 2, max_age=60) == result
+        assert run_ping.call_count == 1
+
+        assert await engine.async_ping("10.0.0.1", 2) == result
+        assert await engine.async_ping("10.0.0.2", 2, max_age=60) == result
+        assert run_ping.call_count == 3
+
+
+async def test_subprocess_fallback(hass, no_icmp_sockets):
+    """Test the ping binary is run when ICMP sockets are not permitted."""
+    pinger = AsyncMock(returncode=0)
+    pinger.communicate.return_value = (
+        b"rtt min/avg/max/mdev = 1.000/2.000/3.000/0.500 ms",
+        b"",
+    )
+    with patch(
+        "homeassistant.components.ping.engine.asyncio.create_subprocess_exec",
+        return_value=pinger,
+    ) as create_subprocess:
+        result = await async_get_ping_engine(hass).async_ping("10.0.0.1", 3)
+
+    assert result == PingResult(1.0, 2.0, 3.0, 0.5)
+    assert create_subprocess.call_args[0][-1] == "10.0.0.1"
+
+
+def _icmp_permitted():
+    """Return whether this process may open an ICMP socket."""
+    for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+        try:
+            socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP).close()
+            return True
+        except OSError:
+            pass
+    return False
+
+
+@pytest.mark.skipif(not _icmp_permitted(), reason="ICMP sockets are not permitted")
+async def test_ping_localhost(hass):
+    """Test pinging the loopback address through an ICMP socket."""
+    engine = async_get_ping_engine(hass)
+    with patch("homeassistant.components.ping.engine.ECHO_INTERVAL", 0):
+        results = await asyncio.gather(
+            engine.async_ping("127.0.0.1", 2), engine.async_ping("127.0.0.2", 2)
+        )
+    engine.async_close()
+
+    for result in results:
+        assert result is not None
+        assert 0 <= result.min <= result.avg <= result.max
+        assert result.mdev >= 0
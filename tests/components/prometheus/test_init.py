@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 import datetime
 
+from prometheus_client import CollectorRegistry
 import pytest
 
 from homeassistant.components import climate, humidifier, sensor
@@ -32,9 +33,11 @@ class FilterTest:
     should_pass: bool
 
 
-async def prometheus_client(hass, hass_client):
+async def prometheus_client(hass, hass_client, config=None):
     """Initialize an hass_client with Prometheus component."""
-    await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    await async_setup_component(
+        hass, prometheus.DOMAIN, {prometheus.DOMAIN: config or {}}
+    )
 
     await async_setup_component(hass, sensor.DOMAIN, {"sensor": [{"platform": "demo"}]})
 
@@ -202,6 +205,78 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_scrape_mode(hass, hass_client):
+    """Test prometheus metrics generated at scrape time."""
+    with mock.patch("prometheus_client.REGISTRY", CollectorRegistry()):
+        client = await prometheus_client(hass, hass_client, {"mode": "scrape"})
+        hass.states.async_set("automation.test", "on", {"friendly_name": "Test"})
+        await hass.async_block_till_done()
+        hass.states.async_set("automation.test", "off", {"friendly_name": "Test"})
+        await hass.async_block_till_done()
+
+        resp = await client.get(prometheus.API_ENDPOINT)
+        assert resp.status == 200
+        assert resp.headers["content-type"] == CONTENT_TYPE_TEXT_PLAIN
+        body = (await resp.text()).split("\n")
+
+        assert (
+            'temperature_c{domain="sensor",'
+            'entity="sensor.outside_temperature",'
+            'friendly_name="Outside Temperature"} 15.6' in body
+        )
+        assert (
+            'battery_level_percent{domain="sensor",'
+            'entity="sensor.outside_temperature",'
+            'friendly_name="Outside Temperature"} 12.0' in body
+        )
+        assert (
+            'humidifier_mode{domain="humidifier",'
+            'entity="humidifier.hygrostat",'
+            'friendly_name="Hygrostat",'
+            'mode="eco"} 0.0' in body
+        )
+        assert (
+            'sensor_unit_u0xb0{domain="sensor",'
+            'entity="sensor.wind_direction",'
+            'friendly_name="Wind Direction"} 25.0' in body
+        )
+        assert (
+            'last_updated_time_seconds{domain="sensor",'
+            'entity="sensor.radio_energy",'
+            'friendly_name="Radio Energy"} 86400.0' in body
+        )
+        assert (
+            'state_change_total{domain="automation",'
+            'entity="automation.test",'
+            'friendly_name="Test"} 2.0' in body
+        )
+        assert (
+            'automation_triggered_count_total{domain="automation",'
+            'entity="automation.test",'
+            'friendly_name="Test"} 2.0' in body
+        )
+
+        # Labels follow attribute changes, values follow state changes
+        hass.states.async_set(
+            "sensor.wind_direction",
+            "30",
+            {"friendly_name": "Wind", "unit_of_measurement": DEGREE},
+        )
+        hass.states.async_remove("automation.test")
+        await hass.async_block_till_done()
+
+        resp = await client.get(prometheus.API_ENDPOINT)
+        body = (await resp.text()).split("\n")
+
+    assert (
+        'sensor_unit_u0xb0{domain="sensor",'
+        'entity="sensor.wind_direction",'
+        'friendly_name="Wind"} 30.0' in body
+    )
+    assert not any("Wind Direction" in line for line in body)
+    assert not any("automation.test" in line for line in body)
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -1,5 +1,6 @@
 """The tests for the REST sensor platform."""
 import asyncio
+from datetime import timedelta
 from os import path
 
 import httpx
@@ -17,8 +18,10 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import patch
+from tests.common import async_fire_time_changed
 
 
 async def test_setup_missing_config(hass):
@@ -722,5 +725,86 @@ async def test_reload(hass):
     assert hass.states.get("sensor.rollout")
 
 
+@respx.mock
+async def test_sensors_share_resource(hass):
+    """Test sensors polling the same resource share one request."""
+    route = respx.get("http://localhost").respond(
+        status_code=200, json={"first": "1", "second": "2"}
+    )
+    now = dt_util.utcnow()
+    with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        assert await async_setup_component(
+            hass,
+            sensor.DOMAIN,
+            {
+                "sensor": [
+                    {
+                        "platform": "rest",
+                        "resource": "http://localhost",
+                        "name": "first",
+                        "value_template": "{{ value_json.first }}",
+                    },
+                    {
+                        "platform": "rest",
+                        "resource": "http://localhost",
+                        "name": "second",
+                        "value_template": "{{ value_json.second }}",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+    assert hass.states.get("sensor.first").state == "1"
+    assert hass.states.get("sensor.second").state == "2"
+    calls = route.call_count
+
+    route.respond(status_code=200, json={"first": "3", "second": "4"})
+    now += timedelta(seconds=31)
+    with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+    assert route.call_count == calls + 1
+    assert hass.states.get("sensor.first").state == "3"
+    assert hass.states.get("sensor.second").state == "4"
+
+
+@respx.mock
+async def test_update_not_modified(hass):
+    """Test the data is kept when the resource was not modified."""
+    route = respx.get("http://localhost").respond(
+        status_code=200,
+        json={"key": "some_json_value"},
+        headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+    now = dt_util.utcnow()
+    with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        assert await async_setup_component(
+            hass,
+            sensor.DOMAIN,
+            {
+                "sensor": {
+                    "platform": "rest",
+                    "resource": "http://localhost",
+                    "name": "foo",
+                    "value_template": "{{ value_json.key }}",
+                }
+            },
+        )
+        await hass.async_block_till_done()
+    assert hass.states.get("sensor.foo").state == "some_json_value"
+
+    route.respond(status_code=304)
+    now += timedelta(seconds=31)
+    with patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+    request = route.calls.last.request
+    assert request.headers["If-None-Match"] == '"v1"'
+    assert request.headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert hass.states.get("sensor.foo").state == "some_json_value"
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
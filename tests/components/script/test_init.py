@@ -475,6 +475,44 @@ async def test_extraction_functions(hass):
     }
 
 
+async def test_area_extraction_functions(hass):
+    """Test area extraction functions."""
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                "test1": {
+                    "sequence": [
+                        {
+                            "service": "test.script",
+                            "target": {"area_id": ["kitchen", "hallway"]},
+                        },
+                    ]
+                },
+                "test2": {
+                    "sequence": [
+                        {
+                            "service": "test.script",
+                            "data": {"area_id": "kitchen"},
+                        },
+                    ]
+                },
+            }
+        },
+    )
+
+    assert set(script.scripts_with_area(hass, "kitchen")) == {
+        "script.test1",
+        "script.test2",
+    }
+    assert script.scripts_with_area(hass, "hallway") == ["script.test1"]
+    assert set(script.areas_in_script(hass, "script.test1")) == {
+        "kitchen",
+        "hallway",
+    }
+
+
 async def test_config_basic(hass):
     """Test passing info in config."""
     assert await async_setup_component(
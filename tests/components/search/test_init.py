@@ -271,6 +271,57 @@ async def test_search(hass):
         assert searcher.async_search(search_type, search_id) == {}
 
 
+async def test_search_area_references(hass):
+    """Test automations and scripts targeting an area are found."""
+    area_reg = await hass.helpers.area_registry.async_get_registry()
+    device_reg = await hass.helpers.device_registry.async_get_registry()
+    entity_reg = await hass.helpers.entity_registry.async_get_registry()
+
+    kitchen_area = area_reg.async_create("Kitchen")
+
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                "kitchen_lights": {
+                    "sequence": [
+                        {
+                            "service": "light.turn_on",
+                            "target": {"area_id": kitchen_area.id},
+                        },
+                    ]
+                },
+            }
+        },
+    )
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "alias": "kitchen_off",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {
+                    "service": "light.turn_off",
+                    "data": {"area_id": kitchen_area.id},
+                },
+            }
+        },
+    )
+
+    searcher = search.Searcher(hass, device_reg, entity_reg)
+    assert searcher.async_search("area", kitchen_area.id) == {
+        "automation": {"automation.kitchen_off"},
+        "script": {"script.kitchen_lights"},
+    }
+
+    searcher = search.Searcher(hass, device_reg, entity_reg)
+    assert searcher.async_search("script", "script.kitchen_lights") == {
+        "area": {kitchen_area.id},
+    }
+
+
 async def test_ws_api(hass, hass_ws_client):
     """Test WS API."""
     assert await async_setup_component(hass, "search", {})
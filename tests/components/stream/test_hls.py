@@ -1,11 +1,13 @@
 """The tests for hls streams."""
 from datetime import timedelta
+import io
 from urllib.parse import urlparse
 
 import av
 import pytest
 
 from homeassistant.components.stream import request_stream
+from homeassistant.components.stream.core import Segment
 from homeassistant.const import HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -15,6 +17,19 @@ from tests.common import async_fire_time_changed
 from tests.components.stream.common import generate_h264_video, preload_stream
 
 
+def mp4_box(box_type, payload):
+    """Return a mp4 box."""
+    return (len(payload) + 8).to_bytes(4, byteorder="big") + box_type + payload
+
+
+def fmp4_segment(sequence, size=16):
+    """Return a minimal fragmented mp4 segment."""
+    init = mp4_box(b"ftyp", b"isom") + mp4_box(b"moov", b"")
+    fragment = mp4_box(b"moof", b"") + mp4_box(b"mdat", b"\x00" * size)
+    data = init + fragment + mp4_box(b"mfra", b"")
+    return Segment(sequence, io.BytesIO(data), 2), init, fragment
+
+
 @pytest.mark.skip("Flaky in CI")
 async def test_hls_stream(hass, hass_client):
     """
@@ -160,3 +175,50 @@ async def test_stream_keepalive(hass):
 
     # Stop stream, if it hasn't quit already
     stream.stop()
+
+
+async def test_hls_segment_views(hass, hass_client):
+    """Test init and segment views serve the fmp4 sections of stored segments."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    stream = preload_stream(hass, "test_hls_segment_views_source")
+    stream.access_token = "abcdef"
+    stream.start = lambda: None
+    track = stream.add_provider("hls")
+    segment, init, fragment = fmp4_segment(1)
+    track.put(segment)
+
+    http_client = await hass_client()
+    base_url = f"/api/hls/{stream.access_token}"
+
+    init_response = await http_client.get(f"{base_url}/init.mp4")
+    assert init_response.status == 200
+    assert await init_response.read() == init
+
+    segment_response = await http_client.get(f"{base_url}/segment/1.m4s")
+    assert segment_response.status == 200
+    assert await segment_response.read() == fragment
+
+    fail_response = await http_client.get(f"{base_url}/segment/2.m4s")
+    assert fail_response.status == HTTP_NOT_FOUND
+
+    track.put(None)
+
+
+async def test_hls_memory_budget(hass):
+    """Test old segments are evicted once over the memory budget."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    stream = preload_stream(hass, "test_hls_memory_budget_source")
+    track = stream.add_provider("hls")
+
+    first, _, _ = fmp4_segment(1, 100)
+    track.max_size = first.size * 2
+    track.put(first)
+    track.put(fmp4_segment(2, 100)[0])
+    assert track.segments == [1, 2]
+
+    track.put(fmp4_segment(3, 150)[0])
+    assert track.segments == [3]
+
+    track.put(None)
@@ -5,6 +5,7 @@ from io import BytesIO
 import av
 import pytest
 
+from homeassistant.components.stream.const import MAX_SEGMENTS_SIZE
 from homeassistant.components.stream.core import Segment
 from homeassistant.components.stream.recorder import recorder_save_worker
 from homeassistant.setup import async_setup_component
@@ -67,6 +68,24 @@ async def test_recorder_timeout(hass, hass_client):
         assert mock_cleanup.called
 
 
+async def test_recorder_keeps_segments_over_budget(hass):
+    """Test the recorder keeps every segment, even over the memory budget."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    stream = preload_stream(hass, "test_recorder_budget_source")
+    recorder = stream.add_provider("recorder")
+
+    size = MAX_SEGMENTS_SIZE // 2 + 1
+    for sequence in range(1, 4):
+        recorder.put(Segment(sequence, BytesIO(bytes(size)), 4))
+    assert recorder.segments == [1, 2, 3]
+
+    with patch("homeassistant.components.stream.recorder.threading.Thread") as thread:
+        recorder.put(None)
+
+    assert [s.sequence for s in thread.call_args[1]["args"][1]] == [1, 2, 3]
+
+
 @pytest.mark.skip("Flaky in CI")
 async def test_recorder_save():
     """Test recorder save."""
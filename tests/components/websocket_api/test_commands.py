@@ -12,7 +12,7 @@ from homeassistant.core import Context, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import async_setup_component
+from homeassistant.setup import DATA_SETUP_TIMELINE, async_setup_component
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -863,3 +863,19 @@ async def test_test_condition(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"]["result"] is True
+
+
+async def test_setup_timeline(hass, websocket_client):
+    """Test fetching the startup setup timeline."""
+    hass.data[DATA_SETUP_TIMELINE] = {"comp": [("setup", 5.0, 7.5)]}
+
+    await websocket_client.send_json({"id": 5, "type": "setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "timeline": {"comp": [{"phase": "setup", "start": 0.0, "end": 2.5}]},
+        "critical_path": [{"name": "comp", "end": 2.5, "own_time": 2.5}],
+    }
@@ -1,7 +1,7 @@
 """Test ZHA Gateway."""
 import asyncio
 import time
-from unittest.mock import patch
+from unittest.mock import AsyncMock, call, patch
 
 import pytest
 import zigpy.profiles.zha as zha
@@ -9,6 +9,12 @@ import zigpy.zcl.clusters.general as general
 import zigpy.zcl.clusters.lighting as lighting
 
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
+from homeassistant.components.zha.core.gateway import (
+    INITIALIZE_CONCURRENCY,
+    INITIALIZE_CONCURRENCY_MAX,
+    INITIALIZE_TARGET_SECONDS,
+    InitializeLimiter,
+)
 from homeassistant.components.zha.core.group import GroupMember
 from homeassistant.components.zha.core.store import TOMBSTONE_LIFETIME
 
@@ -233,3 +239,75 @@ async def test_cleaning_up_storage(hass, zigpy_dev_basic, zha_dev_basic, hass_st
     await zha_gateway.zha_storage.async_save()
     await hass.async_block_till_done()
     assert not hass_storage["zha.storage"]["data"]["devices"]
+
+
+async def test_initialize_devices_from_cache(hass, coordinator, zha_dev_basic):
+    """Test devices start from cache and mains powered ones refresh later."""
+    zha_gateway = get_zha_gateway(hass)
+    assert coordinator.is_mains_powered
+    assert not zha_dev_basic.is_mains_powered
+
+    with patch.object(
+        coordinator, "async_initialize", AsyncMock()
+    ) as mains_initialize, patch.object(
+        zha_dev_basic, "async_initialize", AsyncMock()
+    ) as basic_initialize:
+        await zha_gateway.async_initialize_devices_and_entities()
+        assert mains_initialize.call_args_list == [call(from_cache=True)]
+        assert basic_initialize.call_args_list == [call(from_cache=True)]
+
+        await zha_gateway._refresh_task
+        assert mains_initialize.call_args_list == [
+            call(from_cache=True),
+            call(from_cache=False),
+        ]
+        assert basic_initialize.call_args_list == [call(from_cache=True)]
+
+
+async def test_initialize_limiter():
+    """Test the concurrency of device initialization follows response times."""
+    limiter = InitializeLimiter()
+    assert limiter.limit == INITIALIZE_CONCURRENCY
+
+    limiter.adjust(INITIALIZE_TARGET_SECONDS / 2)
+    assert limiter.limit == INITIALIZE_CONCURRENCY + 1
+
+    limiter.adjust(INITIALIZE_TARGET_SECONDS * 2)
+    assert limiter.limit == (INITIALIZE_CONCURRENCY + 1) // 2
+
+    for _ in range(INITIALIZE_CONCURRENCY_MAX * 2):
+        limiter.adjust(0)
+    assert limiter.limit == INITIALIZE_CONCURRENCY_MAX
+
+    for _ in range(INITIALIZE_CONCURRENCY_MAX):
+        limiter.adjust(INITIALIZE_TARGET_SECONDS * 2)
+    assert limiter.limit == 1
+
+    running = 0
+    over_limit = False
+
+    async def initialize():
+        nonlocal running, over_limit
+        running += 1
+        over_limit = over_limit or running > limiter.limit
+        await asyncio.sleep(0)
+        running -= 1
+
+    await asyncio.gather(*(limiter.async_run(initialize) for _ in range(10)))
+    assert not over_limit
+    assert running == 0
+
+
+async def test_entity_references(hass, device_light_1):
+    """Test finding the entity references of entities."""
+    zha_gateway = get_zha_gateway(hass)
+    entity_refs = zha_gateway.device_registry[device_light_1.ieee]
+    assert entity_refs
+
+    for entity_ref in entity_refs:
+        assert zha_gateway.get_entity_reference(entity_ref.reference_id) is entity_ref
+    assert zha_gateway.get_entity_reference("light.not_zha") is None
+
+    zha_gateway.device_removed(device_light_1.device)
+    for entity_ref in entity_refs:
+        assert zha_gateway.get_entity_reference(entity_ref.reference_id) is None
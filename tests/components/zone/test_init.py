@@ -1,4 +1,6 @@
 """Test zone component."""
+import random
+
 import pytest
 
 from homeassistant import setup
@@ -14,6 +16,7 @@ from homeassistant.const import (
 from homeassistant.core import Context
 from homeassistant.exceptions import Unauthorized
 from homeassistant.helpers import entity_registry
+from homeassistant.util.location import distance
 
 from tests.async_mock import patch
 from tests.common import MockConfigEntry
@@ -502,3 +505,88 @@ async def test_unavailable_zone(hass):
     assert zone.async_active_zone(hass, 0.0, 0.01) is None
 
     assert zone.in_zone(hass.states.get("zone.bla"), 0, 0) is False
+
+
+def _brute_force_active_zone(hass, latitude, longitude, radius=0):
+    """Find the active zone by comparing all zones."""
+    closest = None
+    min_dist = None
+    for entity_id in sorted(hass.states.async_entity_ids(DOMAIN)):
+        state = hass.states.get(entity_id)
+        if state.state == "unavailable" or state.attributes.get("passive"):
+            continue
+        zone_dist = distance(
+            latitude,
+            longitude,
+            state.attributes["latitude"],
+            state.attributes["longitude"],
+        )
+        if zone_dist is None or zone_dist - radius >= state.attributes["radius"]:
+            continue
+        if (
+            closest is None
+            or zone_dist < min_dist
+            or (
+                zone_dist == min_dist
+                and state.attributes["radius"] < closest.attributes["radius"]
+            )
+        ):
+            closest = state
+            min_dist = zone_dist
+    return closest
+
+
+async def test_active_zone_index_matches_all_zones(hass):
+    """Test the zone index finds the same zone as comparing all zones."""
+    rng = random.Random(42)
+    for idx in range(500):
+        hass.states.async_set(
+            f"zone.zone_{idx}",
+            "zoning",
+            {
+                "latitude": rng.uniform(-89.9, 89.9),
+                "longitude": rng.uniform(-180, 180),
+                "radius": rng.choice([10, 500, 50000, 5000000]),
+                "passive": idx % 25 == 0,
+            },
+        )
+
+    for _ in range(500):
+        latitude = rng.uniform(-90, 90)
+        longitude = rng.uniform(-180, 180)
+        radius = rng.choice([0, 100, 100000])
+        active = zone.async_active_zone(hass, latitude, longitude, radius)
+        expected = _brute_force_active_zone(hass, latitude, longitude, radius)
+        assert active == expected
+
+
+async def test_active_zone_index_follows_zone_changes(hass):
+    """Test the zone index is rebuilt when zones change."""
+    hass.states.async_set(
+        "zone.first", "zoning", {"latitude": 1, "longitude": 2, "radius": 100}
+    )
+    assert zone.async_active_zone(hass, 1, 2).entity_id == "zone.first"
+
+    hass.states.async_set(
+        "zone.first", "zoning", {"latitude": 10, "longitude": 20, "radius": 100}
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 1, 2) is None
+    assert zone.async_active_zone(hass, 10, 20).entity_id == "zone.first"
+
+    hass.states.async_remove("zone.first")
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 10, 20) is None
+
+
+async def test_active_zone_index_ties_prefer_first_entity_id(hass):
+    """Test equal zones resolve to the first entity ID."""
+    for object_id in ("c", "a", "b"):
+        hass.states.async_set(
+            f"zone.{object_id}",
+            "zoning",
+            {"latitude": 50, "longitude": 179.9999, "radius": 100},
+        )
+
+    assert zone.async_active_zone(hass, 50, 179.9999).entity_id == "zone.a"
+    assert zone.async_active_zone(hass, 50, 179.99995, 20000).entity_id == "zone.a"
@@ -6,15 +6,19 @@ import threading
 
 import pytest
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE
 from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.helpers.entity_values import EntityValues
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import MagicMock, PropertyMock, patch
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_registry,
 )
@@ -718,3 +722,103 @@ async def test_setup_source(hass):
     await platform.async_reset()
 
     assert entity.entity_sources(hass) == {}
+
+
+class RateLimitedEntity(entity.Entity):
+    """Entity writing its state at most every 10 seconds."""
+
+    entity_id = "hello.world"
+    min_write_interval = 10
+    significant_change = 5
+    state = 1
+
+
+async def test_rate_limited_writes(hass):
+    """Test writes within the interval are coalesced and flushed at the end."""
+    now = dt_util.utcnow()
+    ent = RateLimitedEntity()
+    ent.hass = hass
+
+    with patch("homeassistant.util.dt.utcnow", return_value=now):
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "1"
+
+    for second, value in ((1, 2), (2, 3)):
+        ent.state = value
+        with patch(
+            "homeassistant.util.dt.utcnow", return_value=now + timedelta(seconds=second)
+        ):
+            ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "1"
+
+    # A significant change is written right away
+    ent.state = 6
+    with patch("homeassistant.util.dt.utcnow", return_value=now + timedelta(seconds=3)):
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "6"
+
+    ent.state = 7
+    with patch("homeassistant.util.dt.utcnow", return_value=now + timedelta(seconds=4)):
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "6"
+
+    # The latest state is written at the end of the interval
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=now + timedelta(seconds=13)
+    ):
+        async_fire_time_changed(hass, now + timedelta(seconds=13))
+        await hass.async_block_till_done()
+    assert hass.states.get("hello.world").state == "7"
+    assert ent._write_flush is None
+
+    # Changes of a non-numeric state are always written right away
+    ent.state = STATE_UNAVAILABLE
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=now + timedelta(seconds=14)
+    ):
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNAVAILABLE
+
+
+async def test_rate_limit_overrides(hass):
+    """Test the entity registry overrides customize, which overrides the entity."""
+    hass.data[DATA_CUSTOMIZE] = EntityValues(
+        {"hello.world": {"min_write_interval": 60, "significant_change": 100}}
+    )
+    ent = RateLimitedEntity()
+    ent.hass = hass
+    ent.async_write_ha_state()
+
+    ent.state = 20
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.state == "1"
+    assert "min_write_interval" not in state.attributes
+    assert "significant_change" not in state.attributes
+
+    ent.registry_entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+        min_write_interval=0,
+    )
+    ent.state = 21
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "21"
+
+
+async def test_rate_limit_flush_cancelled_on_remove(hass):
+    """Test a pending write is not flushed after the entity is removed."""
+    ent = RateLimitedEntity()
+    ent.hass = hass
+    ent.async_write_ha_state()
+    ent.state = 2
+    ent.async_write_ha_state()
+    assert ent._write_flush is not None
+
+    await ent.async_remove()
+    assert ent._write_flush is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world") is None
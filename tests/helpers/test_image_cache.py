@@ -0,0 +1,68 @@
+"""Test the image cache helper."""
+import asyncio
+
+from homeassistant.helpers.image_cache import ImageCache, async_get_image_cache
+
+from tests.async_mock import AsyncMock
+
+
+async def test_lru_eviction_by_size(hass):
+    """Test the least recently used images are evicted over the byte budget."""
+    cache = ImageCache(hass, max_bytes=10)
+    fetch = AsyncMock(side_effect=lambda: (b"1234", "image/png"))
+
+    await cache.async_get("first", fetch)
+    await cache.async_get("second", fetch)
+    assert cache.size == 8
+
+    # Use the first image, so the second one is the least recently used
+    assert await cache.async_get("first", fetch) == (b"1234", "image/png")
+    assert fetch.call_count == 2
+
+    await cache.async_get("third", fetch)
+    assert cache.size == 8
+    await cache.async_get("first", fetch)
+    assert fetch.call_count == 3
+    await cache.async_get("second", fetch)
+    assert fetch.call_count == 4
+
+
+async def test_large_and_failed_images_not_cached(hass):
+    """Test images over the budget and failed fetches are not cached."""
+    cache = ImageCache(hass, max_bytes=10)
+
+    fetch = AsyncMock(return_value=(b"12345678901", "image/png"))
+    assert await cache.async_get("large", fetch) == (b"12345678901", "image/png")
+    await cache.async_get("large", fetch)
+    assert fetch.call_count == 2
+
+    fetch = AsyncMock(return_value=(None, None))
+    assert await cache.async_get("failed", fetch) == (None, None)
+    await cache.async_get("failed", fetch)
+    assert fetch.call_count == 2
+    assert cache.size == 0
+
+
+async def test_concurrent_requests_coalesced(hass):
+    """Test concurrent requests for an image share one fetch."""
+    cache = async_get_image_cache(hass)
+    assert async_get_image_cache(hass) is cache
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return b"image", "image/jpeg"
+
+    fetch_mock = AsyncMock(side_effect=fetch)
+    requests = [
+        hass.async_create_task(cache.async_get("url", fetch_mock)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    # A request giving up does not cancel the fetch of the others
+    requests[0].cancel()
+    release.set()
+
+    assert await asyncio.gather(*requests[1:]) == [(b"image", "image/jpeg")] * 2
+    assert fetch_mock.call_count == 1
+    assert not cache._fetching
@@ -8,6 +8,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
+    STORAGE_KEY_CHANGES,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -272,3 +273,61 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_changed_states(hass, hass_storage):
+    """Test only changed states are saved between full dumps."""
+    hass.state = CoreState.not_running
+    entities = []
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity.entity_id, "on")
+        entities.append(entity)
+
+    data = await RestoreStateData.async_get_instance(hass)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    await hass.async_block_till_done()
+
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+    assert hass_storage[STORAGE_KEY_CHANGES]["data"] == []
+    assert not data.changed_entity_ids
+
+    # Nothing changed, nothing is written
+    hass_storage.pop(STORAGE_KEY)
+    await data.async_dump_changed_states()
+    assert STORAGE_KEY not in hass_storage
+    assert hass_storage[STORAGE_KEY_CHANGES]["data"] == []
+
+    hass.states.async_set("input_boolean.b1", "off")
+    hass.states.async_set("sensor.not_restored", "off")
+    await hass.async_block_till_done()
+    assert data.changed_entity_ids == {"input_boolean.b1"}
+
+    await data.async_dump_changed_states()
+    assert STORAGE_KEY not in hass_storage
+    changes = hass_storage[STORAGE_KEY_CHANGES]["data"]
+    assert len(changes) == 1
+    assert changes[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert changes[0]["state"]["state"] == "off"
+
+    # Changes are applied on top of the saved states when loading
+    hass.data[DATA_RESTORE_STATE_TASK] = None
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State("input_boolean.b1", "on"), dt_util.utcnow()).as_dict()
+        ],
+    }
+    assert (await entities[1].async_get_last_state()).state == "off"
+
+    # Many changes save all states
+    hass.states.async_set("input_boolean.b2", "off")
+    hass.states.async_set("input_boolean.b3", "off")
+    await hass.async_block_till_done()
+    await data.async_dump_changed_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+    assert hass_storage[STORAGE_KEY_CHANGES]["data"] == []
@@ -1423,6 +1423,39 @@ async def test_referenced_devices(hass):
     assert script_obj.referenced_devices is script_obj.referenced_devices
 
 
+async def test_referenced_areas(hass):
+    """Test referenced areas."""
+    script_obj = script.Script(
+        hass,
+        cv.SCRIPT_SCHEMA(
+            [
+                {
+                    "service": "test.script",
+                    "data": {"area_id": "area-string"},
+                },
+                {
+                    "service": "test.script",
+                    "target": {"area_id": ["area-list-1", "area-list-2"]},
+                },
+                {
+                    "service": "test.script",
+                    "data_template": {"area_id": "{{ 'area-template' }}"},
+                },
+                {"event": "test_event"},
+            ]
+        ),
+        "Test Name",
+        "test_domain",
+    )
+    assert script_obj.referenced_areas == {
+        "area-string",
+        "area-list-1",
+        "area-list-2",
+    }
+    # Test we cache results.
+    assert script_obj.referenced_areas is script_obj.referenced_areas
+
+
 @contextmanager
 def does_not_raise():
     """Indicate no exception is expected."""
@@ -1,7 +1,9 @@
 """Tests for the storage helper."""
 import asyncio
 from datetime import timedelta
+from functools import partial
 import json
+import threading
 
 import pytest
 
@@ -21,6 +23,9 @@ MOCK_KEY = "storage-test"
 MOCK_DATA = {"hello": "world"}
 MOCK_DATA2 = {"goodbye": "cruel world"}
 
+# The write method is patched by the storage mock of the hass fixture
+STORE_WRITE_DATA = storage.Store._write_data
+
 
 @pytest.fixture
 def store(hass):
@@ -279,3 +284,54 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_saving_snapshot_in_executor(hass, store, hass_storage):
+    """Test a data function can return a function building the data."""
+    threads = []
+
+    def build_data(data):
+        """Build the data from a snapshot."""
+        threads.append(threading.current_thread())
+        return dict(data)
+
+    store.async_delay_save(lambda: partial(build_data, MOCK_DATA), 1)
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert threads[0] is not threading.main_thread()
+
+    # Loading while a write is pending builds the data as well
+    store.async_delay_save(lambda: partial(build_data, MOCK_DATA2), 1)
+    assert await store.async_load() == MOCK_DATA2
+
+
+async def test_compact_store(hass, store):
+    """Test compact stores write JSON without whitespace."""
+    compact_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, compact=True)
+    data = {"version": MOCK_VERSION, "key": MOCK_KEY, "data": MOCK_DATA}
+
+    with patch("homeassistant.helpers.storage.json_util.save_json") as mock_save, patch(
+        "homeassistant.helpers.storage.os.path.getsize"
+    ):
+        STORE_WRITE_DATA(compact_store, "/mock/path", data)
+        STORE_WRITE_DATA(store, "/mock/path", data)
+
+    assert mock_save.mock_calls[0][2]["compact"] is True
+    assert mock_save.mock_calls[1][2]["compact"] is False
+
+
+async def test_write_metrics(hass, store, hass_storage):
+    """Test writes are counted per storage key."""
+    with patch.object(store, "_write_data", return_value=42):
+        await store.async_save(MOCK_DATA)
+        await store.async_save(MOCK_DATA2)
+
+    metrics = storage.async_get_metrics(hass)[MOCK_KEY].as_dict()
+    assert metrics == {
+        "writes": 2,
+        "writes_per_hour": 2,
+        "bytes_written": 84,
+        "last_size": 42,
+    }
@@ -1,9 +1,13 @@
 """Test to verify that we can load components."""
+import asyncio
+
 import pytest
 
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
+from homeassistant.helpers import storage
 
 from tests.async_mock import ANY, patch
 from tests.common import MockModule, async_mock_service, mock_integration
@@ -143,6 +147,116 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_preimport(hass):
+    """Test importing an integration and its platforms in the executor."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    await loader.async_preimport(hass, integration)
+    await loader.async_preimport(hass, integration, "light")
+
+    assert hass.data[loader.DATA_COMPONENTS]["hue"] == hue
+    assert hass.data[loader.DATA_COMPONENTS]["hue.light"] == hue_light
+    assert set(hass.data[loader.DATA_IMPORT_TIMES]) == {"hue", "hue.light"}
+    assert not hass.data[loader.DATA_PENDING_IMPORTS]
+
+
+async def test_preimport_missing_requirements(hass):
+    """Test integrations with missing requirements are not imported."""
+    hass.config.skip_pip = False
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch("homeassistant.util.package.is_installed", return_value=False):
+        await loader.async_preimport(hass, integration)
+
+    assert "hue" not in hass.data[loader.DATA_COMPONENTS]
+    assert loader.DATA_IMPORT_TIMES not in hass.data
+
+
+async def test_manifest_index(hass, hass_storage):
+    """Test resolved manifests are indexed and reused."""
+    integration = await loader.async_get_integration(hass, "hue")
+    index = await loader.async_get_manifest_index(hass)
+    assert "homeassistant.components.hue" in index.entries
+
+    hass.data.pop(loader.DATA_INTEGRATIONS)
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        cached = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert cached is not integration
+    assert cached.manifest == integration.manifest
+    assert cached.file_path == integration.file_path
+
+
+async def test_manifest_index_invalidated(hass, hass_storage):
+    """Test the stored index drops manifests that changed on disk."""
+    integration = await loader.async_get_integration(hass, "hue")
+    entries = (await loader.async_get_manifest_index(hass)).entries
+    stored = {
+        **entries["homeassistant.components.hue"],
+        "manifest": {**integration.manifest, "name": "Outdated"},
+    }
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "key": loader.MANIFEST_INDEX_STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "entries": {
+                "homeassistant.components.hue": {**stored, "mtime": 0},
+                "homeassistant.components.zone": {**stored},
+            },
+        },
+    }
+
+    index = loader.ManifestIndex(hass)
+    await index.async_load()
+
+    assert "homeassistant.components.hue" not in index.entries
+    assert "homeassistant.components.zone" in index.entries
+
+
+async def test_manifest_index_corrupt(hass, tmp_path, caplog):
+    """Test a corrupt stored index is ignored and integrations still resolve."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    (tmp_path / ".storage" / loader.MANIFEST_INDEX_STORAGE_KEY).write_text("{corrupt")
+
+    # Read the stored index from disk instead of the mocked storage
+    with patch.object(storage.Store, "_async_load", storage.Store._async_load_data):
+        integrations = await asyncio.gather(
+            loader.async_get_integration(hass, "hue"),
+            loader.async_get_integration(hass, "zone"),
+        )
+
+    assert [integration.domain for integration in integrations] == ["hue", "zone"]
+    assert (await loader.async_get_manifest_index(hass)).entries
+    assert "Unable to load the manifest index" in caplog.text
+
+
+async def test_manifest_index_malformed(hass, hass_storage):
+    """Test malformed stored index data is ignored."""
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "key": loader.MANIFEST_INDEX_STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "entries": {
+                "homeassistant.components.hue": {"mtime": 0},
+                "homeassistant.components.zone": ["not", "an", "entry"],
+            },
+        },
+    }
+
+    index = loader.ManifestIndex(hass)
+    await index.async_load()
+    assert index.entries == {}
+
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"] = ["not", "a", "dict"]
+    index = loader.ManifestIndex(hass)
+    await index.async_load()
+    assert index.entries == {}
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
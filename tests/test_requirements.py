@@ -9,6 +9,7 @@ from homeassistant.requirements import (
     RequirementsNotFound,
     async_get_integration_with_requirements,
     async_process_requirements,
+    async_process_requirements_batch,
 )
 
 from tests.async_mock import call, patch
@@ -244,3 +245,64 @@ async def test_discovery_requirements_zeroconf(hass, partial_manifest):
 
     assert len(mock_process.mock_calls) == 2  # zeroconf also depends on http
     assert mock_process.mock_calls[0][1][2] == zeroconf.requirements
+
+
+async def test_process_requirements_batch(hass):
+    """Test missing requirements of integrations are installed with one pip run."""
+    hass.config.skip_pip = False
+    integrations = [
+        mock_integration(
+            hass, MockModule("comp1", requirements=["hello==1.0.0", "world==1.0.0"])
+        ),
+        mock_integration(
+            hass,
+            MockModule("comp2", requirements=["hello==1.0.0", "installed==1.0.0"]),
+        ),
+    ]
+
+    with patch(
+        "homeassistant.util.package.is_installed",
+        side_effect=lambda req: req == "installed==1.0.0",
+    ), patch(
+        "homeassistant.util.package.install_packages", return_value=True
+    ) as mock_inst, patch(
+        "homeassistant.requirements.pip_kwargs", return_value={"no_cache_dir": True}
+    ):
+        await async_process_requirements_batch(hass, integrations)
+
+    assert mock_inst.call_args == call(
+        ["hello==1.0.0", "world==1.0.0"], no_cache_dir=True
+    )
+
+
+async def test_process_requirements_batch_failure(hass, caplog):
+    """Test a failing batch leaves installing to each integration."""
+    hass.config.skip_pip = False
+    integration = mock_integration(
+        hass, MockModule("comp", requirements=["hello==1.0.0"])
+    )
+
+    with patch("homeassistant.util.package.is_installed", return_value=False), patch(
+        "homeassistant.util.package.install_packages", return_value=False
+    ) as mock_inst:
+        await async_process_requirements_batch(hass, [integration])
+
+    assert len(mock_inst.mock_calls) == 1
+    assert "Unable to install requirements in one batch" in caplog.text
+
+
+async def test_process_requirements_batch_skip_pip(hass):
+    """Test nothing is installed when pip is skipped or nothing is missing."""
+    integration = mock_integration(
+        hass, MockModule("comp", requirements=["hello==1.0.0"])
+    )
+
+    with patch("homeassistant.util.package.install_packages") as mock_inst:
+        hass.config.skip_pip = True
+        await async_process_requirements_batch(hass, [integration])
+
+        hass.config.skip_pip = False
+        with patch("homeassistant.util.package.is_installed", return_value=True):
+            await async_process_requirements_batch(hass, [integration])
+
+    assert not mock_inst.called
@@ -10,7 +10,7 @@ import voluptuous as vol
 from homeassistant import config_entries, setup
 import homeassistant.config as config_util
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
-from homeassistant.core import callback
+from homeassistant.core import CoreState, callback
 from homeassistant.helpers import discovery
 from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
@@ -596,3 +596,54 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_timeline(hass):
+    """Test the startup timeline records phases and the critical path."""
+    hass.state = CoreState.starting
+    mock_integration(hass, MockModule("base"))
+    mock_integration(hass, MockModule("slow_dep"))
+    mock_integration(hass, MockModule("child", dependencies=["base", "slow_dep"]))
+
+    setup.async_record_setup_phase(hass, "base", "setup", 10.0, 11.0)
+    setup.async_record_setup_phase(hass, "slow_dep", "import", 10.0, 10.5)
+    setup.async_record_setup_phase(hass, "slow_dep", "setup", 10.5, 13.0)
+    setup.async_record_setup_phase(hass, "child", "dependencies", 10.0, 13.0)
+    setup.async_record_setup_phase(hass, "child", "setup", 13.0, 14.0)
+
+    timeline = setup.async_get_setup_timeline(hass)
+
+    assert timeline["timeline"]["slow_dep"] == [
+        {"phase": "import", "start": 0.0, "end": 0.5},
+        {"phase": "setup", "start": 0.5, "end": 3.0},
+    ]
+    assert timeline["critical_path"] == [
+        {"name": "child", "end": 4.0, "own_time": 1.0},
+        {"name": "slow_dep", "end": 3.0, "own_time": 3.0},
+    ]
+
+    trace = setup.setup_timeline_to_chrome_trace(timeline)
+    assert {
+        "name": "setup",
+        "cat": "setup",
+        "ph": "X",
+        "ts": 3000000,
+        "dur": 1000000,
+        "pid": 1,
+        "tid": "child",
+    } in trace["traceEvents"]
+    assert len(trace["traceEvents"]) == 5
+
+
+async def test_setup_timeline_records_startup(hass):
+    """Test phases are only recorded while starting."""
+    mock_integration(hass, MockModule("comp"))
+    assert await setup.async_setup_component(hass, "comp", {})
+    assert setup.DATA_SETUP_TIMELINE not in hass.data
+
+    hass.state = CoreState.starting
+    mock_integration(hass, MockModule("comp2", dependencies=["comp"]))
+    assert await setup.async_setup_component(hass, "comp2", {})
+
+    phases = setup.async_get_setup_timeline(hass)["timeline"]["comp2"]
+    assert [phase["phase"] for phase in phases] == ["dependencies", "import", "setup"]
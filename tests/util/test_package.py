@@ -216,6 +216,34 @@ def test_install_find_links(mock_sys, mock_popen, mock_env_copy, mock_venv):
     assert mock_popen.return_value.communicate.call_count == 1
 
 
+def test_install_packages(mock_sys, mock_popen, mock_env_copy, mock_venv):
+    """Test installing multiple packages with a single pip invocation."""
+    env = mock_env_copy()
+    link = "/wheels"
+    assert package.install_packages(
+        [TEST_NEW_REQ, "pyhelloworld4==1.0.0"], False, find_links=link
+    )
+    assert mock_popen.call_count == 1
+    assert mock_popen.call_args == call(
+        [
+            mock_sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--quiet",
+            TEST_NEW_REQ,
+            "pyhelloworld4==1.0.0",
+            "--find-links",
+            link,
+            "--prefer-binary",
+        ],
+        stdin=PIPE,
+        stdout=PIPE,
+        stderr=PIPE,
+        env=env,
+    )
+
+
 async def test_async_get_user_site(mock_env_copy):
     """Test async get user site directory."""
     deps_dir = "/deps_dir"